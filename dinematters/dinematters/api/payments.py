@@ -8,8 +8,10 @@ import json
 import math
 from datetime import datetime
 from frappe import _
+from frappe.utils import add_months
 from dinematters.dinematters.utils.api_helpers import validate_restaurant_for_api
 from dinematters.dinematters.utils.customer_helpers import require_verified_phone, get_or_create_customer, validate_customer_session, is_phone_verified, normalize_phone
+from dinematters.dinematters.doctype.monthly_billing_ledger.monthly_billing_ledger import compute_total_gmv
 from dinematters.dinematters.utils.razorpay_utils import get_razorpay_config, get_razorpay_client, get_or_create_razorpay_customer
 
 def get_or_create_mandate_plan(client):
@@ -519,8 +521,8 @@ def get_restaurant_payment_stats(restaurant_id):
 			FROM `tabOrder`
 			WHERE restaurant = %s 
 			AND payment_status = 'completed'
-			AND DATE_FORMAT(creation, '%%Y-%%m') = %s
-		""", (restaurant_id, current_month), as_dict=True)
+			AND creation >= %s AND creation < %s
+		""", (restaurant_id, f"{current_month}-01", add_months(f"{current_month}-01", 1)), as_dict=True)
 		
 		stats = orders[0] if (orders and orders[0]) else {
 			"total_orders": 0,
@@ -861,13 +863,8 @@ def schedule_monthly_billing():
 		for r in restaurants:
 			if frappe.db.exists("Monthly Billing Ledger", {"restaurant": r.name, "billing_month": current_month}):
 				continue
-			# Sum completed orders for month
-			total = frappe.db.sql("""
-				SELECT COALESCE(SUM(total),0) FROM `tabOrder` 
-				WHERE restaurant=%s AND payment_status='completed' AND DATE_FORMAT(creation, '%%Y-%%m')=%s
-			""", (r.name, current_month))[0][0] or 0
-			# Convert to paise
-			total_paise = int(float(total) * 100)
+			# Sum completed orders for month (in paise)
+			total_paise = compute_total_gmv(r.name, current_month)
 			# Fetch commission settings from Restaurant
 			res_doc = frappe.get_doc("Restaurant", r.name)
 			platform_fee_percent = float(res_doc.platform_fee_percent if res_doc.platform_fee_percent is not None else 1.5)
@@ -7,6 +7,11 @@ from frappe.model.document import Document
 import re
 
 
+# Precompiled slug patterns: strip special chars, collapse spaces/hyphens
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_DASH_RE = re.compile(r'[-\s]+')
+
+
 class MenuCategory(Document):
 	def validate(self):
 		# Auto-generate category_id if missing
@@ -41,8 +46,8 @@ class MenuCategory(Document):
 		id_str = name.lower()
 		
 		# Replace spaces and special characters with hyphens
-		id_str = re.sub(r'[^\w\s-]', '', id_str)  # Remove special chars
-		id_str = re.sub(r'[-\s]+', '-', id_str)  # Replace spaces and multiple hyphens with single hyphen
+		id_str = _SLUG_STRIP_RE.sub('', id_str)  # Remove special chars
+		id_str = _SLUG_DASH_RE.sub('-', id_str)  # Replace spaces and multiple hyphens with single hyphen
 		id_str = id_str.strip('-')  # Remove leading/trailing hyphens
 		
 		return id_str
@@ -38,8 +38,8 @@ frappe.ui.form.on('Menu Image Extractor', {
 			});
 		}
 		
-		// Add approve button when status is Pending Approval
-		if (frm.doc.extraction_status == 'Pending Approval') {
+		// Add approve button when status is Pending Approval (and no approval job is running)
+		if (frm.doc.extraction_status == 'Pending Approval' && frm.doc.approval_status != 'Processing') {
 			frm.add_custom_button(__('Approve and Create Menu Items'), function() {
 				approve_extracted_data(frm);
 			}).addClass('btn-primary');
@@ -475,7 +475,15 @@ function approve_extracted_data(frm) {
 				callback: function(r) {
 					console.log('📥 Approval API Response:', r);
 					
-					if (r.message && r.message.success) {
+					if (r.message && r.message.queued) {
+						// Menu items are created in a background job
+						frappe.show_alert({
+							message: __(r.message.message),
+							indicator: 'blue'
+						}, 5);
+						frm.reload_doc();
+						poll_approval_status(frm);
+					} else if (r.message && r.message.success) {
 						console.log('✅ Approval successful!');
 						console.log('📊 Stats:', r.message.stats);
 						
@@ -529,6 +537,52 @@ function approve_extracted_data(frm) {
 	);
 }
 
+function poll_approval_status(frm) {
+	let pollCount = 0;
+	const maxPolls = 720; // Poll for up to 60 minutes (720 * 5 seconds), the approval job timeout
+	const pollInterval = setInterval(() => {
+		pollCount++;
+		if (pollCount > maxPolls) {
+			clearInterval(pollInterval);
+			frm.reload_doc();
+			frappe.show_alert({
+				message: __('Approval is taking longer than expected. Please check back later.'),
+				indicator: 'orange'
+			}, 10);
+			return;
+		}
+		frappe.call({
+			method: 'dinematters.dinematters.doctype.menu_image_extractor.menu_image_extractor.get_extraction_status',
+			args: {
+				docname: frm.doc.name
+			},
+			callback: function(r) {
+				if (!r.message || r.message.approval_status === 'Processing') {
+					return;
+				}
+				
+				clearInterval(pollInterval);
+				frm.reload_doc();
+				
+				if (r.message.status === 'Completed') {
+					frappe.msgprint({
+						title: __('Approval Completed'),
+						message: __('Categories created: {0}<br>Items created: {1}',
+							[r.message.categories_created, r.message.items_created]),
+						indicator: 'green'
+					});
+				} else {
+					frappe.msgprint({
+						title: __('Approval Failed'),
+						message: r.message.approval_error || __('An error occurred during approval. Please check the extraction log for details.'),
+						indicator: 'red'
+					});
+				}
+			}
+		});
+	}, 5000); // Poll every 5 seconds
+}
+
 function update_status_indicator(frm) {
 	let status = frm.doc.extraction_status;
 	let color = 'blue';
@@ -543,6 +597,15 @@ function update_status_indicator(frm) {
 		color = 'yellow';
 	}
 	
+	// Approval runs in the background while the extraction stays "Pending Approval"
+	if (status == 'Pending Approval' && frm.doc.approval_status == 'Processing') {
+		status = __('Approving');
+		color = 'orange';
+	} else if (status == 'Pending Approval' && frm.doc.approval_status == 'Failed') {
+		status = __('Approval Failed');
+		color = 'red';
+	}
+	
 	frm.dashboard.add_indicator(__('Status: {0}', [status]), color);
 }
 
@@ -4,16 +4,56 @@
 import frappe
 from frappe.model.document import Document
 from frappe import _
+from frappe.utils import flt, now_datetime, time_diff_in_seconds
+from frappe.utils.background_jobs import is_job_enqueued
 from frappe.utils.file_manager import get_file_path
 import json
 import time
+from contextlib import ExitStack
 from datetime import datetime
 import os
+import random
 import re
 import requests
 import hashlib
+import html
 from dinematters.dinematters.services.ai.menu_extraction import MenuExtractor, extract_and_generate
 from dinematters.dinematters.services.ai.recommendations import RecommendationEngine
+from dinematters.dinematters.utils.slug_helpers import get_taken_values, get_unique_slug
+
+
+# Precompiled slug patterns: strip special chars, collapse spaces/hyphens
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_DASH_RE = re.compile(r'[-\s]+')
+
+# Everything except digits and the decimal point (used to scrub prices)
+_NON_PRICE_CHARS_RE = re.compile(r'[^\d.]')
+
+# First whole number in an extracted value such as "15-20" or "250 kcal"
+_FIRST_INT_RE = re.compile(r'\d+')
+
+# Remote menu image downloads: streamed in chunks, transient failures retried with backoff
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_MAX_ATTEMPTS = 3
+DOWNLOAD_BACKOFF_BASE = 1.0  # seconds
+DOWNLOAD_RETRY_STATUSES = (502, 503, 504)
+
+# Media URLs ending in one of these (ignoring any query string) are stored as video
+_VIDEO_EXTS = ('.mp4', '.mov', '.avi', '.webm')
+
+# Approval runs as a background job; one still marked "Processing" after this long
+# (job timeout plus grace) is treated as dead and may be approved again
+APPROVAL_JOB_TIMEOUT = 3600  # seconds
+APPROVAL_STALE_AFTER = APPROVAL_JOB_TIMEOUT + 300
+
+# Column order used when bulk inserting rows into the Extracted Dish child table
+EXTRACTED_DISH_FIELDS = [
+	'name', 'creation', 'modified', 'modified_by', 'owner', 'docstatus',
+	'parent', 'parenttype', 'parentfield', 'idx',
+	'dish_id', 'dish_name', 'price', 'original_price', 'category', 'description',
+	'calories', 'is_vegetarian', 'estimated_time', 'serving_size', 'has_no_media',
+	'main_category', 'media_json', 'customizations_json'
+]
 
 
 class MenuImageExtractor(Document):
@@ -51,6 +91,18 @@ class MenuImageExtractor(Document):
 		# Optional: Clear the table links too if we want to be thorough, 
 		# but keeping the rows (now with empty media_asset) provides a record of what was uploaded.
 
+
+def _match_key(value):
+	"""Key for in-memory lookups that mirrors the DB's case-insensitive, trailing-space
+	ignoring collation, so a dict lookup finds the same row a WHERE clause would"""
+	return str(value).strip().casefold()
+
+
+def _debug_logging_enabled():
+	"""Informational happy-path logs are only written to Error Log when explicitly enabled"""
+	return bool(frappe.conf.get("menu_extractor_debug") or frappe.conf.developer_mode)
+
+
 def generate_product_id_from_name(product_name, restaurant=None):
 	"""Generate a slug-like product_id from product_name, unique within restaurant"""
 	if not product_name:
@@ -60,26 +112,19 @@ def generate_product_id_from_name(product_name, restaurant=None):
 	product_id = product_name.lower()
 	
 	# Replace spaces and special characters with hyphens
-	product_id = re.sub(r'[^\w\s-]', '', product_id)  # Remove special chars
-	product_id = re.sub(r'[-\s]+', '-', product_id)  # Replace spaces and multiple hyphens with single hyphen
+	product_id = _SLUG_STRIP_RE.sub('', product_id)  # Remove special chars
+	product_id = _SLUG_DASH_RE.sub('-', product_id)  # Replace spaces and multiple hyphens with single hyphen
 	product_id = product_id.strip('-')  # Remove leading/trailing hyphens
 	
 	# Limit length to 140 characters (Frappe name field limit)
 	if len(product_id) > 140:
 		product_id = product_id[:140].rstrip('-')
 	
-	# Ensure uniqueness within the restaurant by checking if it exists
+	# Ensure uniqueness within the restaurant - fetch every candidate in one query
+	# instead of probing each suffix
 	if restaurant:
-		base_id = product_id
-		counter = 1
-		while frappe.db.get_value("Menu Product", {"product_id": product_id, "restaurant": restaurant}, "name"):
-			product_id = f"{base_id}-{counter}"
-			counter += 1
-			# Prevent infinite loop
-			if counter > 1000:
-				import time
-				product_id = f"{base_id}-{int(time.time())}"
-				break
+		taken = get_taken_values("Menu Product", "product_id", product_id, filters={"restaurant": restaurant})
+		product_id = get_unique_slug(product_id, taken)
 	
 	return product_id
 
@@ -93,26 +138,19 @@ def generate_category_id_from_name(category_name, restaurant=None):
 	category_id = category_name.lower()
 	
 	# Replace spaces and special characters with hyphens
-	category_id = re.sub(r'[^\w\s-]', '', category_id)  # Remove special chars
-	category_id = re.sub(r'[-\s]+', '-', category_id)  # Replace spaces and multiple hyphens with single hyphen
+	category_id = _SLUG_STRIP_RE.sub('', category_id)  # Remove special chars
+	category_id = _SLUG_DASH_RE.sub('-', category_id)  # Replace spaces and multiple hyphens with single hyphen
 	category_id = category_id.strip('-')  # Remove leading/trailing hyphens
 	
 	# Limit length to 140 characters (Frappe name field limit)
 	if len(category_id) > 140:
 		category_id = category_id[:140].rstrip('-')
 	
-	# Ensure uniqueness within the restaurant by checking if it exists
+	# Ensure uniqueness within the restaurant - fetch every candidate in one query
+	# instead of probing each suffix
 	if restaurant:
-		base_id = category_id
-		counter = 1
-		while frappe.db.get_value("Menu Category", {"category_id": category_id, "restaurant": restaurant}, "name"):
-			category_id = f"{base_id}-{counter}"
-			counter += 1
-			# Prevent infinite loop
-			if counter > 1000:
-				import time
-				category_id = f"{base_id}-{int(time.time())}"
-				break
+		taken = get_taken_values("Menu Category", "category_id", category_id, filters={"restaurant": restaurant})
+		category_id = get_unique_slug(category_id, taken)
 	
 	return category_id
 
@@ -150,21 +188,27 @@ def extract_menu_data(docname):
 			image_batches.append([img.menu_image for img in batch])
 
 		# Reset extraction metrics and set processing state
-		doc.extracted_dishes = []
-		doc.extraction_log = _("Extraction started. Processing images in batches...")
-		doc.categories_created = 0
-		doc.items_created = 0
-		doc.items_updated = 0
-		doc.items_skipped = 0
-		doc.extraction_date = None
-		doc.processing_time = None
-		doc.approval_status = 'Pending'
-		doc.extraction_status = 'Processing'
-		doc.total_batches = len(image_batches)
-		doc.completed_batches = 0
-		
-		# Save and commit before enqueuing to ensure frontend sees the state
-		doc.save(ignore_permissions=True)
+		# (direct writes - a full save() would re-validate and re-sync every child row)
+		frappe.db.delete("Extracted Dish", {
+			"parent": docname,
+			"parenttype": "Menu Image Extractor",
+			"parentfield": "extracted_dishes"
+		})
+		frappe.db.set_value("Menu Image Extractor", docname, {
+			"extraction_log": _("Extraction started. Processing images in batches..."),
+			"categories_created": 0,
+			"items_created": 0,
+			"items_updated": 0,
+			"items_skipped": 0,
+			"extraction_date": None,
+			"processing_time": None,
+			"approval_status": 'Pending',
+			"extraction_status": 'Processing',
+			"total_batches": len(image_batches),
+			"completed_batches": 0
+		})
+		
+		# Commit before enqueuing to ensure frontend sees the state
 		frappe.db.commit()
 		
 		# Enqueue each batch as a separate job - no timeout, process in parallel
@@ -200,6 +244,22 @@ def extract_menu_data(docname):
 		frappe.throw(_("Error starting extraction: {0}").format(str(e)))
 
 
+def _int_or_none(value):
+	"""Int column value for an extracted field: None when missing, the first number
+	of a range or unit string ("15-20" -> 15)"""
+	if value is None or isinstance(value, bool):
+		return None
+	if isinstance(value, (int, float)):
+		return int(value)
+	match = _FIRST_INT_RE.search(str(value))
+	return int(match.group()) if match else None
+
+
+def _flt_or_none(value):
+	"""Currency column value for an optional extracted field: None when missing"""
+	return None if value in (None, '') else flt(value)
+
+
 def scrub_price(price_val):
 	"""Sanitize price value to float by removing currency symbols and whitespace"""
 	if not price_val:
@@ -208,7 +268,7 @@ def scrub_price(price_val):
 		return float(price_val)
 	try:
 		# Remove everything except digits and decimal point
-		cleaned = re.sub(r'[^\d.]', '', str(price_val))
+		cleaned = _NON_PRICE_CHARS_RE.sub('', str(price_val))
 		return float(cleaned) if cleaned else 0.0
 	except:
 		return 0.0
@@ -232,6 +292,8 @@ def get_extraction_status(docname):
 			"extraction_log",
 			"items_created",
 			"categories_created",
+			"approval_status",
+			"approval_error",
 		],
 		as_dict=True
 	)
@@ -245,6 +307,8 @@ def get_extraction_status(docname):
 		"extraction_log": result.extraction_log,
 		"items_created": result.items_created or 0,
 		"categories_created": result.categories_created or 0,
+		"approval_status": result.approval_status,
+		"approval_error": result.approval_error,
 	}
 
 
@@ -254,99 +318,133 @@ def _extract_batch_internal(docname, batch_images, batch_number, total_batches):
 	Process a single batch of images
 	This runs as a background job - no timeouts, processes in parallel with other batches
 	"""
-	try:
-		# Log that batch processing started
-		frappe.log_error(
-			title="Menu Extraction - Batch Start",
-			message=(
-				f"Batch {batch_number}/{total_batches} started processing\n"
-				f"Document: {docname}\n"
-				f"Images in batch: {len(batch_images)}"
-			)
-		)
+	with ExitStack() as cleanup:
+		try:
+			# Log that batch processing started (debug only)
+			if _debug_logging_enabled():
+				frappe.log_error(
+					title="Menu Extraction - Batch Start",
+					message=(
+						f"Batch {batch_number}/{total_batches} started processing\n"
+						f"Document: {docname}\n"
+						f"Images in batch: {len(batch_images)}"
+					)
+				)
 		
-		doc = frappe.get_doc("Menu Image Extractor", docname)
+			doc = frappe.get_doc("Menu Image Extractor", docname)
 		
-		# Check if document still exists and is in Processing status
-		if doc.extraction_status != "Processing":
-			frappe.log_error(
-				title="Menu Extraction - Batch Skip",
-				message=f"Batch {batch_number} skipped: Document status is {doc.extraction_status}, not Processing"
-			)
-			return
+			# Check if document still exists and is in Processing status
+			if doc.extraction_status != "Processing":
+				frappe.log_error(
+					title="Menu Extraction - Batch Skip",
+					message=f"Batch {batch_number} skipped: Document status is {doc.extraction_status}, not Processing"
+				)
+				return
 		
-		start_time = time.time()
+			start_time = time.time()
 		
-		# Internal extraction logic
-		image_paths = []
-		temp_files = []  # Track files to delete later
+			# Internal extraction logic
+			image_paths = []
 
-		for image_url in batch_images:
-			try:
-				local_path, is_temp = _get_local_image_path(image_url)
-				if local_path and os.path.exists(local_path):
-					image_paths.append(local_path)
-					if is_temp:
-						temp_files.append(local_path)
-				else:
-					frappe.log_error(title="Menu Extraction - Path Error", message=f"Batch {batch_number}: Could not resolve image path for {image_url}")
-			except Exception as e:
-				frappe.log_error(title="Menu Extraction - Resolution Error", message=f"Batch {batch_number}: Error resolving image {image_url}\n{str(e)}")
+			for image_url in batch_images:
+				try:
+					local_path, is_temp = _get_local_image_path(image_url)
+					if local_path and os.path.exists(local_path):
+						image_paths.append(local_path)
+						if is_temp:
+							# Downloaded copies are deleted when the batch finishes, whatever the outcome
+							cleanup.callback(_remove_temp_file, local_path)
+					else:
+						frappe.log_error(title="Menu Extraction - Path Error", message=f"Batch {batch_number}: Could not resolve image path for {image_url}")
+				except Exception as e:
+					frappe.log_error(title="Menu Extraction - Resolution Error", message=f"Batch {batch_number}: Error resolving image {image_url}\n{str(e)}")
 
-		if not image_paths:
-			frappe.log_error(title="Menu Extraction - Batch Empty", message=f"Batch {batch_number}: No valid image files found")
-			_update_batch_completion(docname, batch_number, total_batches, None, None)
-			return
+			if not image_paths:
+				frappe.log_error(title="Menu Extraction - Batch Empty", message=f"Batch {batch_number}: No valid image files found")
+				_update_batch_completion(docname, batch_number, total_batches, None, None)
+				return
 
-		# Call local AI service
-		restaurant_name_for_api = doc.restaurant_name
-		if not restaurant_name_for_api and doc.restaurant:
-			restaurant_name_for_api = frappe.db.get_value("Restaurant", doc.restaurant, "restaurant_name")
+			# Call local AI service
+			restaurant_name_for_api = doc.restaurant_name
+			if not restaurant_name_for_api and doc.restaurant:
+				restaurant_name_for_api = frappe.db.get_value("Restaurant", doc.restaurant, "restaurant_name")
 
-		result = extract_and_generate(
-			image_paths=image_paths,
-			restaurant_name=restaurant_name_for_api,
-			generate_descriptions=bool(doc.generate_descriptions)
-		)
-		
-		# Log successful result
-		frappe.log_error(
-			title="Menu Extraction - Internal Success",
-			message=(
-				f"Batch {batch_number}: Extraction Success\n"
-				f"Success: {result.get('success')}\n"
-				f"Categories: {len(result.get('data', {}).get('categories', []))}\n"
-				f"Dishes: {len(result.get('data', {}).get('dishes', []))}"
+			result = extract_and_generate(
+				image_paths=image_paths,
+				restaurant_name=restaurant_name_for_api,
+				generate_descriptions=bool(doc.generate_descriptions)
 			)
-		)
 		
-		processing_time = time.time() - start_time
+			# Log successful result (debug only)
+			if _debug_logging_enabled():
+				frappe.log_error(
+					title="Menu Extraction - Internal Success",
+					message=(
+						f"Batch {batch_number}: Extraction Success\n"
+						f"Success: {result.get('success')}\n"
+						f"Categories: {len(result.get('data', {}).get('categories', []))}\n"
+						f"Dishes: {len(result.get('data', {}).get('dishes', []))}"
+					)
+				)
 		
-		# Process batch result
-		if result.get('success'):
-			data = result.get('data', {})
-			# Store batch results temporarily
-			_store_batch_results(docname, batch_number, data, processing_time)
-		else:
-			frappe.log_error(
-				title="Menu Extraction - Batch Service Error",
-				message=f"Batch {batch_number} extraction returned success=False: {result.get('error', 'Unknown error')}"
-			)
-			_update_batch_completion(docname, batch_number, total_batches, None, None)
+			processing_time = time.time() - start_time
+		
+			# Process batch result
+			if result.get('success'):
+				data = result.get('data', {})
+				# Store batch results temporarily
+				_store_batch_results(docname, batch_number, data, processing_time)
+			else:
+				frappe.log_error(
+					title="Menu Extraction - Batch Service Error",
+					message=f"Batch {batch_number} extraction returned success=False: {result.get('error', 'Unknown error')}"
+				)
+				_update_batch_completion(docname, batch_number, total_batches, None, None)
 	
-	except Exception as e:
-		frappe.log_error(title="Menu Extraction - Batch Error", message=f"Batch {batch_number} failed: {str(e)}\n{frappe.get_traceback()}")
-		_update_batch_completion(docname, batch_number, total_batches, None, None)
+		except Exception as e:
+			frappe.log_error(title="Menu Extraction - Batch Error", message=f"Batch {batch_number} failed: {str(e)}\n{frappe.get_traceback()}")
+			_update_batch_completion(docname, batch_number, total_batches, None, None)
+
+
+def _remove_temp_file(temp_file):
+	"""Delete a temporary downloaded image, logging (not raising) on failure"""
+	try:
+		if os.path.exists(temp_file):
+			os.remove(temp_file)
+	except Exception as cleanup_err:
+		frappe.log_error(title="Menu Extraction - Cleanup Error", message=f"Failed to cleanup temp file {temp_file}: {str(cleanup_err)}")
+
+
+def _download_image(image_url, temp_path):
+	"""
+	Stream a remote image to temp_path.
+	Transient failures (connection errors, timeouts, 502/503/504) are retried with
+	exponential backoff plus jitter so concurrent batches don't retry in lockstep.
+	"""
+	# Write to a .part file first so an interrupted download is never reused as a cached copy
+	part_path = f"{temp_path}.part"
 	
-	finally:
-		# CLEANUP: Delete temporary downloaded files
-		if 'temp_files' in locals() and temp_files:
-			for temp_file in temp_files:
-				try:
-					if os.path.exists(temp_file):
-						os.remove(temp_file)
-				except Exception as cleanup_err:
-					frappe.log_error(title="Menu Extraction - Cleanup Error", message=f"Failed to cleanup temp file {temp_file}: {str(cleanup_err)}")
+	for attempt in range(DOWNLOAD_MAX_ATTEMPTS):
+		try:
+			# Stream to disk in chunks so only one buffer is resident, not the whole image
+			with requests.get(image_url, timeout=30, stream=True) as response:
+				response.raise_for_status()
+				
+				with open(part_path, 'wb') as f:
+					for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+						f.write(chunk)
+			
+			os.replace(part_path, temp_path)
+			return
+		
+		except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError, requests.HTTPError) as e:
+			retryable = not isinstance(e, requests.HTTPError) or (
+				e.response is not None and e.response.status_code in DOWNLOAD_RETRY_STATUSES
+			)
+			if not retryable or attempt == DOWNLOAD_MAX_ATTEMPTS - 1:
+				raise
+			
+			time.sleep(DOWNLOAD_BACKOFF_BASE * (2 ** attempt) + random.uniform(0, DOWNLOAD_BACKOFF_BASE))
 
 
 def _get_local_image_path(image_url):
@@ -381,11 +479,7 @@ def _get_local_image_path(image_url):
 			if os.path.exists(temp_path):
 				return temp_path, True
 				
-			response = requests.get(image_url, timeout=30)
-			response.raise_for_status()
-			
-			with open(temp_path, 'wb') as f:
-				f.write(response.content)
+			_download_image(image_url, temp_path)
 			
 			return temp_path, True
 			
@@ -524,30 +618,32 @@ def _aggregate_and_process_batches(docname):
 			'restaurantBrand': {}  # Can be merged if needed
 		}
 		
-		# Store aggregated data
-		store_extracted_data(aggregated_data, doc)
-		
-		# Update metrics for display (frontend counts)
-		doc.categories_created = len(all_categories)
-		doc.items_created = len(all_dishes)
+		# Serialize the raw response once (compact) so store_extracted_data doesn't dump it again
+		doc.raw_response = json.dumps({'data': aggregated_data}, separators=(',', ':'))
 		
-		# Update status
-		doc.extraction_status = "Pending Approval"
-		doc.approval_status = "Pending"
-		doc.extraction_log = f"Extraction completed successfully!\n\n" + \
-			f"Categories extracted: {len(all_categories)}\n" + \
-			f"Dishes extracted: {len(all_dishes)}\n\n" + \
-			"Please review the extracted data below and click 'Approve and Create Menu Items' to add them to the database."
-		doc.extraction_date = datetime.now()
+		# Store aggregated data (child rows are bulk inserted)
+		store_extracted_data(aggregated_data, doc)
 		
 		# Calculate total processing time
 		total_time = sum(b.get('processing_time', 0) for b in batch_results.values())
-		doc.processing_time = f"{total_time:.2f} seconds"
-		
-		# Store raw response
-		doc.raw_response = json.dumps({'data': aggregated_data}, indent=2)
 		
-		doc.save(ignore_permissions=True)
+		# Persist parent fields directly - doc.save() would delete the bulk inserted child rows
+		frappe.db.set_value("Menu Image Extractor", docname, {
+			# Update metrics for display (frontend counts)
+			"categories_created": len(all_categories),
+			"items_created": len(all_dishes),
+			# Update status
+			"extraction_status": "Pending Approval",
+			"approval_status": "Pending",
+			"extraction_log": f"Extraction completed successfully!\n\n" + \
+				f"Categories extracted: {len(all_categories)}\n" + \
+				f"Dishes extracted: {len(all_dishes)}\n\n" + \
+				"Please review the extracted data below and click 'Approve and Create Menu Items' to add them to the database.",
+			"extraction_date": datetime.now(),
+			"processing_time": f"{total_time:.2f} seconds",
+			# Store raw response
+			"raw_response": doc.raw_response
+		})
 		frappe.db.commit()
 		
 	except Exception as e:
@@ -555,11 +651,12 @@ def _aggregate_and_process_batches(docname):
 			title="Menu Extraction - Aggregate Error",
 			message=f"Error aggregating batches: {str(e)}\n{frappe.get_traceback()}"
 		)
-		# Fallback to reload and set failed
+		# Fallback: mark as failed
 		try:
-			doc = frappe.get_doc("Menu Image Extractor", docname)
-			doc.db_set('extraction_status', 'Failed', update_modified=False)
-			doc.db_set('extraction_log', f"Error aggregating batch results: {str(e)}", update_modified=False)
+			frappe.db.set_value("Menu Image Extractor", docname, {
+				"extraction_status": 'Failed',
+				"extraction_log": f"Error aggregating batch results: {str(e)}"
+			}, update_modified=False)
 			frappe.db.commit()
 		except:
 			pass
@@ -568,6 +665,9 @@ def _aggregate_and_process_batches(docname):
 def store_extracted_data(data, extractor_doc):
 	"""
 	Store extracted data in both HTML report format and editable child tables
+	
+	Child rows are written directly to the database, so callers must persist the
+	parent with db_set/set_value rather than save() (which would drop the rows).
 	"""
 	# Extract data sections
 	categories_data = data.get('categories', [])
@@ -588,8 +688,17 @@ def store_extracted_data(data, extractor_doc):
 	
 	# Clear existing child table data
 	extractor_doc.extracted_dishes = []
+	frappe.db.delete("Extracted Dish", {
+		"parent": extractor_doc.name,
+		"parenttype": "Menu Image Extractor",
+		"parentfield": "extracted_dishes"
+	})
 	
-	# Populate editable child tables for dishes
+	# Build rows for the editable child table and insert them in one statement
+	# (appending + saving issues one INSERT and validation pass per row)
+	now = frappe.utils.now()
+	user = frappe.session.user
+	rows = []
 	for dish_data in dishes_data:
 		if not isinstance(dish_data, dict):
 			continue
@@ -599,40 +708,92 @@ def store_extracted_data(data, extractor_doc):
 		if not dish_name:
 			continue
 		
-		# Generate dish_id from dish_name
+		# Generate dish_id from dish_name; a name made only of symbols has no slug
+		# and dish_id is mandatory
 		dish_id = generate_product_id_from_name(dish_name)
+		if not dish_id:
+			continue
 		
 		# Store media and customizations as JSON strings
 		media_json = json.dumps(dish_data.get('media', [])) if dish_data.get('media') else None
 		customizations_json = json.dumps(dish_data.get('customizationQuestions', [])) if dish_data.get('customizationQuestions') else None
 		
-		extractor_doc.append('extracted_dishes', {
-			'dish_id': dish_id,
-			'dish_name': dish_name,
-			'price': dish_data.get('price', 0),
-			'original_price': dish_data.get('originalPrice'),
-			'category': dish_data.get('category', ''),
-			'description': dish_data.get('description', ''),
-			'calories': dish_data.get('calories'),
-			'is_vegetarian': 1 if dish_data.get('isVegetarian') else 0,
-			'estimated_time': dish_data.get('estimatedTime'),
-			'serving_size': dish_data.get('servingSize'),
-			'has_no_media': 1 if dish_data.get('hasNoMedia') else 0,
-			'main_category': dish_data.get('mainCategory', ''),
-			'media_json': media_json,
-			'customizations_json': customizations_json
-		})
+		rows.append((
+			frappe.generate_hash(length=10),
+			now,
+			now,
+			user,
+			user,
+			0,
+			extractor_doc.name,
+			'Menu Image Extractor',
+			'extracted_dishes',
+			len(rows) + 1,
+			dish_id,
+			dish_name,
+			flt(dish_data.get('price', 0)),
+			_flt_or_none(dish_data.get('originalPrice')),
+			dish_data.get('category', ''),
+			dish_data.get('description', ''),
+			_int_or_none(dish_data.get('calories')),
+			1 if dish_data.get('isVegetarian') else 0,
+			_int_or_none(dish_data.get('estimatedTime')),
+			dish_data.get('servingSize'),
+			1 if dish_data.get('hasNoMedia') else 0,
+			dish_data.get('mainCategory', ''),
+			media_json,
+			customizations_json
+		))
+	
+	if rows:
+		frappe.db.bulk_insert("Extracted Dish", EXTRACTED_DISH_FIELDS, rows)
 	
 	# Also store raw data in raw_response for backup
 	if not extractor_doc.raw_response:
-		extractor_doc.raw_response = json.dumps({'data': data}, indent=2)
+		extractor_doc.raw_response = json.dumps({'data': data}, separators=(',', ':'))
+
+
+# Row templates for generate_extraction_report_html, formatted once per row
+CATEGORY_ROW_TEMPLATE = """
+				<tr>
+					<td class="text-center">{idx}</td>
+					<td>{category_id}</td>
+					<td><strong>{category_name}</strong></td>
+					<td>{display_name}</td>
+					<td>{description}</td>
+					<td class="text-center"><span class="badge {badge_class}">{is_special}</span></td>
+					<td>{image}</td>
+				</tr>
+		"""
+
+DISH_ROW_TEMPLATE = """
+				<tr>
+					<td class="text-center">{idx}</td>
+					<td><strong>{dish_name}</strong></td>
+					<td>{category}</td>
+					<td class="text-right">{price}</td>
+					<td class="text-right">{original_price}</td>
+					<td class="text-center">{calories}</td>
+					<td class="text-center"><span class="badge {badge_class}">{is_vegetarian}</span></td>
+					<td class="text-center">{estimated_time}</td>
+					<td class="text-center">{serving_size}</td>
+					<td>{description}</td>
+					<td class="text-center">{media_count}</td>
+					<td class="text-center">{customizations_count}</td>
+				</tr>
+		"""
+
+
+def _escape_cell(value):
+	"""HTML-escape a report cell value"""
+	return html.escape(str(value)) if value is not None else ''
 
 
 def generate_extraction_report_html(categories_data, dishes_data):
 	"""
 	Generate an Excel-like HTML report of extracted data
 	"""
-	html = """
+	parts = ["""
 	<style>
 		.extraction-report {
 			font-family: 'Segoe UI', Arial, sans-serif;
@@ -735,20 +896,20 @@ def generate_extraction_report_html(categories_data, dishes_data):
 		}
 	</style>
 	<div class="extraction-report">
-	"""
+	"""]
 	
 	# Summary section
-	html += f"""
+	parts.append(f"""
 		<div class="summary-box">
 			<strong>Extraction Summary:</strong><br>
 			• Categories Found: <strong>{len(categories_data)}</strong><br>
 			• Dishes Found: <strong>{len(dishes_data)}</strong>
 		</div>
-	"""
+	""")
 	
 	# Categories table
 	if categories_data:
-		html += """
+		parts.append("""
 		<div class="report-section">
 			<div class="report-title">📁 Extracted Categories</div>
 			<div class="table-container">
@@ -765,42 +926,38 @@ def generate_extraction_report_html(categories_data, dishes_data):
 					</tr>
 				</thead>
 				<tbody>
-		"""
+		""")
 		
 		for idx, cat_data in enumerate(categories_data, 1):
 			if not isinstance(cat_data, dict):
 				continue
 			
-			category_id = cat_data.get('id', '')
 			category_name = cat_data.get('name', '')
-			display_name = cat_data.get('displayName', category_name)
 			cat_description = cat_data.get('description') or ''
-			description = cat_description[:100] + ('...' if len(cat_description) > 100 else '')
-			is_special = 'Yes' if cat_data.get('isSpecial') else 'No'
 			image = cat_data.get('image', '')
 			
-			html += f"""
-					<tr>
-						<td class="text-center">{idx}</td>
-						<td>{category_id}</td>
-						<td><strong>{category_name}</strong></td>
-						<td>{display_name}</td>
-						<td>{description}</td>
-						<td class="text-center"><span class="badge {'badge-yes' if cat_data.get('isSpecial') else 'badge-no'}">{is_special}</span></td>
-						<td>{image[:50] + ('...' if len(image) > 50 else '') if image else '-'}</td>
-					</tr>
-			"""
-		
-		html += """
+			# Extracted text is untrusted - escape each field once (after truncation)
+			parts.append(CATEGORY_ROW_TEMPLATE.format(
+				idx=idx,
+				category_id=_escape_cell(cat_data.get('id', '')),
+				category_name=_escape_cell(category_name),
+				display_name=_escape_cell(cat_data.get('displayName', category_name)),
+				description=_escape_cell(cat_description[:100] + ('...' if len(cat_description) > 100 else '')),
+				badge_class='badge-yes' if cat_data.get('isSpecial') else 'badge-no',
+				is_special='Yes' if cat_data.get('isSpecial') else 'No',
+				image=_escape_cell(image[:50] + ('...' if len(image) > 50 else '')) if image else '-'
+			))
+		
+		parts.append("""
 				</tbody>
 			</table>
 			</div>
 		</div>
-		"""
+		""")
 	
 	# Dishes table
 	if dishes_data:
-		html += """
+		parts.append("""
 		<div class="report-section">
 			<div class="report-title">🍽️ Extracted Dishes</div>
 			<div class="table-container">
@@ -822,59 +979,52 @@ def generate_extraction_report_html(categories_data, dishes_data):
 					</tr>
 				</thead>
 				<tbody>
-		"""
+		""")
 		
 		for idx, dish_data in enumerate(dishes_data, 1):
 			if not isinstance(dish_data, dict):
 				continue
 			
-			dish_name = dish_data.get('name', '')
-			category = dish_data.get('category', '')
 			price = dish_data.get('price', 0)
 			original_price = dish_data.get('originalPrice', '')
 			calories = dish_data.get('calories', '')
-			is_vegetarian = 'Yes' if dish_data.get('isVegetarian') else 'No'
 			estimated_time = dish_data.get('estimatedTime', '')
 			serving_size = dish_data.get('servingSize', '')
 			dish_description = dish_data.get('description') or ''
-			description = dish_description[:80] + ('...' if len(dish_description) > 80 else '')
 			
 			# Safely get media and customizations, handling None values
 			media = dish_data.get('media')
-			media_count = len(media) if media is not None else 0
-			
 			customizations = dish_data.get('customizationQuestions')
-			customizations_count = len(customizations) if customizations is not None else 0
 			
-			html += f"""
-					<tr>
-						<td class="text-center">{idx}</td>
-						<td><strong>{dish_name}</strong></td>
-						<td>{category}</td>
-						<td class="text-right">{price if price else '-'}</td>
-						<td class="text-right">{original_price if original_price else '-'}</td>
-						<td class="text-center">{calories if calories else '-'}</td>
-						<td class="text-center"><span class="badge {'badge-yes' if dish_data.get('isVegetarian') else 'badge-no'}">{is_vegetarian}</span></td>
-						<td class="text-center">{estimated_time if estimated_time else '-'}</td>
-						<td class="text-center">{serving_size if serving_size else '-'}</td>
-						<td>{description}</td>
-						<td class="text-center">{media_count}</td>
-						<td class="text-center">{customizations_count}</td>
-					</tr>
-			"""
-		
-		html += """
+			# Extracted text is untrusted - escape each field once (after truncation)
+			parts.append(DISH_ROW_TEMPLATE.format(
+				idx=idx,
+				dish_name=_escape_cell(dish_data.get('name', '')),
+				category=_escape_cell(dish_data.get('category', '')),
+				price=_escape_cell(price) if price else '-',
+				original_price=_escape_cell(original_price) if original_price else '-',
+				calories=_escape_cell(calories) if calories else '-',
+				badge_class='badge-yes' if dish_data.get('isVegetarian') else 'badge-no',
+				is_vegetarian='Yes' if dish_data.get('isVegetarian') else 'No',
+				estimated_time=_escape_cell(estimated_time) if estimated_time else '-',
+				serving_size=_escape_cell(serving_size) if serving_size else '-',
+				description=_escape_cell(dish_description[:80] + ('...' if len(dish_description) > 80 else '')),
+				media_count=len(media) if media is not None else 0,
+				customizations_count=len(customizations) if customizations is not None else 0
+			))
+		
+		parts.append("""
 				</tbody>
 			</table>
 			</div>
 		</div>
-		"""
+		""")
 	
-	html += """
+	parts.append("""
 	</div>
-	"""
+	""")
 	
-	return html
+	return ''.join(parts)
 
 
 def process_extracted_data(data, extractor_doc):
@@ -954,24 +1104,44 @@ def process_extracted_data(data, extractor_doc):
 		
 		if unique_categories:
 			categories_data = list(unique_categories.values())
-			frappe.log_error(
-				f"Categories extracted from dishes: {len(categories_data)} categories found",
-				"Menu Category Auto-Extraction"
-			)
+			if _debug_logging_enabled():
+				frappe.log_error(
+					f"Categories extracted from dishes: {len(categories_data)} categories found",
+					"Menu Category Auto-Extraction"
+				)
 	
 	# Ensure categories_data is always a list (safety check)
 	if not isinstance(categories_data, list):
 		categories_data = []
 	
+	# Prefetch this restaurant's categories and products once instead of probing per row
+	existing_categories = frappe.get_all(
+		"Menu Category",
+		filters={"restaurant": restaurant},
+		fields=["name", "category_id", "category_name"]
+	)
+	categories_by_id = {_match_key(c.category_id): c for c in existing_categories if c.category_id}
+	categories_by_name = {_match_key(c.category_name): c for c in existing_categories if c.category_name}
+	
+	existing_products = frappe.get_all(
+		"Menu Product",
+		filters={"restaurant": restaurant},
+		fields=["name", "product_id", "product_name"]
+	)
+	products_by_id = {_match_key(p.product_id): p.name for p in existing_products if p.product_id}
+	products_by_name = {_match_key(p.product_name): p.name for p in existing_products if p.product_name}
+	
 	# Create or update categories
-	category_map = {}  # Map category names to category IDs
+	category_map = {}  # Map extracted category ids and names to saved category IDs
 	
 	for cat_data in categories_data:
+		# Per-category savepoint so one bad row is undone without losing the rest of the import
+		frappe.db.savepoint("menu_import_category")
 		try:
 			# Ensure cat_data is a dict
 			if not isinstance(cat_data, dict):
 				continue
-			category_id = cat_data.get('id')
+			category_id = source_category_id = cat_data.get('id')
 			category_name = cat_data.get('name') or cat_data.get('displayName') or category_id
 			
 			if not category_id or not category_name:
@@ -984,40 +1154,23 @@ def process_extracted_data(data, extractor_doc):
 			# Normalize name for mapping
 			norm_cat_name = str(category_name).strip().lower()
 			
-			# Check if category already exists for THIS restaurant (by category_id AND restaurant)
-			existing_category_name = frappe.db.get_value(
-				"Menu Category", 
-				{"category_id": category_id, "restaurant": restaurant}, 
-				"name"
-			)
-			
-			if not existing_category_name:
-				# Also check by category_name AND restaurant in case category_id changed
-				existing_category_name = frappe.db.get_value(
-					"Menu Category", 
-					{"category_name": category_name, "restaurant": restaurant}, 
-					"name"
-				)
+			# Check if category already exists for THIS restaurant (by category_id, then by category_name
+			# in case category_id changed)
+			existing_category = categories_by_id.get(_match_key(category_id)) or categories_by_name.get(_match_key(category_name))
 			
-			if existing_category_name:
-				# Update existing category
-				cat_doc = frappe.get_doc("Menu Category", existing_category_name)
-				cat_doc.display_name = cat_data.get('displayName', category_name)
-				cat_doc.description = cat_data.get('description', '')
-				cat_doc.is_special = 1 if cat_data.get('isSpecial') else 0
-				
-				cat_doc.save(ignore_permissions=True)
+			if existing_category:
+				# Update existing category - plain field update, no child tables to reload
+				# (display_name always mirrors category_name, see MenuCategory.validate)
+				frappe.db.set_value("Menu Category", existing_category.name, {
+					"display_name": existing_category.category_name,
+					"description": cat_data.get('description', ''),
+					"is_special": 1 if cat_data.get('isSpecial') else 0
+				})
 				stats['categories_created'] += 1
-				category_map[category_name] = cat_doc.category_id
+				category_id = existing_category.category_id
 			else:
 				# Create new category
-				# IMPORTANT: Since category_id is no longer globally unique, 
-				# we just use the one provided (which generate_category_id_from_name ensures is unique for us)
-				# But if the API provided a conflicting one, let's double check
-				if frappe.db.get_value("Menu Category", {"category_id": category_id, "restaurant": restaurant}, "name"):
-					# This should be handled by the update logic above, but safety first
-					category_id = generate_category_id_from_name(category_name, restaurant=restaurant)
-
+				# category_id is only unique per restaurant and validate() resolves any clash
 				cat_doc = frappe.new_doc("Menu Category")
 				cat_doc.category_id = category_id
 				cat_doc.restaurant = restaurant
@@ -1028,13 +1181,20 @@ def process_extracted_data(data, extractor_doc):
 				
 				cat_doc.save(ignore_permissions=True)
 				stats['categories_created'] += 1
-				category_map[category_name] = category_id
+				category_id = cat_doc.category_id
+				
+				new_category = frappe._dict(name=cat_doc.name, category_id=cat_doc.category_id, category_name=cat_doc.category_name)
+				categories_by_id[_match_key(new_category.category_id)] = new_category
+				categories_by_name[_match_key(new_category.category_name)] = new_category
 			
-			# Populate map with both original and normalized name for maximum fallback compatibility
+			# Populate map with the extracted id plus original and normalized name, so every dish
+			# resolves its category with a single dict lookup (validate() may have renamed the id)
+			category_map[source_category_id] = category_id
 			category_map[category_name] = category_id
 			category_map[norm_cat_name] = category_id
 			
 		except Exception as e:
+			frappe.db.rollback(save_point="menu_import_category")
 			raw_err = str(e)
 			error_msg = f"Error creating category {category_id or 'unknown'}: {raw_err[:100]}"
 			frappe.log_error(title="Menu Category Creation Error", message=f"{error_msg}\n\n{frappe.get_traceback()}")
@@ -1055,18 +1215,7 @@ def process_extracted_data(data, extractor_doc):
 		product_id = dish_data.get('id') or generate_product_id_from_name(product_name, restaurant=restaurant)
 		
 		# Check if product exists for THIS restaurant
-		existing_product_name = frappe.db.get_value(
-			"Menu Product", 
-			{"product_id": product_id, "restaurant": restaurant}, 
-			"name"
-		)
-		
-		if not existing_product_name:
-			existing_product_name = frappe.db.get_value(
-				"Menu Product", 
-				{"product_name": product_name, "restaurant": restaurant}, 
-				"name"
-			)
+		existing_product_name = products_by_id.get(_match_key(product_id)) or products_by_name.get(_match_key(product_name))
 		
 		if existing_product_name:
 			# Update existing product
@@ -1105,14 +1254,15 @@ def process_extracted_data(data, extractor_doc):
 			cat_to_link = category_map.get(category_name) or category_map.get(norm_dish_cat)
 			
 			if not cat_to_link:
-				# Deep lookup in DB for this restaurant if not in current map
-				cat_to_link = frappe.db.get_value("Menu Category", {"category_id": category_name, "restaurant": restaurant}, "category_id")
-				if not cat_to_link:
-					cat_to_link = frappe.db.get_value("Menu Category", {"category_name": category_name, "restaurant": restaurant}, "category_id")
+				# Deep lookup among this restaurant's categories if not in current map
+				existing_category = categories_by_id.get(_match_key(category_name)) or categories_by_name.get(_match_key(category_name))
+				if existing_category:
+					cat_to_link = existing_category.category_id
 		
 		if cat_to_link:
-			product_doc.category = frappe.db.get_value("Menu Category", {"category_id": cat_to_link, "restaurant": restaurant}, "name")
-			product_doc.category_name = category_name or frappe.db.get_value("Menu Category", product_doc.category, "category_name")
+			linked_category = categories_by_id.get(_match_key(cat_to_link))
+			product_doc.category = linked_category.name if linked_category else None
+			product_doc.category_name = category_name or (linked_category.category_name if linked_category else None)
 		elif category_name:
 			product_doc.category_name = category_name
 			frappe.log_error(title="Menu Extraction - Link Warning", message=f"Dish '{product_name}' refers to unknown category '{category_name}'. Link failed.")
@@ -1146,13 +1296,15 @@ def process_extracted_data(data, extractor_doc):
 				
 				if not media_url: continue
 				
-				media_type = 'video' if any(ext in media_url.lower() for ext in ['.mp4', '.mov', '.avi', '.webm']) else 'image'
+				media_type = 'video' if media_url.lower().split('?', 1)[0].endswith(_VIDEO_EXTS) else 'image'
 				media_row = product_doc.append('product_media', {})
 				media_row.media_url = media_url
 				media_row.media_type = media_type
 				media_row.display_order = idx + 1
 				media_added += 1
 		
+		# Per-dish savepoint: a failure rolls back this product and its customizations only
+		frappe.db.savepoint("menu_import_dish")
 		try:
 			# Clear customizations from the object before saving to avoid validation errors
 			# (We will handle them manually after the product is saved)
@@ -1190,7 +1342,7 @@ def process_extracted_data(data, extractor_doc):
 					for opt_idx, option_data in enumerate(valid_options):
 						raw_opt_price = option_data.get('price', 0)
 						if isinstance(raw_opt_price, str):
-							raw_opt_price = re.sub(r'[^\d.]', '', raw_opt_price)
+							raw_opt_price = _NON_PRICE_CHARS_RE.sub('', raw_opt_price)
 							price = float(raw_opt_price) if raw_opt_price else 0
 						else:
 							price = raw_opt_price
@@ -1205,8 +1357,12 @@ def process_extracted_data(data, extractor_doc):
 						})
 					
 					cq.insert(ignore_permissions=True)
+			
+			products_by_id[_match_key(product_doc.product_id)] = product_doc.name
+			products_by_name[_match_key(product_doc.product_name)] = product_doc.name
 
 		except Exception as e:
+			frappe.db.rollback(save_point="menu_import_dish")
 			raw_err = str(e)
 			display_name = product_name[:30] + "..." if len(product_name) > 30 else product_name
 			error_msg = f"Error saving {display_name}: {raw_err[:100]}"
@@ -1217,15 +1373,34 @@ def process_extracted_data(data, extractor_doc):
 			else:
 				stats['items_updated'] -= 1
 	
+	# Single commit for the whole import
 	frappe.db.commit()
 	
 	return stats
 
 
+def _approval_job_id(docname):
+	return f"menu_approval_{docname}"
+
+
+def _approval_in_progress(doc):
+	"""True while an approval job for doc is queued or running.
+
+	A "Processing" approval whose job is gone (worker killed, timed out) or that
+	started longer ago than APPROVAL_STALE_AFTER is stale and can be retried."""
+	if doc.approval_status != "Processing":
+		return False
+	if doc.approval_started_at and time_diff_in_seconds(now_datetime(), doc.approval_started_at) > APPROVAL_STALE_AFTER:
+		return False
+	return is_job_enqueued(_approval_job_id(doc.name))
+
+
 @frappe.whitelist()
 def approve_extracted_data(docname):
 	"""
-	Approve extracted data and create Menu Categories and Menu Products
+	Approve extracted data and queue creation of Menu Categories and Menu Products.
+	Large menus take minutes to import, so the work runs in a background job;
+	the UI polls get_extraction_status until approval_status leaves "Processing".
 	"""
 	try:
 		doc = frappe.get_doc("Menu Image Extractor", docname)
@@ -1241,10 +1416,79 @@ def approve_extracted_data(docname):
 				}
 			}
 
-		frappe.log_error(title="Menu Approval - Start", message=f"Approving extracted data for {docname}")
+		if _debug_logging_enabled():
+			frappe.log_error(title="Menu Approval - Start", message=f"Approving extracted data for {docname}")
 		if doc.extraction_status != "Pending Approval":
 			frappe.throw(_("Only documents with 'Pending Approval' status can be approved."))
 		
+		if not doc.extracted_dishes and not doc.raw_response:
+			frappe.throw(_("No extracted data found. Please extract menu data first."))
+		
+		job_id = _approval_job_id(docname)
+		
+		# A second click while the job runs just reports the running job
+		if _approval_in_progress(doc):
+			return {
+				'success': True,
+				'queued': True,
+				'job_id': job_id,
+				'status': 'queued',
+				'message': _("Approval is already in progress.")
+			}
+		
+		# Approval progress lives in approval_status; extraction_status stays
+		# "Pending Approval" until the job succeeds
+		frappe.db.set_value("Menu Image Extractor", docname, {
+			"approval_status": "Processing",
+			"approval_started_at": now_datetime(),
+			"approval_error": None,
+			"extraction_log": _("Approval started. Creating menu items in the background...")
+		})
+		frappe.db.commit()
+		
+		job = frappe.enqueue(
+			"dinematters.dinematters.doctype.menu_image_extractor.menu_image_extractor._process_approval_job",
+			docname=docname,
+			queue="long",
+			timeout=APPROVAL_JOB_TIMEOUT,
+			job_id=job_id,
+			deduplicate=True,
+			is_async=True,
+			now=False
+		)
+		if not job:
+			# RQ still holds a job under this id (e.g. a stale "started" entry from a
+			# killed worker); leave the document retryable instead of stuck
+			frappe.db.set_value("Menu Image Extractor", docname, {
+				"approval_status": "Failed",
+				"approval_error": _("A previous approval job is still registered. Please try again in a few minutes.")
+			})
+			frappe.db.commit()
+			frappe.throw(_("A previous approval job is still registered. Please try again in a few minutes."))
+		
+		return {
+			'success': True,
+			'queued': True,
+			'job_id': job_id,
+			'status': 'queued',
+			'message': _("Approval started. Menu items are being created in the background.")
+		}
+		
+	except Exception as e:
+		frappe.log_error(title="Menu Approval Error", message=frappe.get_traceback())
+		frappe.throw(_("Approval failed: {0}").format(str(e)))
+
+
+def _process_approval_job(docname):
+	"""
+	Background job queued by approve_extracted_data.
+	Builds the approval payload and creates categories/products. On failure
+	approval_status becomes "Failed" with the reason in approval_error; the
+	extraction stays "Pending Approval" so the user can fix the data and retry.
+	"""
+	try:
+		doc = frappe.get_doc("Menu Image Extractor", docname)
+		
 		# Get data from editable child tables (user may have edited the data)
 		# Convert child table data back to the format expected by process_extracted_data
 		data = {
@@ -1283,29 +1527,36 @@ def approve_extracted_data(docname):
 			except json.JSONDecodeError:
 				frappe.throw(_("Invalid data format. Please re-extract the menu data."))
 		else:
-			# Get categories from raw_response (categories come from API response)
+			# Parse raw_response once - it backs both the categories and the media fallback below
+			raw_data = None
 			if doc.raw_response:
 				try:
 					raw_data = json.loads(doc.raw_response)
-					if isinstance(raw_data, dict):
-						if 'data' in raw_data:
-							raw_data_obj = raw_data['data']
-						elif 'success' in raw_data and isinstance(raw_data.get('data'), dict):
-							raw_data_obj = raw_data['data']
-						else:
-							raw_data_obj = raw_data.get('data', raw_data)
-						
-						# Get categories from raw data
-						categories_data = raw_data_obj.get('categories', [])
-						if not isinstance(categories_data, list):
-							if isinstance(categories_data, dict):
-								categories_data = list(categories_data.values())
-							else:
-								categories_data = []
-						
-						for cat_data in categories_data:
-							if isinstance(cat_data, dict):
-								data['categories'].append(cat_data)
+				except ValueError as e:
+					error_msg = f"Error parsing raw_response for {docname}: {str(e)[:140]}"
+					frappe.log_error(title="Menu Category Parsing Error", message=error_msg)
+			
+			# Get categories from raw_response (categories come from API response)
+			if isinstance(raw_data, dict):
+				try:
+					if 'data' in raw_data:
+						raw_data_obj = raw_data['data']
+					elif 'success' in raw_data and isinstance(raw_data.get('data'), dict):
+						raw_data_obj = raw_data['data']
+					else:
+						raw_data_obj = raw_data.get('data', raw_data)
+					
+					# Get categories from raw data - a dict payload is iterated through its
+					# values view rather than copied into a list first
+					categories_data = raw_data_obj.get('categories', [])
+					if isinstance(categories_data, dict):
+						categories_data = categories_data.values()
+					elif not isinstance(categories_data, list):
+						categories_data = ()
+					
+					for cat_data in categories_data:
+						if isinstance(cat_data, dict):
+							data['categories'].append(cat_data)
 					
 					# Log if no categories found
 					if not data.get('categories'):
@@ -1320,19 +1571,17 @@ def approve_extracted_data(docname):
 			
 			# Get raw dishes data for media fallback
 			raw_dishes_map = {}
-			if doc.raw_response:
+			if isinstance(raw_data, dict):
 				try:
-					raw_data = json.loads(doc.raw_response)
-					if isinstance(raw_data, dict):
-						raw_data_obj = raw_data.get('data', raw_data)
-						if isinstance(raw_data_obj, dict) and 'dishes' in raw_data_obj:
-							raw_dishes = raw_data_obj['dishes']
-							if isinstance(raw_dishes, list):
-								for raw_dish in raw_dishes:
-									if isinstance(raw_dish, dict) and raw_dish.get('id'):
-										raw_dishes_map[raw_dish['id']] = raw_dish
-							elif isinstance(raw_dishes, dict):
-								raw_dishes_map = raw_dishes
+					raw_data_obj = raw_data.get('data', raw_data)
+					if isinstance(raw_data_obj, dict) and 'dishes' in raw_data_obj:
+						raw_dishes = raw_data_obj['dishes']
+						if isinstance(raw_dishes, list):
+							for raw_dish in raw_dishes:
+								if isinstance(raw_dish, dict) and raw_dish.get('id'):
+									raw_dishes_map[raw_dish['id']] = raw_dish
+						elif isinstance(raw_dishes, dict):
+							raw_dishes_map = raw_dishes
 				except Exception as e:
 					frappe.log_error(title="Menu Approval - Media Fallback Error", message=f"Error parsing raw_response for media fallback: {str(e)}")
 			
@@ -1357,7 +1606,7 @@ def approve_extracted_data(docname):
 				if dish_row.media_json:
 					try:
 						dish_data['media'] = json.loads(dish_row.media_json)
-					except:
+					except (ValueError, TypeError):
 						dish_data['media'] = []
 				else:
 					# Fallback: Try to get media from raw_response
@@ -1369,7 +1618,7 @@ def approve_extracted_data(docname):
 				if dish_row.customizations_json:
 					try:
 						dish_data['customizationQuestions'] = json.loads(dish_row.customizations_json)
-					except:
+					except (ValueError, TypeError):
 						dish_data['customizationQuestions'] = []
 				else:
 					# Fallback: Try to get customizations from raw_response
@@ -1398,10 +1647,11 @@ def approve_extracted_data(docname):
 			
 			if unique_categories:
 				data['categories'] = list(unique_categories.values())
-				frappe.log_error(
-					title="Menu Category Auto-Extraction from Dishes",
-					message=f"Categories auto-extracted from dishes for {docname}: {len(data['categories'])} categories found"
-				)
+				if _debug_logging_enabled():
+					frappe.log_error(
+						title="Menu Category Auto-Extraction from Dishes",
+						message=f"Categories auto-extracted from dishes for {docname}: {len(data['categories'])} categories found"
+					)
 		
 		if not data or (not data.get('categories') and not data.get('dishes')):
 			frappe.throw(_("No data found to approve. Please extract menu data first."))
@@ -1410,37 +1660,40 @@ def approve_extracted_data(docname):
 		stats = process_extracted_data(data, doc)
 		
 		# Update document status
-		doc.extraction_status = "Completed"
-		doc.approval_status = "Approved"
-		doc.extraction_log = f"Data approved and created successfully!\n\n" + \
+		extraction_log = f"Data approved and created successfully!\n\n" + \
 			f"Categories created: {stats['categories_created']}\n" + \
 			f"Items created: {stats['items_created']}\n" + \
 			f"Items updated: {stats['items_updated']}\n" + \
 			f"Items skipped: {stats['items_skipped']}"
-		doc.items_created = stats['items_created']
-		doc.categories_created = stats['categories_created']
-		doc.save(ignore_permissions=True)
 		
 		# AUTOMATIC CLEANUP: Delete source menu images now that data is successfully approved
 		# This saves significant storage space for the merchant
 		try:
 			doc.cleanup_source_images()
-			doc.extraction_log += "\n\nStorage optimized: Source images cleaned up successfully."
-			doc.save(ignore_permissions=True)
-		except:
+			extraction_log += "\n\nStorage optimized: Source images cleaned up successfully."
+		except Exception:
 			pass # Don't fail the whole approval if cleanup fails
-			
-		frappe.db.commit()
 		
-		return {
-			'success': True,
-			'message': f"Successfully approved and created {stats['items_created']} items and {stats['categories_created']} categories",
-			'stats': stats
-		}
+		# Only parent fields change here, so write them directly instead of saving
+		# the doc (and re-syncing every extracted dish row) twice
+		frappe.db.set_value("Menu Image Extractor", docname, {
+			"extraction_status": "Completed",
+			"approval_status": "Approved",
+			"approval_error": None,
+			"extraction_log": extraction_log,
+			"items_created": stats['items_created'],
+			"categories_created": stats['categories_created']
+		})
+		frappe.db.commit()
 		
 	except Exception as e:
+		frappe.db.rollback()
 		frappe.log_error(title="Menu Approval Error", message=frappe.get_traceback())
-		frappe.throw(_("Approval failed: {0}").format(str(e)))
+		frappe.db.set_value("Menu Image Extractor", docname, {
+			"approval_status": "Failed",
+			"approval_error": _("Approval failed: {0}").format(str(e))
+		})
+		frappe.db.commit()
 
 
 @frappe.whitelist()
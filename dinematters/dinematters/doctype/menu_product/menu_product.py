@@ -5,6 +5,16 @@ import frappe
 from frappe.model.document import Document
 from frappe import _
 import re
+from dinematters.dinematters.utils.slug_helpers import get_taken_values, get_unique_slug
+
+
+# Precompiled slug patterns: strip special chars, collapse spaces/hyphens
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_DASH_RE = re.compile(r'[-\s]+')
+
+# Valid file extensions per media type (see validate_product_media)
+IMAGE_EXTENSIONS = frozenset(('jpg', 'jpeg', 'png', 'gif', 'webp', 'svg', 'bmp'))
+VIDEO_EXTENSIONS = frozenset(('mp4', 'webm', 'ogg', 'mov', 'avi', 'mkv', 'flv', 'wmv'))
 
 
 class MenuProduct(Document):
@@ -25,19 +35,11 @@ class MenuProduct(Document):
 	def resolve_duplicate_slugs(self):
 		# check product_id
 		if self.product_id:
-			original_pid = self.product_id
-			counter = 1
-			while frappe.db.exists("Menu Product", {"product_id": self.product_id, "restaurant": self.restaurant, "name": ["!=", self.name]}):
-				self.product_id = f"{original_pid}-{counter}"
-				counter += 1
+			self.product_id = self.get_unique_value("product_id", self.product_id)
 
 		# check seo_slug
 		if self.seo_slug:
-			original_slug = self.seo_slug
-			counter = 1
-			while frappe.db.exists("Menu Product", {"seo_slug": self.seo_slug, "restaurant": self.restaurant, "name": ["!=", self.name]}):
-				self.seo_slug = f"{original_slug}-{counter}"
-				counter += 1
+			self.seo_slug = self.get_unique_value("seo_slug", self.seo_slug)
 		
 		self.validate_product_media()
 		
@@ -49,6 +51,15 @@ class MenuProduct(Document):
 					self.has_no_media = 0
 					break
 	
+	def get_unique_value(self, fieldname, value):
+		"""Return value, or value-N with the lowest free N, unique within the restaurant.
+		Fetches all candidates in one query instead of probing each suffix."""
+		taken = get_taken_values(
+			"Menu Product", fieldname, value,
+			filters={"restaurant": self.restaurant, "name": ["!=", self.name]}
+		)
+		return get_unique_slug(value, taken)
+	
 	def after_save(self):
 		"""Clear top picks cache for the restaurant"""
 		if self.get('restaurant'):
@@ -85,8 +96,8 @@ class MenuProduct(Document):
 		slug = name.lower()
 		
 		# Replace spaces and special characters with hyphens
-		slug = re.sub(r'[^\w\s-]', '', slug)  # Remove special chars
-		slug = re.sub(r'[-\s]+', '-', slug)  # Replace spaces and multiple hyphens with single hyphen
+		slug = _SLUG_STRIP_RE.sub('', slug)  # Remove special chars
+		slug = _SLUG_DASH_RE.sub('-', slug)  # Replace spaces and multiple hyphens with single hyphen
 		slug = slug.strip('-')  # Remove leading/trailing hyphens
 		
 		# Limit length to 140 characters (Frappe name field limit)
@@ -104,32 +115,36 @@ class MenuProduct(Document):
 		if not self.product_media:
 			return
 		
+		# Check the cheap count limits first so an oversized list fails before per-row validation
 		media_count = len(self.product_media)
-		video_count = 0
 		
-		# Define valid file extensions
-		image_extensions = ['jpg', 'jpeg', 'png', 'gif', 'webp', 'svg', 'bmp']
-		video_extensions = ['mp4', 'webm', 'ogg', 'mov', 'avi', 'mkv', 'flv', 'wmv']
+		# Validate maximum 3 media items
+		if media_count > 3:
+			frappe.throw(
+				_('Maximum 3 media items allowed per product. Currently {0} items found.').format(media_count),
+				title=_('Maximum Media Items Exceeded')
+			)
+		
+		# Validate maximum 1 video
+		video_count = sum(1 for media_item in self.product_media if media_item.media_type == 'video')
+		if video_count > 1:
+			frappe.throw(
+				_('Maximum 1 video allowed per product. Currently {0} videos found.').format(video_count),
+				title=_('Maximum Videos Exceeded')
+			)
 		
 		# Validate each media item
 		for idx, media_item in enumerate(self.product_media, start=1):
-			# Count videos
-			if media_item.media_type == 'video':
-				video_count += 1
-			
 			# Validate file type matches media_type
 			if media_item.media_url and media_item.media_type:
-				# Get file extension
+				# Get file extension (text after the last '.', if any)
 				file_url = media_item.media_url
-				file_extension = ''
-				
-				# Extract extension from file path
-				if '.' in file_url:
-					file_extension = file_url.split('.')[-1].lower()
+				_stem, sep, ext = file_url.rpartition('.')
+				file_extension = ext.lower() if sep else ''
 				
 				# Validate image files
 				if media_item.media_type == 'image':
-					if file_extension and file_extension not in image_extensions:
+					if file_extension and file_extension not in IMAGE_EXTENSIONS:
 						frappe.throw(
 							_('Row {0}: Image media type requires an image file (jpg, png, gif, etc.). File "{1}" is not a valid image file.').format(
 								idx, file_url
@@ -139,24 +154,10 @@ class MenuProduct(Document):
 				
 				# Validate video files
 				elif media_item.media_type == 'video':
-					if file_extension and file_extension not in video_extensions:
+					if file_extension and file_extension not in VIDEO_EXTENSIONS:
 						frappe.throw(
 							_('Row {0}: Video media type requires a video file (mp4, webm, mov, etc.). File "{1}" is not a valid video file.').format(
 								idx, file_url
 							),
 							title=_('Invalid File Type')
 						)
-		
-		# Validate maximum 3 media items
-		if media_count > 3:
-			frappe.throw(
-				_('Maximum 3 media items allowed per product. Currently {0} items found.').format(media_count),
-				title=_('Maximum Media Items Exceeded')
-			)
-		
-		# Validate maximum 1 video
-		if video_count > 1:
-			frappe.throw(
-				_('Maximum 1 video allowed per product. Currently {0} videos found.').format(video_count),
-				title=_('Maximum Videos Exceeded')
-			)
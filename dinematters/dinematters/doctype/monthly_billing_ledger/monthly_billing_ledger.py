@@ -1,18 +1,14 @@
 import frappe
 from frappe.model.document import Document
-import math
+from frappe.utils import add_months, flt
 
 
 class MonthlyBillingLedger(Document):
-    def validate(self):
-        # Ensure uniqueness per restaurant + month
-        existing = frappe.db.exists("Monthly Billing Ledger", {
-            "restaurant": self.restaurant,
-            "billing_month": self.billing_month,
-            "name": ("!=", self.name)
-        })
-        if existing:
-            frappe.throw(f"Monthly Billing Ledger already exists for {self.restaurant} in {self.billing_month}")
+    # Uniqueness of (restaurant, billing_month) is enforced by a DB unique index,
+    # see on_doctype_update
+    def show_unique_validation_message(self, e):
+        # Called by Frappe when the insert trips the unique index
+        frappe.throw(f"Monthly Billing Ledger already exists for {self.restaurant} in {self.billing_month}", frappe.UniqueValidationError)
 
     def before_save(self):
         # Calculate fee and final amount if totals are present
@@ -32,7 +28,8 @@ class MonthlyBillingLedger(Document):
                     plan_type = res_info.plan_type or "GOLD"
 
             # 1. Calculate Base Commission based on Plan Type
-            min_amt_paise = int(monthly_min * 100)
+            # Percentages are applied in integer basis points so paise stay exact
+            min_amt_paise = round(monthly_min * 100)
             
             if plan_type == "GOLD":
                 # GOLD is fixed SaaS fee (Floor only)
@@ -40,13 +37,13 @@ class MonthlyBillingLedger(Document):
                 self.notes = f"GOLD Plan Fixed SaaS Fee: ₹{monthly_min:.2f}"
             else:
                 # DIAMOND (or others) is transactional (max of floor vs commission)
-                calculated_fee = int(math.floor(total_gmv * (platform_fee_percent / 100.0)))
+                calculated_fee = total_gmv * round(platform_fee_percent * 100) // 10000
                 base_commission = max(min_amt_paise, calculated_fee)
                 self.notes = f"DIAMOND Plan Commission: ₹{calculated_fee/100:.2f} (Floor: ₹{monthly_min:.2f})"
             
             # 2. GST Compliance (18% SaaS tax)
             tax_rate = float(self.tax_percent or 18.0)
-            gst_amount = int(math.floor(base_commission * (tax_rate / 100.0)))
+            gst_amount = base_commission * round(tax_rate * 100) // 10000
             
             # 3. Final Amount
             final_total = base_commission + gst_amount
@@ -59,3 +56,29 @@ class MonthlyBillingLedger(Document):
         except Exception as e:
             frappe.log_error(f"Failed to calculate billing: {str(e)}", "monthly_billing_ledger.before_save")
 
+
+def compute_total_gmv(restaurant, billing_month):
+    """Return the restaurant's completed-order GMV for billing_month ("YYYY-MM") in paise."""
+    return compute_total_gmv_by_restaurant([restaurant], billing_month).get(restaurant, 0)
+
+
+def compute_total_gmv_by_restaurant(restaurants, billing_month):
+    """Return {restaurant: completed-order GMV in paise} for billing_month ("YYYY-MM").
+
+    Summed and grouped in the database in one query; the creation range (instead of
+    DATE_FORMAT) lets it use the (restaurant, payment_status, creation) index on Order.
+    Restaurants with no completed orders are absent from the result."""
+    if not restaurants:
+        return {}
+    month_start = f"{billing_month}-01"
+    next_month_start = add_months(month_start, 1)
+    rows = frappe.db.sql("""
+        SELECT restaurant, COALESCE(SUM(total), 0) FROM `tabOrder`
+        WHERE restaurant IN %s AND payment_status='completed' AND creation >= %s AND creation < %s
+        GROUP BY restaurant
+    """, (tuple(restaurants), month_start, next_month_start))
+    return {restaurant: round(flt(total) * 100) for restaurant, total in rows}
+
+
+def on_doctype_update():
+    frappe.db.add_unique("Monthly Billing Ledger", ["restaurant", "billing_month"], constraint_name="unique_restaurant_billing_month")
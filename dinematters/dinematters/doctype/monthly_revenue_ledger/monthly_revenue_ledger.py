@@ -3,28 +3,36 @@
 
 import frappe
 from frappe.model.document import Document
+from frappe.utils import flt
 
 class MonthlyRevenueLedger(Document):
-	def validate(self):
-		"""Validate the monthly revenue ledger entry."""
-		# Ensure unique combination of restaurant and month
-		existing = frappe.db.exists("Monthly Revenue Ledger", {
-			"restaurant": self.restaurant,
-			"month": self.month,
-			"name": ("!=", self.name)
-		})
-		
-		if existing:
-			frappe.throw(f"Monthly Revenue Ledger already exists for {self.restaurant} in {self.month}")
+	# Uniqueness of (restaurant, month) is enforced by a DB unique index,
+	# see on_doctype_update
+	def show_unique_validation_message(self, e):
+		"""Report a duplicate ledger rejected by the unique index."""
+		frappe.throw(f"Monthly Revenue Ledger already exists for {self.restaurant} in {self.month}", frappe.UniqueValidationError)
 	
 	def before_save(self):
 		"""Calculate minimum due before saving."""
 		if self.total_platform_fee and self.restaurant:
-			restaurant_doc = frappe.get_doc("Restaurant", self.restaurant)
-			monthly_minimum_paise = int(restaurant_doc.monthly_minimum * 100)  # Convert to paise
-			
-			if self.total_platform_fee < monthly_minimum_paise:
-				self.minimum_due = monthly_minimum_paise - self.total_platform_fee
-			else:
-				self.minimum_due = 0
-				self.status = "paid"  # No minimum due, mark as paid
\ No newline at end of file
+			monthly_minimum = frappe.db.get_value("Restaurant", self.restaurant, "monthly_minimum")
+			self.minimum_due = compute_minimum_due(monthly_minimum, self.total_platform_fee)
+			if not self.minimum_due:
+				self.status = "paid"  # No minimum due, mark as paid
+
+
+# Restaurant.monthly_minimum default, used when the field is unset
+DEFAULT_MONTHLY_MINIMUM = 999.0
+
+
+def compute_minimum_due(monthly_minimum, total_platform_fee):
+	"""Return the paise still owed to reach the monthly minimum (rupees) after platform fees (paise)."""
+	if monthly_minimum is None:
+		monthly_minimum = DEFAULT_MONTHLY_MINIMUM
+	# Convert to paise once, rounding so float rupees like 0.29 don't truncate to 28
+	monthly_minimum_paise = round(flt(monthly_minimum) * 100)
+	return max(0, monthly_minimum_paise - int(total_platform_fee or 0))
+
+
+def on_doctype_update():
+	frappe.db.add_unique("Monthly Revenue Ledger", ["restaurant", "month"], constraint_name="unique_restaurant_month")
@@ -132,6 +132,6 @@ class Order(Document):
                         frappe.log_error(f"Commission refund failed for {self.name}: {str(e)}", "Refund Error")
 
 
-
-
-
+def on_doctype_update():
+    # Monthly GMV/billing sums filter completed orders of a restaurant by a creation range
+    frappe.db.add_index("Order", ["restaurant", "payment_status", "creation"], index_name="restaurant_payment_status_creation")
@@ -1,4 +1,5 @@
 import base64
+import functools
 import hashlib
 import html
 import os
@@ -6,12 +7,18 @@ import re
 import tempfile
 import urllib.request
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
 import frappe
 from frappe.utils import get_url
 
 
+# PDF export fetches pre-rendered cards from R2 concurrently, in windows of this size
+QR_PDF_FETCH_WORKERS = 8
+QR_PDF_FETCH_WINDOW = 16
+
+
 def normalize_qr_color(color):
 	default_color = "#DB782F"
 	if not color:
@@ -310,7 +317,10 @@ def extract_svg_payload(svg_markup):
 	return view_box, inner_markup
 
 
+@functools.lru_cache(maxsize=32)
 def load_font(size, bold=False):
+	# Cached per (size, bold): every card in a batch reuses the same few fonts, so
+	# the path probing and TrueType parsing only happen once per worker
 	from PIL import ImageFont
 
 	font_candidates = [
@@ -330,19 +340,19 @@ def measure_text(draw, text, font):
 	return bbox[2] - bbox[0], bbox[3] - bbox[1]
 
 
-def generate_svg_card(qr_data, restaurant_name, brand_color, table_number, logo_bytes, background_image_bytes):
+def generate_svg_card(qr_data, restaurant_name, brand_color, table_number, logo_bytes, background_image_bytes, qr_version=None):
 	import qrcode
 	from qrcode.image.svg import SvgPathImage
 
 	qr = qrcode.QRCode(
-		version=None,
+		version=qr_version,
 		error_correction=qrcode.constants.ERROR_CORRECT_H,
 		box_size=16,
 		border=4,
 		image_factory=SvgPathImage,
 	)
 	qr.add_data(qr_data)
-	qr.make(fit=True)
+	qr.make(fit=qr_version is None)
 	buffer = BytesIO()
 	qr.make_image(fill_color=brand_color, back_color="white").save(buffer)
 	qr_markup = buffer.getvalue().decode("utf-8")
@@ -412,7 +422,7 @@ def build_artistic_qr_image(qr_data, logo_bytes, background_image_bytes):
 	return final_img
 
 
-def generate_png_card(qr_data, restaurant_name, brand_color, table_number, logo_bytes, background_image_bytes):
+def generate_png_card(qr_data, restaurant_name, brand_color, table_number, logo_bytes, background_image_bytes, qr_version=None):
 	import qrcode
 	from PIL import Image, ImageDraw, ImageOps
 
@@ -461,13 +471,13 @@ def generate_png_card(qr_data, restaurant_name, brand_color, table_number, logo_
 	# Fallback to regular QR if artistic failed or no logo/background
 	if qr_img is None:
 		qr = qrcode.QRCode(
-			version=None,
+			version=qr_version,
 			error_correction=qrcode.constants.ERROR_CORRECT_H,
 			box_size=20,
 			border=4,
 		)
 		qr.add_data(qr_data)
-		qr.make(fit=True)
+		qr.make(fit=qr_version is None)
 		qr_img = qr.make_image(fill_color=brand_color, back_color="white").convert("RGBA")
 		qr_img = qr_img.resize((520, 520), Image.Resampling.NEAREST)
 	
@@ -512,7 +522,7 @@ def upload_content_bytes(content, suffix, object_key, content_type):
 			os.remove(temp_path)
 
 
-def ensure_table_qr_assets(restaurant_doc, table_number, force=False, branding=None, logo_bytes=None, background_image_bytes=None, override_background_url=None):
+def ensure_table_qr_assets(restaurant_doc, table_number, force=False, branding=None, logo_bytes=None, background_image_bytes=None, override_background_url=None, qr_version=None):
 	from dinematters.dinematters.media.storage import get_cdn_url, verify_object_exists
 
 	# Use provided branding or fetch it (for backward compatibility)
@@ -554,6 +564,7 @@ def ensure_table_qr_assets(restaurant_doc, table_number, force=False, branding=N
 		table_number,
 		logo_bytes,
 		background_image_bytes,
+		qr_version=qr_version,
 	)
 	png_bytes = generate_png_card(
 		qr_url,
@@ -562,6 +573,7 @@ def ensure_table_qr_assets(restaurant_doc, table_number, force=False, branding=N
 		table_number,
 		logo_bytes,
 		background_image_bytes,
+		qr_version=qr_version,
 	)
 
 	svg_url = upload_content_bytes(svg_bytes, ".svg", object_keys["svg"], "image/svg+xml")
@@ -578,6 +590,17 @@ def ensure_table_qr_assets(restaurant_doc, table_number, force=False, branding=N
 	}
 
 
+def fit_table_qr_version(restaurant_doc):
+	"""Smallest QR version that holds the restaurant's longest table URL, so every card
+	can be built with fit=False instead of re-running the version search per table."""
+	import qrcode
+
+	qr = qrcode.QRCode(version=None, error_correction=qrcode.constants.ERROR_CORRECT_H)
+	qr.add_data(build_table_qr_url(restaurant_doc, restaurant_doc.tables))
+	qr.make(fit=True)
+	return qr.version
+
+
 def build_table_qr_assets(restaurant_doc, force=False, override_background_url=None):
 	if not restaurant_doc.restaurant_id:
 		frappe.throw("Restaurant ID is required to generate QR codes")
@@ -588,6 +611,8 @@ def build_table_qr_assets(restaurant_doc, force=False, override_background_url=N
 	branding = resolve_qr_branding(restaurant_doc, override_background_url=override_background_url)
 	logo_bytes = read_logo_bytes(branding.get("logo_url"))
 	background_image_bytes = read_background_image_bytes(branding.get("background_image_url"))
+	# Table URLs only differ in the trailing number, so size the QR once for the longest one
+	qr_version = fit_table_qr_version(restaurant_doc)
 	
 	assets = []
 	for i in range(1, restaurant_doc.tables + 1):
@@ -598,7 +623,8 @@ def build_table_qr_assets(restaurant_doc, force=False, override_background_url=N
 			branding=branding, 
 			logo_bytes=logo_bytes, 
 			background_image_bytes=background_image_bytes,
-			override_background_url=override_background_url
+			override_background_url=override_background_url,
+			qr_version=qr_version
 		)
 		assets.append(asset)
 	return assets
@@ -614,17 +640,15 @@ def generate_pdf_from_assets(assets, layout="2x2"):
 	layout: '1x1' (one card per A4 page) or '2x2' (four cards per A4 page — industry standard)
 	Returns: bytes of the PDF
 	"""
-	import os
-	import tempfile
-	from io import BytesIO
-	from dinematters.dinematters.media.storage import download_object
 	from reportlab.lib.pagesizes import A4, landscape
 	from reportlab.lib.units import inch
 	from reportlab.pdfgen import canvas as rl_canvas
 	from reportlab.lib.utils import ImageReader
-	from PIL import Image
 
-	pdf_buffer = BytesIO()
+	# The canvas never writes to this target: getpdfdata() below hands back the finished
+	# document as one bytes object, skipping the save-into-BytesIO-then-getvalue() copies
+	pdf_target = BytesIO()
+	card_buffers = _iter_card_jpegs(assets)
 
 	if layout == "2x2":
 		# Landscape A4 for 2×2 grid — 4 QR cards per page
@@ -635,7 +659,7 @@ def generate_pdf_from_assets(assets, layout="2x2"):
 		card_width = 3.3 * inch
 		card_height = 3.7 * inch
 		
-		pdf_canvas_obj = rl_canvas.Canvas(pdf_buffer, pagesize=landscape(A4))
+		pdf_canvas_obj = rl_canvas.Canvas(pdf_target, pagesize=landscape(A4))
 		
 		# Margins for perfect centering
 		total_w = 2 * card_width
@@ -653,13 +677,15 @@ def generate_pdf_from_assets(assets, layout="2x2"):
 		for page_start in range(0, len(assets), 4):
 			page_assets = assets[page_start:page_start + 4]
 
-			for slot_idx, asset in enumerate(page_assets):
+			# Subtle light grey boundary cut-line for merchant convenience.
+			# Graphics state resets on showPage, so set it once per page rather than per card
+			pdf_canvas_obj.setStrokeColorRGB(0.9, 0.9, 0.9)
+			pdf_canvas_obj.setLineWidth(0.5)
+
+			for slot_idx in range(len(page_assets)):
 				x_pos, y_pos = positions_per_page[slot_idx]
-				card_buffer = _download_asset_as_jpeg(asset, download_object, Image)
+				card_buffer = next(card_buffers)
 				if card_buffer:
-					# Subtle light grey boundary cut-line for merchant convenience
-					pdf_canvas_obj.setStrokeColorRGB(0.9, 0.9, 0.9)
-					pdf_canvas_obj.setLineWidth(0.5)
 					pdf_canvas_obj.rect(x_pos - 1, y_pos - 1, card_width + 2, card_height + 2, fill=0, stroke=1)
 					
 					pdf_canvas_obj.drawImage(ImageReader(card_buffer), x_pos, y_pos, width=card_width, height=card_height)
@@ -676,10 +702,9 @@ def generate_pdf_from_assets(assets, layout="2x2"):
 		card_width = 4.4 * inch
 		card_height = 5.85 * inch
 
-		pdf_canvas_obj = rl_canvas.Canvas(pdf_buffer, pagesize=A4)
+		pdf_canvas_obj = rl_canvas.Canvas(pdf_target, pagesize=A4)
 
-		for index, asset in enumerate(assets, start=1):
-			card_buffer = _download_asset_as_jpeg(asset, download_object, Image)
+		for index, (asset, card_buffer) in enumerate(zip(assets, card_buffers, strict=True), start=1):
 			x = (page_width - card_width) / 2
 			y = (page_height - card_height) / 2 + 0.1 * inch
 
@@ -693,43 +718,74 @@ def generate_pdf_from_assets(assets, layout="2x2"):
 			if index < len(assets):
 				pdf_canvas_obj.showPage()
 
-	pdf_canvas_obj.save()
-	pdf_buffer.seek(0)
-	return pdf_buffer.getvalue()
+	return pdf_canvas_obj.getpdfdata()
 
 
-def _download_asset_as_jpeg(asset, download_object_fn, Image):
-	"""Download a PNG asset from R2 and return as JPEG BytesIO. Returns None on failure (safe for multi-card pages)."""
-	import tempfile
-	temp_path = None
-	try:
-		with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as temp_file:
-			temp_path = temp_file.name
-		download_object_fn(asset["png_object_key"], temp_path)
-
-		card_buffer = BytesIO()
-		with Image.open(temp_path) as img:
-			if img.mode in ('RGBA', 'LA', 'P'):
-				rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-				if img.mode == 'P':
-					img = img.convert('RGBA')
-				rgb_img.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-				img = rgb_img
-			else:
-				img = img.convert('RGB')
+def _download_asset_as_jpeg(asset, client, bucket_name):
+	"""Download a PNG asset from R2 and return it as a JPEG BytesIO.
+
+	Runs on pool threads, so it only touches the boto3 client and PIL - no frappe.* calls.
+	Errors propagate to the caller, which logs them on the request thread."""
+	from PIL import Image
+
+	png_buffer = BytesIO()
+	client.download_fileobj(bucket_name, asset["png_object_key"], png_buffer)
+	png_buffer.seek(0)
 
-			img.save(card_buffer, format='JPEG', quality=88, optimize=True)
-			card_buffer.seek(0)
-		return card_buffer
+	card_buffer = BytesIO()
+	with Image.open(png_buffer) as img:
+		if img.mode in ('RGBA', 'LA', 'P'):
+			rgb_img = Image.new('RGB', img.size, (255, 255, 255))
+			if img.mode == 'P':
+				img = img.convert('RGBA')
+			rgb_img.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+			img = rgb_img
+		else:
+			img = img.convert('RGB')
+
+		img.save(card_buffer, format='JPEG', quality=88, optimize=True)
+		card_buffer.seek(0)
+	return card_buffer
+
+
+def _iter_card_jpegs(assets):
+	"""Return an iterator yielding a JPEG BytesIO (or None on failure) per asset, in order.
+
+	Cards are fetched and re-encoded on a small thread pool - the work is R2 I/O plus
+	PIL encoding, both of which release the GIL - one window at a time so memory stays bounded.
+	The R2 client is resolved here, once, so a storage config error skips the cards
+	rather than aborting the whole PDF."""
+	from dinematters.dinematters.media.config import get_r2_config
+	from dinematters.dinematters.media.storage import get_r2_client
+
+	try:
+		client = get_r2_client()
+		bucket_name = get_r2_config()["bucket_name"]
 	except Exception as e:
-		frappe.log_error(
-			f"Failed to render QR card for table {asset.get('table_number', '?')}: {e}",
-			"QR PDF Card Render Error"
-		)
-		return None
-	finally:
-		if temp_path and os.path.exists(temp_path):
-			os.remove(temp_path)
+		frappe.log_error(f"Failed to resolve R2 client for QR cards: {e}", "QR PDF Card Render Error")
+		return iter([None] * len(assets))
+
+	return _fetch_card_jpegs(assets, client, bucket_name)
+
+
+def _fetch_card_jpegs(assets, client, bucket_name):
+	"""Generator behind _iter_card_jpegs; errors are logged and yield None for that card."""
+	def fetch(asset):
+		try:
+			return _download_asset_as_jpeg(asset, client, bucket_name), None
+		except Exception as e:
+			return None, e
+
+	with ThreadPoolExecutor(max_workers=QR_PDF_FETCH_WORKERS) as pool:
+		for window_start in range(0, len(assets), QR_PDF_FETCH_WINDOW):
+			window = assets[window_start:window_start + QR_PDF_FETCH_WINDOW]
+			for asset, (card_buffer, error) in zip(window, pool.map(fetch, window), strict=True):
+				if error is not None:
+					frappe.log_error(
+						f"Failed to render QR card for table {asset.get('table_number', '?')}: {error}",
+						"QR PDF Card Render Error"
+					)
+				yield card_buffer
 
 
 # ─────────────────────────────────────────────────────────────────
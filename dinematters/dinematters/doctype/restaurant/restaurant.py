@@ -1,12 +1,31 @@
 # Copyright (c) 2025, Dinematters and contributors
 # For license information, please see license.txt
 
+import json
+import os
+import random
+import shutil
+import string
+import time
 import urllib.request
 import frappe
 from frappe import _
 from frappe.model.document import Document
-from frappe.utils import get_url
-from dinematters.dinematters.doctype.restaurant.qr_branding import build_table_qr_assets, generate_pdf_from_assets
+from frappe.utils import add_days, get_url, random_string, today
+from dinematters.dinematters.doctype.restaurant.qr_branding import (
+	SPECIAL_QR_CONFIGS,
+	build_special_qr_assets,
+	build_table_qr_assets,
+	generate_pdf_from_assets,
+)
+from dinematters.dinematters.utils.permissions import assign_user_to_restaurant
+from dinematters.dinematters.utils.slug_helpers import get_taken_values, get_unique_slug
+
+# restaurant_id sanitising table for generate_restaurant_id: spaces become hyphens and every
+# other ASCII character that isn't alphanumeric or a hyphen is dropped
+_RESTAURANT_ID_TABLE = str.maketrans(" ", "-", "".join(
+	c for c in map(chr, range(128)) if not (c.isalnum() or c in " -")
+))
 
 
 class Restaurant(Document):
@@ -53,13 +72,13 @@ class Restaurant(Document):
 		if not self.restaurant_id and self.restaurant_name:
 			self.restaurant_id = self.generate_restaurant_id()
 		
-		# Auto-generate slug if not provided
-		if not self.slug and self.restaurant_id:
-			self.slug = self.restaurant_id.lower().replace(" ", "-")
-		
-		# Auto-generate subdomain if not provided
-		if not self.subdomain and self.restaurant_id:
-			self.subdomain = self.restaurant_id.lower().replace(" ", "-")
+		# Auto-generate slug and subdomain if not provided (both derive from restaurant_id)
+		if self.restaurant_id and not (self.slug and self.subdomain):
+			id_slug = self.restaurant_id.lower().replace(" ", "-")
+			if not self.slug:
+				self.slug = id_slug
+			if not self.subdomain:
+				self.subdomain = id_slug
 		
 		# Validate plan change (admin-only)
 		self.validate_plan_change()
@@ -181,7 +200,6 @@ class Restaurant(Document):
 				'reason': self.plan_change_reason or ''
 			}
 			
-			import json
 			if isinstance(self.plan_change_history, str):
 				self.plan_change_history = json.loads(self.plan_change_history or '[]')
 			
@@ -239,38 +257,26 @@ class Restaurant(Document):
 	
 	def generate_restaurant_id(self):
 		"""Generate unique restaurant_id from restaurant_name"""
-		import re
-		from frappe.utils import cstr
-		
-		# Create base ID from restaurant name
-		base_id = self.restaurant_name.strip()
-		# Remove special characters, keep only alphanumeric and spaces
-		base_id = re.sub(r'[^a-zA-Z0-9\s-]', '', base_id)
-		# Replace spaces and multiple hyphens with single hyphen
-		base_id = re.sub(r'[\s-]+', '-', base_id)
+		# Create base ID from restaurant name, collapsing any whitespace to single spaces
+		base_id = " ".join(self.restaurant_name.split())
+		# Remove special characters (and non-ASCII), turn spaces into hyphens
+		base_id = base_id.encode("ascii", "ignore").decode().translate(_RESTAURANT_ID_TABLE)
+		# Collapse runs of hyphens and drop leading/trailing ones
+		base_id = "-".join(filter(None, base_id.split("-")))
 		# Convert to lowercase
 		base_id = base_id.lower()
-		# Remove leading/trailing hyphens
-		base_id = base_id.strip('-')
 		
 		# Ensure it's not empty
 		if not base_id:
 			base_id = "restaurant"
 		
-		# Check if restaurant_id already exists, append number if needed
-		restaurant_id = base_id
-		counter = 1
-		while frappe.db.exists("Restaurant", {"restaurant_id": restaurant_id}):
-			restaurant_id = f"{base_id}-{counter}"
-			counter += 1
-		
-		return restaurant_id
+		# Check if restaurant_id already exists, append number if needed.
+		# Fetch base_id and every base_id-N in one query instead of probing each suffix
+		taken = get_taken_values("Restaurant", "restaurant_id", base_id)
+		return get_unique_slug(base_id, taken)
 	
 	def generate_referral_code(self):
 		"""Generate a premium unique referral code for the restaurant"""
-		import random
-		import string
-		
 		# Base part: "DINE" + first 4 chars of restaurant name (slugified)
 		name_part = self.restaurant_id[:4].upper() if self.restaurant_id else "DINE"
 		# Random part: 4 alphanumeric characters
@@ -317,23 +323,32 @@ class Restaurant(Document):
 	def auto_assign_owner(self):
 		"""Auto-create User, Restaurant User and User Permission for owner"""
 		try:
-			# Find user by email
-			user = frappe.db.get_value("User", {"email": self.owner_email}, "name")
+			# Find user by email and whether they're already assigned here, in one query
+			owner = frappe.db.sql("""
+				SELECT u.name,
+					EXISTS(
+						SELECT 1 FROM `tabRestaurant User` ru
+						WHERE ru.user = u.name AND ru.restaurant = %(restaurant)s
+					) AS is_assigned
+				FROM `tabUser` u
+				WHERE u.email = %(email)s
+				LIMIT 1
+			""", {"restaurant": self.name, "email": self.owner_email}, as_dict=True)
 			
-			# If user doesn't exist, create it
-			if not user:
+			if owner:
+				user = owner[0].name
+				
+				# Check if Restaurant User already exists
+				if owner[0].is_assigned:
+					frappe.msgprint(f"Owner {self.owner_email} is already assigned to this restaurant")
+					return
+			else:
+				# If user doesn't exist, create it
 				user = self.create_owner_user()
 				if not user:
 					return  # Error already logged and messaged
 			
-			# Check if Restaurant User already exists
-			if frappe.db.exists("Restaurant User", {"user": user, "restaurant": self.name}):
-				frappe.msgprint(f"Owner {self.owner_email} is already assigned to this restaurant")
-				return
-			
 			# Create Restaurant User (this will auto-create User Permission via Restaurant User hooks)
-			from dinematters.dinematters.utils.permissions import assign_user_to_restaurant
-			
 			restaurant_user = assign_user_to_restaurant(
 				user=user,
 				restaurant=self.name,
@@ -369,8 +384,6 @@ class Restaurant(Document):
 	def create_owner_user(self):
 		"""Create User account from owner information"""
 		try:
-			from frappe.utils import random_string
-			
 			# Parse owner_name into first_name and last_name
 			first_name = ""
 			last_name = ""
@@ -382,31 +395,36 @@ class Restaurant(Document):
 				# Use email prefix as first name if name not provided
 				first_name = self.owner_email.split("@")[0]
 			
-			# Generate username from email (use email as username)
-			username = self.owner_email
-			
-			# Check if username already exists (different email but same username)
-			if frappe.db.exists("User", {"name": username}):
-				# Append random string if username exists
-				username = f"{self.owner_email.split('@')[0]}-{random_string(4).lower()}"
-			
-			# Create User
-			user_doc = frappe.get_doc({
-				"doctype": "User",
-				"email": self.owner_email,
-				"first_name": first_name,
-				"last_name": last_name,
-				"mobile_no": self.owner_phone if self.owner_phone else None,
-				"send_welcome_email": 1,  # Send welcome email with password reset link
-				"user_type": "System User",
-				"enabled": 1
-			})
-			
-			# Set username (name field)
-			user_doc.name = username
+			def build_user_doc(username):
+				user_doc = frappe.get_doc({
+					"doctype": "User",
+					"email": self.owner_email,
+					"first_name": first_name,
+					"last_name": last_name,
+					"mobile_no": self.owner_phone if self.owner_phone else None,
+					"send_welcome_email": 1,  # Send welcome email with password reset link
+					"user_type": "System User",
+					"enabled": 1
+				})
+				# Set username (name field)
+				user_doc.name = username
+				return user_doc
 			
-			# Insert user
-			user_doc.insert(ignore_permissions=True)
+			# Insert with the email as username and let the primary key catch collisions,
+			# instead of a separate exists() check that can race with a concurrent insert
+			user_doc = build_user_doc(self.owner_email)
+			try:
+				user_doc.insert(ignore_permissions=True)
+			except frappe.DuplicateEntryError:
+				# Someone else created this email's user in the meantime - reuse it
+				existing_user = frappe.db.get_value("User", {"email": self.owner_email}, "name")
+				if existing_user:
+					frappe.msgprint(f"User {self.owner_email} already exists. Proceeding with assignment.")
+					return existing_user
+				
+				# Username taken by a different email - append random string
+				user_doc = build_user_doc(f"{self.owner_email.split('@')[0]}-{random_string(4).lower()}")
+				user_doc.insert(ignore_permissions=True)
 			
 			# Send welcome email (Frappe will send password reset link)
 			try:
@@ -423,17 +441,11 @@ class Restaurant(Document):
 			return user_doc.name
 			
 		except frappe.DuplicateEntryError:
-			# User might have been created between check and insert
-			user = frappe.db.get_value("User", {"email": self.owner_email}, "name")
-			if user:
-				frappe.msgprint(f"User {self.owner_email} already exists. Proceeding with assignment.")
-				return user
-			else:
-				frappe.msgprint(
-					f"Error creating user account. Please create user manually and assign via Restaurant User.",
-					indicator="red"
-				)
-				return None
+			frappe.msgprint(
+				f"Error creating user account. Please create user manually and assign via Restaurant User.",
+				indicator="red"
+			)
+			return None
 		except Exception as e:
 			error_msg = str(e)[:100]  # Truncate error message
 			frappe.msgprint(
@@ -450,13 +462,6 @@ class Restaurant(Document):
 		qr_type: 'dine_in' (default) or 'takeaway'
 		"""
 		try:
-			import time
-			from dinematters.dinematters.doctype.restaurant.qr_branding import (
-				build_table_qr_assets, 
-				build_special_qr_assets,
-				generate_pdf_from_assets
-			)
-
 			if qr_type == "takeaway":
 				assets = build_special_qr_assets(self, force=True)
 				file_name = f"{self.restaurant_id}_takeaway_qr_codes.pdf"
@@ -554,7 +559,6 @@ class Restaurant(Document):
 			# Verify the file actually exists in storage
 			try:
 				from dinematters.dinematters.media.storage import verify_object_exists
-				import os
 				
 				# If it's a local file, check if it exists
 				if existing_file.file_url.startswith("/files/"):
@@ -661,7 +665,6 @@ class Restaurant(Document):
 
 	@frappe.whitelist()
 	def get_special_qr_assets(self, force=False):
-		from dinematters.dinematters.doctype.restaurant.qr_branding import build_special_qr_assets
 		assets = build_special_qr_assets(self, force=frappe.utils.cint(force))
 		return {
 			"restaurant": self.name,
@@ -796,7 +799,6 @@ def get_qr_scan_analytics(restaurant, days=30):
 		restaurant_name = restaurant_doc.name
 		days_int = frappe.utils.cint(days) or 30
 
-		from frappe.utils import add_days, today
 		end_date = add_days(today(), 1)
 		start_date = add_days(today(), -days_int)
 
@@ -847,7 +849,6 @@ def get_qr_scan_analytics(restaurant, days=30):
 		special_stats = {}
 		
 		# Initial values for order types from known config
-		from dinematters.dinematters.doctype.restaurant.qr_branding import SPECIAL_QR_CONFIGS
 		for kt in SPECIAL_QR_CONFIGS.keys():
 			special_stats[kt] = 0
 
@@ -984,8 +985,6 @@ def create_default_home_features(self):
 
 def ensure_svg_files_exist(self):
 	"""Ensure SVG files exist in File doctype"""
-	import os
-	
 	svg_files = [
 		{"filename": "legacy.svg", "source_path": "./apps/ono-menu/public/images/ui/legacy.svg"},
 		{"filename": "experience-lounge.svg", "source_path": "./apps/ono-menu/public/images/ui/experience-lounge.svg"},
@@ -1008,7 +1007,6 @@ def ensure_svg_files_exist(self):
 			# Copy to public/files if not exists
 			target_path = f"./sites/dine_matters/public/files/{svg['filename']}"
 			if not os.path.exists(target_path):
-				import shutil
 				shutil.copy2(svg["source_path"], target_path)
 			
 			# Read file content
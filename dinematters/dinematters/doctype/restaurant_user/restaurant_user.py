@@ -66,13 +66,16 @@ class RestaurantUser(Document):
 			)
 
 	def after_insert(self):
-		"""Add role + User Permission when Restaurant User is created"""
-		self.add_role_to_user()
+		"""Add User Permission when Restaurant User is created"""
+		# The role is added by on_update, which also runs right after insert
 		self._sync_user_permission(create=True)
 
 	def on_update(self):
-		"""Update role when Restaurant User is updated"""
-		self.add_role_to_user()
+		"""Add role when Restaurant User is created or updated"""
+		# has_value_changed is True for every field of a new document, so this covers
+		# the insert too; later saves only sync when the role or its user changed
+		if self.has_value_changed("role") or self.has_value_changed("user"):
+			self.add_role_to_user()
 
 	def on_trash(self):
 		"""Remove User Permission when Restaurant User is deleted"""
@@ -81,13 +84,20 @@ class RestaurantUser(Document):
 	def add_role_to_user(self):
 		"""Add Frappe role to user if not already present"""
 		try:
-			user_doc = frappe.get_doc("User", self.user)
 			role = self.role or "Restaurant Staff"
 
-			existing_roles = [r.role for r in user_doc.roles]
-			if role not in existing_roles:
-				user_doc.append("roles", {"role": role})
-				user_doc.save(ignore_permissions=True)
+			# Check against Frappe's cached role set (no query on a warm cache) and insert
+			# the single Has Role row directly rather than loading and re-saving the whole
+			# User doc with all its child tables
+			if role not in frappe.get_roles(self.user):
+				frappe.get_doc({
+					"doctype": "Has Role",
+					"parent": self.user,
+					"parenttype": "User",
+					"parentfield": "roles",
+					"role": role
+				}).db_insert()
+				frappe.clear_cache(user=self.user)
 		except Exception as e:
 			frappe.log_error(f"Error adding role to user: {str(e)}", "Restaurant User Role Assignment")
 
@@ -4,10 +4,16 @@ from frappe.model.document import Document
 
 class TokenizationAttempt(Document):
     def validate(self):
-        # ensure amount is integer paise
+        # ensure amount is integer paise; unset/0 falls back to the 100 paise mandate amount
+        amount = self.amount
+        if isinstance(amount, int) and amount:
+            return
+        if not amount:
+            self.amount = 100
+            return
         try:
-            self.amount = int(self.amount or 100)
-        except Exception:
+            self.amount = int(amount)
+        except (TypeError, ValueError):
             self.amount = 100
 
     def mark_created(self, razorpay_order_id: str):
@@ -0,0 +1,81 @@
+"""Add composite unique indexes on the monthly ledgers so duplicate (restaurant, month)
+rows are rejected by the database instead of an exists() check on every save.
+
+The old exists() check was racy, so duplicates may already be there and would make the
+ALTER TABLE fail. Each duplicate group is collapsed to one row first: the row carrying
+payment evidence (or, if none does, the most recently modified one) is kept and the others
+are deleted, with their full contents written to the Error Log. A group where more than one
+row carries payment evidence is left alone and the index for that ledger is skipped."""
+
+import json
+
+import frappe
+
+from dinematters.dinematters.doctype.monthly_billing_ledger.monthly_billing_ledger import (
+	on_doctype_update as add_billing_ledger_index,
+)
+from dinematters.dinematters.doctype.monthly_revenue_ledger.monthly_revenue_ledger import (
+	on_doctype_update as add_revenue_ledger_index,
+)
+
+
+def execute():
+	if frappe.db.table_exists("Monthly Billing Ledger") and dedupe_ledgers(
+		"Monthly Billing Ledger", "billing_month", ("razorpay_payment_id", "journal_entry"), "payment_status"
+	):
+		add_billing_ledger_index()
+	if frappe.db.table_exists("Monthly Revenue Ledger") and dedupe_ledgers(
+		"Monthly Revenue Ledger", "month", ("payment_link_id", "paid_date"), "status"
+	):
+		add_revenue_ledger_index()
+
+
+def pick_ledger_to_keep(rows, evidence_fields, status_field):
+	"""Return the row to keep from a duplicate group ordered newest first, or None if
+	more than one row carries payment evidence and the group needs manual review."""
+	settled = [r for r in rows if r.get(status_field) == "paid" or any(r.get(f) for f in evidence_fields)]
+	if len(settled) > 1:
+		return None
+	return settled[0] if settled else rows[0]
+
+
+def dedupe_ledgers(doctype, month_field, evidence_fields, status_field):
+	"""Collapse duplicate (restaurant, month) rows; return False if some need manual review."""
+	groups = frappe.db.sql(f"""
+		SELECT restaurant, `{month_field}` FROM `tab{doctype}`
+		GROUP BY restaurant, `{month_field}` HAVING COUNT(*) > 1
+	""")
+	conflicts = []
+	for restaurant, month in groups:
+		rows = frappe.get_all(
+			doctype,
+			filters={"restaurant": restaurant, month_field: month},
+			fields=["*"],
+			order_by="modified desc",
+		)
+		keep = pick_ledger_to_keep(rows, evidence_fields, status_field)
+		if keep is None:
+			conflicts.append(f"{restaurant} {month}: {', '.join(r.name for r in rows)}")
+			continue
+
+		removed = [r for r in rows if r.name != keep.name]
+		frappe.db.delete(doctype, {"name": ("in", [r.name for r in removed])})
+		frappe.log_error(
+			title=f"{doctype} duplicates removed",
+			message=f"Kept {keep.name} for {restaurant} {month}. Removed rows:\n"
+			+ json.dumps(removed, indent=1, default=str),
+		)
+
+	frappe.db.commit()
+	if conflicts:
+		frappe.log_error(
+			title=f"{doctype} unique index skipped",
+			message="Several rows with payment records exist for the same restaurant and month. "
+			"Resolve them manually and run on_doctype_update for the doctype to add the index:\n"
+			+ "\n".join(conflicts),
+		)
+		print(
+			f"Skipped unique index on {doctype}: {len(conflicts)} duplicate group(s) need manual review, see Error Log"
+		)
+		return False
+	return True
@@ -0,0 +1,11 @@
+"""Add the (restaurant, payment_status, creation) index on Order used by the monthly
+GMV and billing sums, so they scan a range of one restaurant's orders instead of the table."""
+
+import frappe
+
+from dinematters.dinematters.doctype.order.order import on_doctype_update as add_order_gmv_index
+
+
+def execute():
+	if frappe.db.table_exists("Order"):
+		add_order_gmv_index()
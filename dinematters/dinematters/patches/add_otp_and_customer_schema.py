@@ -3,11 +3,18 @@ import frappe
 
 
 def execute():
-	if not frappe.db.exists("DocType", "Dinematters Settings"):
+	# Doctype presence and whether the single already has stored values, in one round-trip.
+	# Single doctypes keep their values in tabSingles, not in a table of their own.
+	doctype_exists, doc_exists = frappe.db.sql("""
+		SELECT
+			EXISTS(SELECT 1 FROM `tabDocType` WHERE name = %(doctype)s),
+			EXISTS(SELECT 1 FROM `tabSingles` WHERE doctype = %(doctype)s)
+	""", {"doctype": "Dinematters Settings"})[0]
+	if not doctype_exists:
 		return
 	# Single doctype: ensure the doc exists (Frappe auto-creates on first access, but we init explicitly)
 	try:
-		if not frappe.db.exists("Dinematters Settings", "Dinematters Settings"):
+		if not doc_exists:
 			frappe.get_doc({"doctype": "Dinematters Settings"}).insert(ignore_permissions=True)
 			frappe.db.commit()
 	except Exception:
@@ -0,0 +1,21 @@
+"""One-time: Normalize legacy Customer.phone values (+91, 0, spaces, dashes) to 10 digits.
+New and saved customers are normalized by the before_save hook; this covers rows written
+before it, so phone lookups can use the indexed column instead of scanning with LIKE."""
+
+import frappe
+
+from dinematters.dinematters.utils.customer_helpers import normalize_phone
+
+
+def execute():
+	if not frappe.db.has_column("Customer", "phone"):
+		return
+	rows = frappe.db.sql(
+		"SELECT name, phone FROM tabCustomer WHERE phone IS NOT NULL AND phone != ''",
+		as_dict=1,
+	)
+	for r in rows:
+		normalized = normalize_phone(r.phone)
+		if normalized and len(normalized) == 10 and normalized != r.phone:
+			frappe.db.set_value("Customer", r.name, "phone", normalized, update_modified=False)
+	frappe.db.commit()
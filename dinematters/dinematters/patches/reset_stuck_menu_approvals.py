@@ -0,0 +1,25 @@
+"""One-time: Release Menu Image Extractor documents left in extraction_status "Processing" by
+the old approval job. Approval progress now lives in approval_status, so these go back to
+"Pending Approval" with approval_status "Failed" and can be approved again."""
+import frappe
+
+
+def execute():
+	if not frappe.db.has_column("Menu Image Extractor", "approval_error"):
+		return
+	stuck = frappe.get_all(
+		"Menu Image Extractor",
+		filters={
+			"extraction_status": "Processing",
+			"approval_status": ["!=", "Approved"],
+			"extraction_log": ["like", "Approval started%"],
+		},
+		pluck="name",
+	)
+	for name in stuck:
+		frappe.db.set_value("Menu Image Extractor", name, {
+			"extraction_status": "Pending Approval",
+			"approval_status": "Failed",
+			"approval_error": "Approval was interrupted. Please approve again.",
+		}, update_modified=False)
+	frappe.db.commit()
@@ -13,36 +13,19 @@ def execute():
 	source of truth.
 	"""
 
-	color_fields = [
-		"color_palette_violet",
-		"color_palette_indigo",
-		"color_palette_blue",
-		"color_palette_green",
-		"color_palette_yellow",
-		"color_palette_orange",
-		"color_palette_red",
-	]
-
-	configs = frappe.get_all(
-		"Restaurant Config",
-		fields=["name", "primary_color"] + color_fields,
-	)
-
-	for cfg in configs:
-		# Skip configs that already have a primary color
-		if cfg.get("primary_color"):
-			continue
-
-		primary = None
-		for field in color_fields:
-			val = cfg.get(field)
-			if val:
-				primary = val
-				break
-
-		# Fallback to default brand color if nothing set
-		if not primary:
-			primary = "#DB782F"
-
-		frappe.db.set_value("Restaurant Config", cfg["name"], "primary_color", primary, update_modified=False)
-
+	# One UPDATE for every config instead of a set_value round-trip per row;
+	# palette columns are tried in the same order the API uses
+	frappe.db.sql("""
+		UPDATE `tabRestaurant Config`
+		SET primary_color = COALESCE(
+			NULLIF(color_palette_violet, ''),
+			NULLIF(color_palette_indigo, ''),
+			NULLIF(color_palette_blue, ''),
+			NULLIF(color_palette_green, ''),
+			NULLIF(color_palette_yellow, ''),
+			NULLIF(color_palette_orange, ''),
+			NULLIF(color_palette_red, ''),
+			'#DB782F'
+		)
+		WHERE primary_color IS NULL OR primary_color = ''
+	""")
@@ -9,6 +9,16 @@ from .base import get_openai_client, get_gemini_client, handle_ai_error
 
 logger = logging.getLogger(__name__)
 
+# Image MIME types by file extension (anything unrecognised is sent as PNG)
+_CONTENT_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+}
+_DEFAULT_CONTENT_TYPE = "image/png"
+
 class RestaurantBrand(BaseModel):
     name: str = Field(description="The exact name of the restaurant as shown on the menu")
     tagline: Optional[str] = Field(None, description="Tagline or subtitle if visible")
@@ -81,7 +91,7 @@ class MenuExtractor:
         with open(image_path, "rb") as image_file:
             return base64.b64encode(image_file.read()).decode('utf-8')
     
-    def _transcribe_layout(self, base64_image: str) -> str:
+    def _transcribe_layout(self, base64_image: str, mime_type: str = _DEFAULT_CONTENT_TYPE) -> str:
         """
         Two-Stage Transcription: 
         1. Layout Profiling (Gemini)
@@ -100,7 +110,7 @@ class MenuExtractor:
             )
             plan_response = self.gemini_model.generate_content([
                 profiler_prompt, 
-                {"mime_type": "image/png", "data": base64_image}
+                {"mime_type": mime_type, "data": base64_image}
             ])
             plan = plan_response.text
 
@@ -113,7 +123,7 @@ class MenuExtractor:
             )
             ocr_response = self.gemini_model.generate_content([
                 ocr_prompt, 
-                {"mime_type": "image/png", "data": base64_image}
+                {"mime_type": mime_type, "data": base64_image}
             ])
             transcription = ocr_response.text
             print(f"\n--- DEBUG: GEMINI TRANSCRIPTION ---\n{transcription}\n--- END DEBUG ---")
@@ -122,9 +132,9 @@ class MenuExtractor:
         except Exception as e:
             logger.error(f"Error during Gemini transcription: {e}")
             # Fallback to simple OCR if Gemini fails
-            return self._fallback_ocr(base64_image)
+            return self._fallback_ocr(base64_image, mime_type)
 
-    def _fallback_ocr(self, base64_image: str) -> str:
+    def _fallback_ocr(self, base64_image: str, mime_type: str = _DEFAULT_CONTENT_TYPE) -> str:
         """Simple fallback OCR using GPT-4o if Gemini chain fails"""
         try:
             logger.info("Using fallback OCR...")
@@ -135,7 +145,7 @@ class MenuExtractor:
                         "role": "user",
                         "content": [
                             {"type": "text", "text": "Transcribe this menu exactly as it appears, preserving the spatial layout."},
-                            {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{base64_image}"}}
+                            {"type": "image_url", "image_url": {"url": f"data:{mime_type};base64,{base64_image}"}}
                         ]
                     }
                 ]
@@ -163,16 +173,17 @@ class MenuExtractor:
             
             try:
                 base64_image = self.encode_image(image_path)
+                mime_type = _CONTENT_TYPES.get(os.path.splitext(image_path)[1].lower(), _DEFAULT_CONTENT_TYPE)
                 
                 # Stage 1: Transcription
-                transcription = self._transcribe_layout(base64_image)
+                transcription = self._transcribe_layout(base64_image, mime_type)
                 if transcription:
                     transcriptions.append(f"--- SPATIAL GRID FOR IMAGE {i+1} ---\n{transcription}")
                 
                 image_contents.append({
                     "type": "image_url",
                     "image_url": {
-                        "url": f"data:image/png;base64,{base64_image}",
+                        "url": f"data:{mime_type};base64,{base64_image}",
                         "detail": "high"
                     }
                 })
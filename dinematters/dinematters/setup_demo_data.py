@@ -8,8 +8,522 @@ Then: exec(open('apps/dinematters/dinematters/dinematters/setup_demo_data.py').r
 Or: bench --site [site-name] execute dinematters.dinematters.setup_demo_data.create_demo_data
 """
 
+import functools
+import logging
+from types import MappingProxyType
+
 import frappe
-from frappe.utils import now_datetime, add_days
+from frappe.utils import now_datetime, add_days, flt
+from dinematters.dinematters.api.products import invalidate_product_cache
+
+
+logger = frappe.logger("demo_data", allow_site=True)
+
+
+# Column order for the bulk-inserted demo rows
+DEMO_CATEGORY_FIELDS = (
+	"name", "restaurant", "category_id", "category_name", "display_name",
+	"description", "is_special", "display_order",
+	"creation", "modified", "owner", "modified_by", "docstatus",
+)
+DEMO_PRODUCT_FIELDS = (
+	"name", "restaurant", "product_id", "product_name", "seo_slug",
+	"category", "category_name", "price", "original_price", "description", "calories",
+	"is_vegetarian", "estimated_time", "serving_size", "main_category", "is_active", "display_order", "has_no_media",
+	"creation", "modified", "owner", "modified_by", "docstatus",
+)
+DEMO_OPTION_FIELDS = (
+	"name", "parent", "parenttype", "parentfield", "idx",
+	"option_id", "label", "price", "is_default", "is_vegetarian", "display_order",
+	"creation", "modified", "owner", "modified_by", "docstatus",
+)
+DEMO_OFFER_FIELDS = (
+	"name", "restaurant", "title", "image_src", "description", "discount", "category",
+	"featured", "is_active", "valid_from", "valid_to", "display_order",
+	"creation", "modified", "owner", "modified_by", "docstatus",
+)
+DEMO_COUPON_FIELDS = (
+	"name", "restaurant", "offer_type", "code", "discount_type", "discount_value", "min_order_amount",
+	"category", "description", "priority", "can_stack", "valid_from", "valid_until", "is_active",
+	"max_uses", "usage_count", "max_uses_per_user",
+	"creation", "modified", "owner", "modified_by", "docstatus",
+)
+
+# Static seed data, built once at import and frozen (rows are read-only mappings)
+DEMO_CATEGORIES = tuple(map(MappingProxyType, (
+	{
+		"category_id": "hot-coffee",
+		"category_name": "Hot Coffee",
+		"display_name": "Hot Coffee",
+		"description": "Espresso-based coffee drinks",
+		"is_special": False,
+		"display_order": 1,
+	},
+	{
+		"category_id": "cold-coffee",
+		"category_name": "Cold Coffee",
+		"display_name": "Cold Coffee",
+		"description": "Iced and cold coffee beverages",
+		"is_special": False,
+		"display_order": 2,
+	},
+	{
+		"category_id": "bowls",
+		"category_name": "Bowls",
+		"display_name": "Bowls",
+		"description": "Healthy and delicious bowl meals",
+		"is_special": False,
+		"display_order": 3,
+	},
+	{
+		"category_id": "desserts",
+		"category_name": "Desserts",
+		"display_name": "Desserts",
+		"description": "Sweet treats and desserts",
+		"is_special": False,
+		"display_order": 4,
+	},
+	{
+		"category_id": "sandwiches",
+		"category_name": "Sandwiches",
+		"display_name": "Sandwiches",
+		"description": "Fresh sandwiches and wraps",
+		"is_special": False,
+		"display_order": 5,
+	},
+)))
+
+
+DEMO_PRODUCTS = tuple(map(MappingProxyType, (
+	# Hot Coffee
+	{
+		"product_id": "hot-coffee-espresso",
+		"product_name": "Espresso",
+		"category": "hot-coffee",
+		"price": 220,
+		"original_price": 250,
+		"description": "Single origin espresso with balanced sweetness, fruitiness and boldness",
+		"calories": 5,
+		"is_vegetarian": True,
+		"estimated_time": 5,
+		"serving_size": "1",
+		"main_category": "beverages",
+		"is_active": True,
+		"display_order": 1
+	},
+	{
+		"product_id": "hot-coffee-cappuccino",
+		"product_name": "Cappuccino",
+		"category": "hot-coffee",
+		"price": 280,
+		"description": "Espresso with steamed milk and foam",
+		"calories": 120,
+		"is_vegetarian": True,
+		"estimated_time": 6,
+		"serving_size": "1",
+		"main_category": "beverages",
+		"is_active": True,
+		"display_order": 2
+	},
+	{
+		"product_id": "hot-coffee-latte",
+		"product_name": "Latte",
+		"category": "hot-coffee",
+		"price": 300,
+		"description": "Smooth espresso with steamed milk",
+		"calories": 150,
+		"is_vegetarian": True,
+		"estimated_time": 7,
+		"serving_size": "1",
+		"main_category": "beverages",
+		"is_active": True,
+		"display_order": 3
+	},
+	{
+		"product_id": "hot-coffee-americano",
+		"product_name": "Americano",
+		"category": "hot-coffee",
+		"price": 240,
+		"description": "Espresso with hot water",
+		"calories": 10,
+		"is_vegetarian": True,
+		"estimated_time": 5,
+		"serving_size": "1",
+		"main_category": "beverages",
+		"is_active": True,
+		"display_order": 4
+	},
+	# Cold Coffee
+	{
+		"product_id": "cold-coffee-iced-latte",
+		"product_name": "Iced Latte",
+		"category": "cold-coffee",
+		"price": 320,
+		"description": "Espresso with cold milk and ice",
+		"calories": 140,
+		"is_vegetarian": True,
+		"estimated_time": 5,
+		"serving_size": "1",
+		"main_category": "beverages",
+		"is_active": True,
+		"display_order": 1
+	},
+	{
+		"product_id": "cold-coffee-frappuccino",
+		"product_name": "Frappuccino",
+		"category": "cold-coffee",
+		"price": 350,
+		"description": "Blended coffee drink with ice",
+		"calories": 250,
+		"is_vegetarian": True,
+		"estimated_time": 8,
+		"serving_size": "1",
+		"main_category": "beverages",
+		"is_active": True,
+		"display_order": 2
+	},
+	# Bowls
+	{
+		"product_id": "bowls-avocado-berry-salad",
+		"product_name": "Avocado Berry Salad Bowl",
+		"category": "bowls",
+		"price": 450,
+		"description": "Fresh avocado, mixed berries, greens, and quinoa",
+		"calories": 380,
+		"is_vegetarian": True,
+		"estimated_time": 12,
+		"serving_size": "1",
+		"main_category": "food",
+		"is_active": True,
+		"display_order": 1
+	},
+	{
+		"product_id": "bowls-acai-bowl",
+		"product_name": "Acai Bowl",
+		"category": "bowls",
+		"price": 420,
+		"description": "Acai berries, granola, banana, and honey",
+		"calories": 350,
+		"is_vegetarian": True,
+		"estimated_time": 10,
+		"serving_size": "1",
+		"main_category": "food",
+		"is_active": True,
+		"display_order": 2
+	},
+	# Desserts
+	{
+		"product_id": "desserts-chocolate-cake",
+		"product_name": "Chocolate Cake",
+		"category": "desserts",
+		"price": 280,
+		"original_price": 320,
+		"description": "Rich chocolate cake with chocolate frosting",
+		"calories": 450,
+		"is_vegetarian": True,
+		"estimated_time": 5,
+		"serving_size": "1",
+		"main_category": "desserts",
+		"is_active": True,
+		"display_order": 1
+	},
+	{
+		"product_id": "desserts-cheesecake",
+		"product_name": "New York Cheesecake",
+		"category": "desserts",
+		"price": 320,
+		"description": "Creamy New York style cheesecake",
+		"calories": 520,
+		"is_vegetarian": True,
+		"estimated_time": 5,
+		"serving_size": "1",
+		"main_category": "desserts",
+		"is_active": True,
+		"display_order": 2
+	},
+	# Sandwiches
+	{
+		"product_id": "sandwiches-club-sandwich",
+		"product_name": "Club Sandwich",
+		"category": "sandwiches",
+		"price": 380,
+		"description": "Triple decker with chicken, bacon, lettuce, and tomato",
+		"calories": 650,
+		"is_vegetarian": False,
+		"estimated_time": 10,
+		"serving_size": "1",
+		"main_category": "food",
+		"is_active": True,
+		"display_order": 1
+	},
+	{
+		"product_id": "sandwiches-veg-wrap",
+		"product_name": "Vegetable Wrap",
+		"category": "sandwiches",
+		"price": 320,
+		"description": "Fresh vegetables wrapped in tortilla",
+		"calories": 280,
+		"is_vegetarian": True,
+		"estimated_time": 8,
+		"serving_size": "1",
+		"main_category": "food",
+		"is_active": True,
+		"display_order": 2
+	},
+)))
+
+
+# Options added to the demo products' customization questions by add_missing_options
+DEMO_PRODUCT_OPTIONS = MappingProxyType({
+	"hot-coffee-espresso": {
+		"add-ons": [
+			{"option_id": "extra-shot", "label": "Extra Espresso Shot", "price": 60, "is_vegetarian": True, "display_order": 1},
+			{"option_id": "sugar", "label": "Sugar", "price": 0, "is_vegetarian": True, "display_order": 2}
+		]
+	},
+	"hot-coffee-cappuccino": {
+		"milk": [
+			{"option_id": "whole-milk", "label": "Whole Milk", "price": 0, "is_default": True, "is_vegetarian": True, "display_order": 1},
+			{"option_id": "almond-milk", "label": "Almond Milk", "price": 30, "is_default": False, "is_vegetarian": True, "display_order": 2},
+			{"option_id": "oat-milk", "label": "Oat Milk", "price": 30, "is_default": False, "is_vegetarian": True, "display_order": 3}
+		]
+	},
+	"bowls-avocado-berry-salad": {
+		"dressing": [
+			{"option_id": "balsamic", "label": "Balsamic Vinaigrette", "price": 0, "is_default": True, "is_vegetarian": True, "display_order": 1},
+			{"option_id": "ranch", "label": "Ranch", "price": 0, "is_default": False, "is_vegetarian": True, "display_order": 2}
+		],
+		"protein": [
+			{"option_id": "chicken", "label": "Grilled Chicken", "price": 80, "is_default": False, "is_vegetarian": False, "display_order": 1},
+			{"option_id": "tofu", "label": "Tofu", "price": 60, "is_default": False, "is_vegetarian": True, "display_order": 2}
+		]
+	}
+})
+
+
+# Demo orders: each takes quantity of the demo products in product_slice, and is only
+# created when at least min_products demo products exist. Delivery orders add the
+# restaurant's default delivery fee; discount is taken off before tax.
+DEMO_ORDERS = tuple(map(MappingProxyType, (
+	{
+		"order_id": "ONO-ORDER-1001", "order_number": "1001", "min_products": 1,
+		"product_slice": (0, 2), "quantity": 1, "cappuccino_quantity": 2, "discount": 0, "is_delivery": False,
+		"fields": {
+			"customer_name": "Priya Sharma",
+			"customer_email": "priya.sharma@example.com",
+			"customer_phone": "+91 98765 00123",
+			"table_number": 3,
+			"status": "delivered",
+			"payment_method": "card",
+			"payment_status": "completed",
+		},
+	},
+	{
+		# WELCOME50 applied
+		"order_id": "ONO-ORDER-1002", "order_number": "1002", "min_products": 1,
+		"product_slice": (2, 4), "quantity": 1, "discount": 50, "is_delivery": True,
+		"fields": {
+			"customer_name": "Rahul Verma",
+			"customer_email": "rahul.verma@example.com",
+			"customer_phone": "+91 98765 00456",
+			"delivery_address": "Sunrise Apartments, Tower B, Flat 1402",
+			"delivery_city": "Metropolis",
+			"delivery_state": "CA",
+			"delivery_zip_code": "94107",
+			"delivery_instructions": "Call on arrival, main gate under renovation.",
+			"status": "delivered",
+			"payment_method": "online",
+			"payment_status": "completed",
+		},
+	},
+	{
+		"order_id": "ONO-ORDER-1003", "order_number": "1003", "min_products": 6,
+		"product_slice": (4, 6), "quantity": 1, "discount": 0, "is_delivery": False,
+		"fields": {
+			"customer_name": "Sarah Johnson",
+			"customer_email": "sarah.j@example.com",
+			"customer_phone": "+91 98765 00567",
+			"table_number": 5,
+			"status": "pending",
+			"payment_method": "card",
+			"payment_status": "pending",
+		},
+	},
+	{
+		"order_id": "ONO-ORDER-1004", "order_number": "1004", "min_products": 8,
+		"product_slice": (6, 8), "quantity": 2, "discount": 0, "is_delivery": False,
+		"fields": {
+			"customer_name": "Michael Chen",
+			"customer_email": "michael.chen@example.com",
+			"customer_phone": "+91 98765 00678",
+			"table_number": 7,
+			"status": "preparing",
+			"payment_method": "card",
+			"payment_status": "completed",
+		},
+	},
+	{
+		"order_id": "ONO-ORDER-1005", "order_number": "1005", "min_products": 4,
+		"product_slice": (0, 1), "quantity": 3, "discount": 0, "is_delivery": True,
+		"fields": {
+			"customer_name": "Emma Wilson",
+			"customer_email": "emma.wilson@example.com",
+			"customer_phone": "+91 98765 00789",
+			"delivery_address": "Green Valley Apartments, Block C, Flat 502",
+			"delivery_city": "Metropolis",
+			"delivery_state": "CA",
+			"delivery_zip_code": "94108",
+			"delivery_instructions": "Leave at door, no contact delivery.",
+			"status": "ready",
+			"payment_method": "online",
+			"payment_status": "completed",
+		},
+	},
+	{
+		"order_id": "ONO-ORDER-1006", "order_number": "1006", "min_products": 3,
+		"product_slice": (1, 2), "quantity": 1, "discount": 0, "is_delivery": False,
+		"fields": {
+			"customer_name": "David Brown",
+			"customer_email": "david.brown@example.com",
+			"customer_phone": "+91 98765 00890",
+			"table_number": 2,
+			"status": "confirmed",
+			"payment_method": "card",
+			"payment_status": "completed",
+		},
+	},
+)))
+
+
+# Dates on the offers, coupons and bookings below are relative to the day of seeding
+DEMO_OFFERS = tuple(map(MappingProxyType, (
+	{
+		"title": "Happy Hour Coffee",
+		"description": "Flat ₹50 off on all hot coffees from 4–7 PM.",
+		"discount": "₹50 OFF",
+		"category": "Hot Coffee",
+		"featured": 1,
+		"display_order": 1,
+	},
+	{
+		"title": "Dessert Combo",
+		"description": "Any dessert + any coffee at a special combo price.",
+		"discount": "SAVE 20%",
+		"category": "Desserts",
+		"featured": 1,
+		"display_order": 2,
+	},
+)))
+
+
+DEMO_COUPONS = tuple(map(MappingProxyType, (
+	{
+		"code": "WELCOME50",
+		"discount_type": "flat",
+		"discount_value": 50,
+		"min_order_amount": 300,
+		"description": "₹50 off on your first order",
+		"category": "Welcome",
+		"valid_days": 60,
+		"max_uses": 100,
+		"max_uses_per_user": 1,
+	},
+	{
+		"code": "COFFEE10",
+		"discount_type": "percent",
+		"discount_value": 10,
+		"min_order_amount": 250,
+		"description": "10% off on any coffee order",
+		"category": "Coffee",
+		"valid_days": 30,
+		"max_uses": 500,
+		"max_uses_per_user": 5,
+	},
+)))
+
+
+DEMO_TABLE_BOOKINGS = tuple(map(MappingProxyType, (
+	{
+		"booking_number": "TB-1001",
+		"number_of_diners": 2,
+		"days_ahead": 1,
+		"time_slot": "19:30–21:00",
+		"status": "confirmed",
+		"customer_name": "Ananya Singh",
+		"customer_phone": "+91 98765 00321",
+		"customer_email": "ananya.singh@example.com",
+		"notes": "Window-side table, anniversary.",
+	},
+	{
+		"booking_number": "TB-1002",
+		"number_of_diners": 4,
+		"days_ahead": 2,
+		"time_slot": "13:00–14:30",
+		"status": "pending",
+		"customer_name": "Rohan Mehta",
+		"customer_phone": "+91 98765 00789",
+		"customer_email": "rohan.mehta@example.com",
+		"notes": "Vegetarian options preferred.",
+	},
+)))
+
+
+DEMO_BANQUET_BOOKING = MappingProxyType({
+	"booking_number": "BB-2001",
+	"number_of_guests": 80,
+	"event_type": "Corporate",
+	"days_ahead": 14,
+	"time_slot": "19:00–23:00",
+	"status": "confirmed",
+	"customer_name": "Acme Corp HR",
+	"customer_phone": "+1 555 0133 777",
+	"customer_email": "events@acmecorp.test",
+	"notes": "Year-end celebration, buffet with live salad & dessert stations.",
+})
+
+
+@functools.cache
+def _existing_values(doctype, fieldname, prefix):
+	"""Values of fieldname starting with prefix already stored on doctype.
+	Fetched once per seeding run so repeated existence checks stay in memory;
+	create_demo_data clears the cache when it finishes."""
+	return frozenset(frappe.get_all(doctype, filters={fieldname: ["like", f"{prefix}%"]}, pluck=fieldname))
+
+
+def _db_insert_seed(doc):
+	"""Name, stamp and write a seed doc directly, skipping controller hooks.
+	Only for rows whose hooks do nothing for fixed seed values (e.g. the demo bookings
+	already carry their booking_number, so before_insert has nothing to generate)."""
+	user = frappe.session.user
+	doc.set_new_name()
+	doc.owner = doc.modified_by = user
+	doc.creation = doc.modified = frappe.utils.now()
+	doc.db_insert()
+	return doc
+
+
+def _demo_data_present(restaurant):
+	"""Whether every demo category, product and order already exists for the restaurant.
+	Stops at the first COUNT that comes up short."""
+	return (
+		frappe.db.count("Menu Category", {"restaurant": restaurant, "category_id": ["in", [c["category_id"] for c in DEMO_CATEGORIES]]}) >= len(DEMO_CATEGORIES)
+		and frappe.db.count("Menu Product", {"restaurant": restaurant, "product_id": ["in", [p["product_id"] for p in DEMO_PRODUCTS]]}) >= len(DEMO_PRODUCTS)
+		and frappe.db.count("Order", {"restaurant": restaurant, "order_id": ["in", [o["order_id"] for o in DEMO_ORDERS]]}) >= len(DEMO_ORDERS)
+	)
+
+
+def _run_in_savepoint(label, fn, *args, default=()):
+	"""Run one seeding step under a savepoint; on failure undo just that step, log it
+	and return default so the rest of the transaction can still commit."""
+	savepoint = f"demo_{label}"
+	frappe.db.savepoint(savepoint)
+	try:
+		return fn(*args)
+	except Exception:
+		frappe.db.rollback(save_point=savepoint)
+		frappe.log_error(title="Demo Data", message=f"Error creating demo {label}\n{frappe.get_traceback()}")
+		return default
+
 
 
 def create_demo_data():
@@ -24,7 +538,9 @@ def create_demo_data():
 	- Table Bookings and a Banquet Booking
 	"""
 
-	print("🚀 Creating demo data for Dinematters...")
+	# Per-row progress is logged at debug level; set demo_data_verbose in site config to see it
+	logger.setLevel(logging.DEBUG if frappe.conf.get("demo_data_verbose") else logging.INFO)
+	logger.info("Creating demo data for Dinematters...")
 
 	# Use an existing restaurant if available. Do NOT create a new restaurant.
 	restaurant = None
@@ -32,32 +548,54 @@ def create_demo_data():
 		existing = frappe.get_all("Restaurant", fields=["name"], limit_page_length=1, order_by="creation asc")
 		if existing and len(existing) > 0:
 			restaurant = existing[0].name
-			print(f"ℹ️  Using existing Restaurant: {restaurant}")
+			logger.info(f"Using existing Restaurant: {restaurant}")
 		else:
-			print("⚠️  No existing Restaurant found. Demo data will not be created. Please create a Restaurant first.")
+			logger.warning("No existing Restaurant found. Demo data will not be created. Please create a Restaurant first.")
 			return {}
 	except Exception as e:
-		print(f"❌ Error finding existing Restaurant: {str(e)}")
+		logger.error(f"Error finding existing Restaurant: {str(e)}")
 		return {}
-	categories = create_categories(restaurant)
-	products = create_products(restaurant, categories)
-	offers = create_offers(restaurant)
-	coupons = create_coupons(restaurant)
-	orders = create_orders(restaurant, products)
-	table_bookings, banquet_bookings = create_bookings(restaurant)
-
-	# Add missing options to existing products
-	add_missing_options()
-
-	print(f"\n✅ Demo data created successfully!")
-	print(f"   - Restaurant: {restaurant}")
-	print(f"   - {len(categories)} Categories")
-	print(f"   - {len(products)} Products")
-	print(f"   - {len(offers)} Offers")
-	print(f"   - {len(coupons)} Coupons")
-	print(f"   - {len(orders)} Orders")
-	print(f"   - {len(table_bookings)} Table Bookings")
-	print(f"   - {len(banquet_bookings)} Banquet Bookings")
+
+	# Repeat runs are the common case: if every demo category, product and order is
+	# already there, a few COUNTs are enough to skip straight to topping up missing options
+	if _demo_data_present(restaurant):
+		logger.info(f"Demo data already present for {restaurant}")
+		add_missing_options(restaurant)
+		frappe.db.commit()
+		return {"restaurant": restaurant, "cached": True}
+
+	# Seed everything in one transaction: a single commit at the end, and a failure
+	# in the menu part leaves no half-created demo data behind. in_import skips the per-row
+	# post-save work (version rows, global search sync, notifications) for seed docs.
+	prev_in_import = frappe.flags.in_import
+	frappe.flags.in_import = True
+	try:
+		categories = create_categories(restaurant)
+		products = create_products(restaurant, categories)
+
+		# The remaining steps don't feed each other, so each runs under its own savepoint:
+		# a failure is rolled back and logged without discarding the menu seeded above
+		offers = _run_in_savepoint("offers", create_offers, restaurant)
+		coupons = _run_in_savepoint("coupons", create_coupons, restaurant)
+		orders = _run_in_savepoint("orders", create_orders, restaurant, products)
+		table_bookings, banquet_bookings = _run_in_savepoint("bookings", create_bookings, restaurant, default=([], []))
+
+		# Add missing options to existing products
+		_run_in_savepoint("options", add_missing_options, restaurant)
+
+		frappe.db.commit()
+	except Exception:
+		frappe.db.rollback()
+		raise
+	finally:
+		frappe.flags.in_import = prev_in_import
+		_existing_values.cache_clear()
+
+	logger.info(
+		f"Demo data created for {restaurant}: {len(categories)} categories, {len(products)} products, "
+		f"{len(offers)} offers, {len(coupons)} coupons, {len(orders)} orders, "
+		f"{len(table_bookings)} table bookings, {len(banquet_bookings)} banquet bookings"
+	)
 
 	return {
 		"restaurant": restaurant,
@@ -82,7 +620,7 @@ def create_restaurant():
 		"name",
 	)
 	if existing:
-		print(f"⏭️  Restaurant already exists: {existing}")
+		logger.info(f"Restaurant already exists: {existing}")
 		return existing
 
 	doc = frappe.get_doc(
@@ -105,7 +643,7 @@ def create_restaurant():
 		}
 	)
 	doc.insert(ignore_permissions=True)
-	print(f"✅ Created Restaurant: {doc.name}")
+	logger.info(f"Created Restaurant: {doc.name}")
 	# Create default Restaurant Config for this restaurant if it doesn't exist
 	try:
 		if not frappe.db.exists("Restaurant Config", {"restaurant": doc.name}):
@@ -120,10 +658,9 @@ def create_restaurant():
 				"currency": doc.currency or "INR",
 			})
 			rc.insert(ignore_permissions=True)
-			print(f"✅ Created default Restaurant Config for {doc.name}")
-	except Exception as e:
-		print(f"❌ Error creating Restaurant Config: {str(e)}")
-		frappe.log_error(f"Error creating Restaurant Config for demo restaurant: {str(e)}")
+			logger.info(f"Created default Restaurant Config for {doc.name}")
+	except Exception:
+		frappe.log_error(title="Demo Data", message=f"Error creating Restaurant Config for {doc.name}\n{frappe.get_traceback()}")
 
 	# Ensure default Home Feature entries exist for this restaurant
 	try:
@@ -151,84 +688,48 @@ def create_restaurant():
 					"display_order": idx
 				})
 				feat_doc.insert(ignore_permissions=True)
-		print(f"✅ Ensured default Home Feature entries for {doc.name}")
-	except Exception as e:
-		print(f"❌ Error creating Home Feature defaults: {str(e)}")
-		frappe.log_error(f"Error creating Home Feature defaults for demo restaurant: {str(e)}")
+		logger.info(f"Ensured default Home Feature entries for {doc.name}")
+	except Exception:
+		frappe.log_error(title="Demo Data", message=f"Error creating Home Feature defaults for {doc.name}\n{frappe.get_traceback()}")
 	return doc.name
 
 
 def create_categories(restaurant):
 	"""Create demo categories linked to a restaurant."""
 
-	categories_data = [
-		{
-			"category_id": "hot-coffee",
-			"category_name": "Hot Coffee",
-			"display_name": "Hot Coffee",
-			"description": "Espresso-based coffee drinks",
-			"is_special": False,
-			"display_order": 1,
-		},
-		{
-			"category_id": "cold-coffee",
-			"category_name": "Cold Coffee",
-			"display_name": "Cold Coffee",
-			"description": "Iced and cold coffee beverages",
-			"is_special": False,
-			"display_order": 2,
-		},
-		{
-			"category_id": "bowls",
-			"category_name": "Bowls",
-			"display_name": "Bowls",
-			"description": "Healthy and delicious bowl meals",
-			"is_special": False,
-			"display_order": 3,
-		},
-		{
-			"category_id": "desserts",
-			"category_name": "Desserts",
-			"display_name": "Desserts",
-			"description": "Sweet treats and desserts",
-			"is_special": False,
-			"display_order": 4,
-		},
-		{
-			"category_id": "sandwiches",
-			"category_name": "Sandwiches",
-			"display_name": "Sandwiches",
-			"description": "Fresh sandwiches and wraps",
-			"is_special": False,
-			"display_order": 5,
-		},
-	]
-
+	# One query for every demo category already present, instead of an exists() per row
+	existing_categories = dict(frappe.get_all(
+		"Menu Category",
+		filters={"restaurant": restaurant, "category_id": ["in", [c["category_id"] for c in DEMO_CATEGORIES]]},
+		fields=["category_id", "name"],
+		as_list=True,
+	))
+
+	# Seed rows are static and known-valid, so write the missing ones with a single
+	# multi-row INSERT rather than one validated doc.insert() each. display_name mirrors
+	# category_name, as MenuCategory.validate would set it.
+	now = frappe.utils.now()
+	user = frappe.session.user
+	values = []
 	created_categories = []
 
-	for cat_data in categories_data:
-		# Attach restaurant
-		cat_data_with_restaurant = {
-			"restaurant": restaurant,
-			**cat_data,
-		}
+	for cat_data in DEMO_CATEGORIES:
+		if cat_data["category_id"] in existing_categories:
+			logger.debug("Category already exists: %s", cat_data['category_name'])
+			created_categories.append(existing_categories[cat_data["category_id"]])
+			continue
 
-		if not frappe.db.exists("Menu Category", cat_data["category_id"]):
-			try:
-				category = frappe.get_doc(
-					{
-						"doctype": "Menu Category",
-						**cat_data_with_restaurant,
-					}
-				)
-				category.insert(ignore_permissions=True)
-				created_categories.append(category.name)
-				print(f"✅ Created category: {cat_data['category_name']}")
-			except Exception as e:
-				print(f"❌ Error creating category {cat_data['category_name']}: {str(e)}")
-		else:
-			print(f"⏭️  Category already exists: {cat_data['category_name']}")
-			created_categories.append(cat_data["category_id"])
+		name = frappe.generate_hash(length=10)
+		values.append((
+			name, restaurant, cat_data["category_id"], cat_data["category_name"], cat_data["category_name"],
+			cat_data["description"], int(cat_data["is_special"]), cat_data["display_order"],
+			now, now, user, user, 0,
+		))
+		created_categories.append(name)
+		logger.debug("Created category: %s", cat_data['category_name'])
+
+	if values:
+		frappe.db.bulk_insert("Menu Category", DEMO_CATEGORY_FIELDS, values)
 
 	return created_categories
 
@@ -236,223 +737,50 @@ def create_categories(restaurant):
 def create_products(restaurant, categories):
 	"""Create demo products linked to a restaurant and categories."""
 
-	products_data = [
-		# Hot Coffee
-		{
-			"product_id": "hot-coffee-espresso",
-			"product_name": "Espresso",
-			"category": "hot-coffee",
-			"category_name": "Hot Coffee",
-			"price": 220,
-			"original_price": 250,
-			"description": "Single origin espresso with balanced sweetness, fruitiness and boldness",
-			"calories": 5,
-			"is_vegetarian": True,
-			"estimated_time": 5,
-			"serving_size": "1",
-			"main_category": "beverages",
-			"is_active": True,
-			"display_order": 1
-		},
-		{
-			"product_id": "hot-coffee-cappuccino",
-			"product_name": "Cappuccino",
-			"category": "hot-coffee",
-			"category_name": "Hot Coffee",
-			"price": 280,
-			"description": "Espresso with steamed milk and foam",
-			"calories": 120,
-			"is_vegetarian": True,
-			"estimated_time": 6,
-			"serving_size": "1",
-			"main_category": "beverages",
-			"is_active": True,
-			"display_order": 2
-		},
-		{
-			"product_id": "hot-coffee-latte",
-			"product_name": "Latte",
-			"category": "hot-coffee",
-			"category_name": "Hot Coffee",
-			"price": 300,
-			"description": "Smooth espresso with steamed milk",
-			"calories": 150,
-			"is_vegetarian": True,
-			"estimated_time": 7,
-			"serving_size": "1",
-			"main_category": "beverages",
-			"is_active": True,
-			"display_order": 3
-		},
-		{
-			"product_id": "hot-coffee-americano",
-			"product_name": "Americano",
-			"category": "hot-coffee",
-			"category_name": "Hot Coffee",
-			"price": 240,
-			"description": "Espresso with hot water",
-			"calories": 10,
-			"is_vegetarian": True,
-			"estimated_time": 5,
-			"serving_size": "1",
-			"main_category": "beverages",
-			"is_active": True,
-			"display_order": 4
-		},
-		# Cold Coffee
-		{
-			"product_id": "cold-coffee-iced-latte",
-			"product_name": "Iced Latte",
-			"category": "cold-coffee",
-			"category_name": "Cold Coffee",
-			"price": 320,
-			"description": "Espresso with cold milk and ice",
-			"calories": 140,
-			"is_vegetarian": True,
-			"estimated_time": 5,
-			"serving_size": "1",
-			"main_category": "beverages",
-			"is_active": True,
-			"display_order": 1
-		},
-		{
-			"product_id": "cold-coffee-frappuccino",
-			"product_name": "Frappuccino",
-			"category": "cold-coffee",
-			"category_name": "Cold Coffee",
-			"price": 350,
-			"description": "Blended coffee drink with ice",
-			"calories": 250,
-			"is_vegetarian": True,
-			"estimated_time": 8,
-			"serving_size": "1",
-			"main_category": "beverages",
-			"is_active": True,
-			"display_order": 2
-		},
-		# Bowls
-		{
-			"product_id": "bowls-avocado-berry-salad",
-			"product_name": "Avocado Berry Salad Bowl",
-			"category": "bowls",
-			"category_name": "Bowls",
-			"price": 450,
-			"description": "Fresh avocado, mixed berries, greens, and quinoa",
-			"calories": 380,
-			"is_vegetarian": True,
-			"estimated_time": 12,
-			"serving_size": "1",
-			"main_category": "food",
-			"is_active": True,
-			"display_order": 1
-		},
-		{
-			"product_id": "bowls-acai-bowl",
-			"product_name": "Acai Bowl",
-			"category": "bowls",
-			"category_name": "Bowls",
-			"price": 420,
-			"description": "Acai berries, granola, banana, and honey",
-			"calories": 350,
-			"is_vegetarian": True,
-			"estimated_time": 10,
-			"serving_size": "1",
-			"main_category": "food",
-			"is_active": True,
-			"display_order": 2
-		},
-		# Desserts
-		{
-			"product_id": "desserts-chocolate-cake",
-			"product_name": "Chocolate Cake",
-			"category": "desserts",
-			"category_name": "Desserts",
-			"price": 280,
-			"original_price": 320,
-			"description": "Rich chocolate cake with chocolate frosting",
-			"calories": 450,
-			"is_vegetarian": True,
-			"estimated_time": 5,
-			"serving_size": "1",
-			"main_category": "desserts",
-			"is_active": True,
-			"display_order": 1
-		},
-		{
-			"product_id": "desserts-cheesecake",
-			"product_name": "New York Cheesecake",
-			"category": "desserts",
-			"category_name": "Desserts",
-			"price": 320,
-			"description": "Creamy New York style cheesecake",
-			"calories": 520,
-			"is_vegetarian": True,
-			"estimated_time": 5,
-			"serving_size": "1",
-			"main_category": "desserts",
-			"is_active": True,
-			"display_order": 2
-		},
-		# Sandwiches
-		{
-			"product_id": "sandwiches-club-sandwich",
-			"product_name": "Club Sandwich",
-			"category": "sandwiches",
-			"category_name": "Sandwiches",
-			"price": 380,
-			"description": "Triple decker with chicken, bacon, lettuce, and tomato",
-			"calories": 650,
-			"is_vegetarian": False,
-			"estimated_time": 10,
-			"serving_size": "1",
-			"main_category": "food",
-			"is_active": True,
-			"display_order": 1
-		},
-		{
-			"product_id": "sandwiches-veg-wrap",
-			"product_name": "Vegetable Wrap",
-			"category": "sandwiches",
-			"category_name": "Sandwiches",
-			"price": 320,
-			"description": "Fresh vegetables wrapped in tortilla",
-			"calories": 280,
-			"is_vegetarian": True,
-			"estimated_time": 8,
-			"serving_size": "1",
-			"main_category": "food",
-			"is_active": True,
-			"display_order": 2
-		},
-	]
-
+	# One query for every demo product already present, instead of an exists() per row
+	existing_products = dict(frappe.get_all(
+		"Menu Product",
+		filters={"restaurant": restaurant, "product_id": ["in", [p["product_id"] for p in DEMO_PRODUCTS]]},
+		fields=["product_id", "name"],
+		as_list=True,
+	))
+	# Menu Category is hash-named, so resolve the demo category ids to their link values.
+	# bulk_insert bypasses fetch_from, so category_name is filled from the same rows.
+	categories_by_id = {c.category_id: c for c in frappe.get_all(
+		"Menu Category",
+		filters={"restaurant": restaurant, "category_id": ["in", list({p["category"] for p in DEMO_PRODUCTS})]},
+		fields=["category_id", "name", "category_name"],
+	)}
+
+	# Same single multi-row INSERT as the categories. The demo products carry no media
+	# (has_no_media) and reuse their unique product_id as seo_slug.
+	now = frappe.utils.now()
+	user = frappe.session.user
+	values = []
 	created_products = []
 
-	for prod_data in products_data:
-		prod_data_with_restaurant = {
-			"restaurant": restaurant,
-			**prod_data,
-		}
+	for prod_data in DEMO_PRODUCTS:
+		if prod_data["product_id"] in existing_products:
+			logger.debug("Product already exists: %s", prod_data['product_name'])
+			created_products.append(existing_products[prod_data["product_id"]])
+			continue
 
-		if not frappe.db.exists("Menu Product", prod_data["product_id"]):
-			try:
-				# Create product
-				product = frappe.get_doc(
-					{
-						"doctype": "Menu Product",
-						**prod_data_with_restaurant,
-					}
-				)
-
-				product.insert(ignore_permissions=True)
-				created_products.append(product.name)
-				print(f"✅ Created product: {prod_data['product_name']}")
-			except Exception as e:
-				print(f"❌ Error creating product {prod_data['product_name']}: {str(e)}")
-				frappe.log_error(f"Error creating product {prod_data['product_name']}", str(e))
-		else:
-			print(f"⏭️  Product already exists: {prod_data['product_name']}")
-			created_products.append(prod_data["product_id"])
+		name = frappe.generate_hash(length=10)
+		category = categories_by_id.get(prod_data["category"]) or frappe._dict()
+		values.append((
+			name, restaurant, prod_data["product_id"], prod_data["product_name"], prod_data["product_id"],
+			category.name, category.category_name, prod_data["price"],
+			prod_data.get("original_price"), prod_data["description"], prod_data["calories"],
+			int(prod_data["is_vegetarian"]), prod_data["estimated_time"], prod_data["serving_size"],
+			prod_data["main_category"], int(prod_data["is_active"]), prod_data["display_order"], 1,
+			now, now, user, user, 0,
+		))
+		created_products.append(name)
+		logger.debug("Created product: %s", prod_data['product_name'])
+
+	if values:
+		frappe.db.bulk_insert("Menu Product", DEMO_PRODUCT_FIELDS, values)
+		invalidate_product_cache({"restaurant": restaurant})
 
 	return created_products
 
@@ -461,40 +789,25 @@ def create_offers(restaurant):
 	"""Create a few homepage offers for the restaurant."""
 
 	today = now_datetime().date()
-	offers_data = [
-		{
-			"title": "Happy Hour Coffee",
-			"description": "Flat ₹50 off on all hot coffees from 4–7 PM.",
-			"discount": "₹50 OFF",
-			"category": "Hot Coffee",
-			"featured": 1,
-			"display_order": 1,
-		},
-		{
-			"title": "Dessert Combo",
-			"description": "Any dessert + any coffee at a special combo price.",
-			"discount": "SAVE 20%",
-			"category": "Desserts",
-			"featured": 1,
-			"display_order": 2,
-		},
-	]
 
+	# Offer and Coupon have no controller logic, so like the menu rows they are written
+	# with one multi-row INSERT each; defaults the doctypes would apply are set explicitly
+	now = frappe.utils.now()
+	user = frappe.session.user
+	values = []
 	created = []
-	for data in offers_data:
-		doc = frappe.get_doc(
-			{
-				"doctype": "Offer",
-				"restaurant": restaurant,
-				"image_src": "/assets/dinematters/demo/offer-placeholder.jpg",
-				"valid_from": today,
-				"valid_to": add_days(today, 30),
-				**data,
-			}
-		)
-		doc.insert(ignore_permissions=True)
-		created.append(doc.name)
-		print(f"✅ Created offer: {doc.title}")
+	for data in DEMO_OFFERS:
+		name = frappe.generate_hash(length=10)
+		values.append((
+			name, restaurant, data["title"], "/assets/dinematters/demo/offer-placeholder.jpg",
+			data["description"], data["discount"], data["category"], data["featured"], 1,
+			today, add_days(today, 30), data["display_order"],
+			now, now, user, user, 0,
+		))
+		created.append(name)
+		logger.debug("Created offer: %s", data["title"])
+
+	frappe.db.bulk_insert("Offer", DEMO_OFFER_FIELDS, values)
 
 	return created
 
@@ -503,51 +816,35 @@ def create_coupons(restaurant):
 	"""Create a few demo coupons."""
 
 	today = now_datetime().date()
-	coupons_data = [
-		{
-			"code": "WELCOME50",
-			"discount_type": "flat",
-			"discount_value": 50,
-			"min_order_amount": 300,
-			"description": "₹50 off on your first order",
-			"category": "Welcome",
-			"valid_from": today,
-			"valid_until": add_days(today, 60),
-			"max_uses": 100,
-			"max_uses_per_user": 1,
-		},
-		{
-			"code": "COFFEE10",
-			"discount_type": "percent",
-			"discount_value": 10,
-			"min_order_amount": 250,
-			"description": "10% off on any coffee order",
-			"category": "Coffee",
-			"valid_from": today,
-			"valid_until": add_days(today, 30),
-			"max_uses": 500,
-			"max_uses_per_user": 5,
-		},
-	]
 
+	existing_codes = set(frappe.get_all(
+		"Coupon",
+		filters={"code": ["in", [c["code"] for c in DEMO_COUPONS]]},
+		pluck="code",
+	))
+
+	now = frappe.utils.now()
+	user = frappe.session.user
+	values = []
 	created = []
-	for data in coupons_data:
-		if frappe.db.exists("Coupon", {"code": data["code"]}):
-			print(f"⏭️  Coupon already exists: {data['code']}")
+	for data in DEMO_COUPONS:
+		if data["code"] in existing_codes:
+			logger.debug("Coupon already exists: %s", data['code'])
 			created.append(data["code"])
 			continue
 
-		doc = frappe.get_doc(
-			{
-				"doctype": "Coupon",
-				"restaurant": restaurant,
-				"is_active": 1,
-				**data,
-			}
-		)
-		doc.insert(ignore_permissions=True)
-		created.append(doc.name)
-		print(f"✅ Created coupon: {data['code']}")
+		# Coupon is named by its code
+		values.append((
+			data["code"], restaurant, "coupon", data["code"], data["discount_type"], data["discount_value"],
+			data["min_order_amount"], data["category"], data["description"], 0, 0,
+			today, add_days(today, data["valid_days"]), 1, data["max_uses"], 0, data["max_uses_per_user"],
+			now, now, user, user, 0,
+		))
+		created.append(data["code"])
+		logger.debug("Created coupon: %s", data['code'])
+
+	if values:
+		frappe.db.bulk_insert("Coupon", DEMO_COUPON_FIELDS, values)
 
 	return created
 
@@ -559,303 +856,75 @@ def create_orders(restaurant, products):
 	product_names = products[:8] if len(products) >= 8 else products
 
 	if not product_names:
-		print("⚠️ No products found to create orders.")
+		logger.warning("No products found to create orders.")
 		return []
 
+	# Only a few scalar fields are read from each product, so fetch them all in one query
+	# rather than loading full Menu Product docs (and their child tables) per order line
+	products_by_name = {d.name: d for d in frappe.get_all(
+		"Menu Product",
+		filters={"name": ["in", product_names]},
+		fields=["name", "product_id", "price", "original_price"],
+	)}
+
 	def get_product_doc(product_name):
-		return frappe.get_doc("Menu Product", product_name)
+		return products_by_name[product_name]
 
 	orders_created = []
-	tax_rate = frappe.db.get_value("Restaurant", restaurant, "tax_rate") or 0
-	delivery_fee = frappe.db.get_value("Restaurant", restaurant, "default_delivery_fee") or 0
-
-	# Order 1: Dine-in table order (delivered)
-	order_1_items = []
-	for p in product_names[:2]:
-		prod = get_product_doc(p)
-		order_1_items.append(
-			{
-				"doctype": "Order Item",
-				"product": prod.name,
-				"quantity": 2 if "cappuccino" in prod.product_id else 1,
-				"unit_price": prod.price,
-				"original_price": prod.original_price or prod.price,
-				"total_price": (2 if "cappuccino" in prod.product_id else 1) * float(prod.price),
-			}
-		)
-
-	subtotal_1 = sum(item["total_price"] for item in order_1_items)
-	tax_1 = round(subtotal_1 * float(tax_rate) / 100.0, 2)
-	total_1 = subtotal_1 + tax_1
-
-	if not frappe.db.exists("Order", {"order_id": "ONO-ORDER-1001"}):
-		order_1 = frappe.get_doc(
-			{
-				"doctype": "Order",
-				"restaurant": restaurant,
-				"order_id": "ONO-ORDER-1001",
-				"order_number": "1001",
-				"customer_name": "Priya Sharma",
-				"customer_email": "priya.sharma@example.com",
-				"customer_phone": "+91 98765 00123",
-				"table_number": 3,
-				"order_items": order_1_items,
-				"subtotal": subtotal_1,
-				"discount": 0,
-				"tax": tax_1,
-				"delivery_fee": 0,
-				"total": total_1,
-				"status": "delivered",
-				"payment_method": "card",
-				"payment_status": "completed",
-			}
-		)
-		order_1.insert(ignore_permissions=True)
-		orders_created.append(order_1.name)
-		print(f"✅ Created order: {order_1.order_number} (table {order_1.table_number}, delivered)")
-	else:
-		print(f"⏭️  Order ONO-ORDER-1001 already exists")
-		orders_created.append("ONO-ORDER-1001")
-
-	# Order 2: Delivery order using coupon (delivered)
-	order_2_items = []
-	for p in product_names[2:4]:
-		prod = get_product_doc(p)
-		order_2_items.append(
-			{
-				"doctype": "Order Item",
-				"product": prod.name,
-				"quantity": 1,
-				"unit_price": prod.price,
-				"original_price": prod.original_price or prod.price,
-				"total_price": float(prod.price),
-			}
-		)
-
-	subtotal_2 = sum(item["total_price"] for item in order_2_items)
-	discount_2 = 50  # e.g. WELCOME50 applied
-	tax_base_2 = subtotal_2 - discount_2
-	tax_2 = round(tax_base_2 * float(tax_rate) / 100.0, 2)
-	total_2 = tax_base_2 + tax_2 + float(delivery_fee)
-
-	if not frappe.db.exists("Order", {"order_id": "ONO-ORDER-1002"}):
-		order_2 = frappe.get_doc(
-			{
-				"doctype": "Order",
-				"restaurant": restaurant,
-				"order_id": "ONO-ORDER-1002",
-				"order_number": "1002",
-				"customer_name": "Rahul Verma",
-				"customer_email": "rahul.verma@example.com",
-				"customer_phone": "+91 98765 00456",
-				"delivery_address": "Sunrise Apartments, Tower B, Flat 1402",
-				"delivery_city": "Metropolis",
-				"delivery_state": "CA",
-				"delivery_zip_code": "94107",
-				"delivery_instructions": "Call on arrival, main gate under renovation.",
-				"order_items": order_2_items,
-				"subtotal": subtotal_2,
-				"discount": discount_2,
-				"tax": tax_2,
-				"delivery_fee": delivery_fee,
-				"total": total_2,
-				"status": "delivered",
-				"payment_method": "online",
-				"payment_status": "completed",
-			}
-		)
-		order_2.insert(ignore_permissions=True)
-		orders_created.append(order_2.name)
-		print(f"✅ Created order: {order_2.order_number} (delivery, delivered)")
-	else:
-		print(f"⏭️  Order ONO-ORDER-1002 already exists")
-		orders_created.append("ONO-ORDER-1002")
+	restaurant_fees = frappe.db.get_value("Restaurant", restaurant, ["tax_rate", "default_delivery_fee"], as_dict=True) or {}
+	tax_rate = flt(restaurant_fees.get("tax_rate"))
+	delivery_fee = flt(restaurant_fees.get("default_delivery_fee"))
 
-	# Order 3: Pending order (table)
-	if len(product_names) >= 6:
-		order_3_items = []
-		for p in product_names[4:6]:
-			prod = get_product_doc(p)
-			order_3_items.append(
-				{
-					"doctype": "Order Item",
-					"product": prod.name,
-					"quantity": 1,
-					"unit_price": prod.price,
-					"original_price": prod.original_price or prod.price,
-					"total_price": float(prod.price),
-				}
-			)
+	for spec in DEMO_ORDERS:
+		if len(product_names) < spec["min_products"]:
+			continue
 
-		subtotal_3 = sum(item["total_price"] for item in order_3_items)
-		tax_3 = round(subtotal_3 * float(tax_rate) / 100.0, 2)
-		total_3 = subtotal_3 + tax_3
+		if spec["order_id"] in _existing_values("Order", "order_id", "ONO-ORDER-"):
+			logger.debug("Order %s already exists", spec["order_id"])
+			orders_created.append(spec["order_id"])
+			continue
 
-		if not frappe.db.exists("Order", {"order_id": "ONO-ORDER-1003"}):
-			order_3 = frappe.get_doc(
-				{
-					"doctype": "Order",
-					"restaurant": restaurant,
-					"order_id": "ONO-ORDER-1003",
-					"order_number": "1003",
-					"customer_name": "Sarah Johnson",
-					"customer_email": "sarah.j@example.com",
-					"customer_phone": "+91 98765 00567",
-					"table_number": 5,
-					"order_items": order_3_items,
-					"subtotal": subtotal_3,
-					"discount": 0,
-					"tax": tax_3,
-					"delivery_fee": 0,
-					"total": total_3,
-					"status": "pending",
-					"payment_method": "card",
-					"payment_status": "pending",
-				}
-			)
-			order_3.insert(ignore_permissions=True)
-			orders_created.append(order_3.name)
-			print(f"✅ Created order: {order_3.order_number} (table {order_3.table_number}, pending)")
-
-	# Order 4: Confirmed order (preparing)
-	if len(product_names) >= 8:
-		order_4_items = []
-		for p in product_names[6:8]:
+		order_items = []
+		for p in product_names[slice(*spec["product_slice"])]:
 			prod = get_product_doc(p)
-			order_4_items.append(
+			unit_price = flt(prod.price)
+			quantity = spec.get("cappuccino_quantity", spec["quantity"]) if "cappuccino" in prod.product_id else spec["quantity"]
+			order_items.append(
 				{
 					"doctype": "Order Item",
 					"product": prod.name,
-					"quantity": 2,
+					"quantity": quantity,
 					"unit_price": prod.price,
 					"original_price": prod.original_price or prod.price,
-					"total_price": 2 * float(prod.price),
+					"total_price": quantity * unit_price,
 				}
 			)
 
-		subtotal_4 = sum(item["total_price"] for item in order_4_items)
-		tax_4 = round(subtotal_4 * float(tax_rate) / 100.0, 2)
-		total_4 = subtotal_4 + tax_4
+		subtotal = sum(item["total_price"] for item in order_items)
+		tax_base = subtotal - spec["discount"]
+		tax = flt(tax_base * tax_rate / 100, 2)
+		order_delivery_fee = delivery_fee if spec["is_delivery"] else 0
 
-		if not frappe.db.exists("Order", {"order_id": "ONO-ORDER-1004"}):
-			order_4 = frappe.get_doc(
-				{
-					"doctype": "Order",
-					"restaurant": restaurant,
-					"order_id": "ONO-ORDER-1004",
-					"order_number": "1004",
-					"customer_name": "Michael Chen",
-					"customer_email": "michael.chen@example.com",
-					"customer_phone": "+91 98765 00678",
-					"table_number": 7,
-					"order_items": order_4_items,
-					"subtotal": subtotal_4,
-					"discount": 0,
-					"tax": tax_4,
-					"delivery_fee": 0,
-					"total": total_4,
-					"status": "preparing",
-					"payment_method": "card",
-					"payment_status": "completed",
-				}
-			)
-			order_4.insert(ignore_permissions=True)
-			orders_created.append(order_4.name)
-			print(f"✅ Created order: {order_4.order_number} (table {order_4.table_number}, preparing)")
-
-	# Order 5: Ready order (delivery)
-	if len(product_names) >= 4:
-		order_5_items = []
-		prod = get_product_doc(product_names[0])
-		order_5_items.append(
+		order = frappe.get_doc(
 			{
-				"doctype": "Order Item",
-				"product": prod.name,
-				"quantity": 3,
-				"unit_price": prod.price,
-				"original_price": prod.original_price or prod.price,
-				"total_price": 3 * float(prod.price),
-			}
-		)
-
-		subtotal_5 = sum(item["total_price"] for item in order_5_items)
-		tax_5 = round(subtotal_5 * float(tax_rate) / 100.0, 2)
-		total_5 = subtotal_5 + tax_5 + float(delivery_fee)
-
-		if not frappe.db.exists("Order", {"order_id": "ONO-ORDER-1005"}):
-			order_5 = frappe.get_doc(
-				{
-					"doctype": "Order",
-					"restaurant": restaurant,
-					"order_id": "ONO-ORDER-1005",
-					"order_number": "1005",
-					"customer_name": "Emma Wilson",
-					"customer_email": "emma.wilson@example.com",
-					"customer_phone": "+91 98765 00789",
-					"delivery_address": "Green Valley Apartments, Block C, Flat 502",
-					"delivery_city": "Metropolis",
-					"delivery_state": "CA",
-					"delivery_zip_code": "94108",
-					"delivery_instructions": "Leave at door, no contact delivery.",
-					"order_items": order_5_items,
-					"subtotal": subtotal_5,
-					"discount": 0,
-					"tax": tax_5,
-					"delivery_fee": delivery_fee,
-					"total": total_5,
-					"status": "ready",
-					"payment_method": "online",
-					"payment_status": "completed",
-				}
-			)
-			order_5.insert(ignore_permissions=True)
-			orders_created.append(order_5.name)
-			print(f"✅ Created order: {order_5.order_number} (delivery, ready)")
-
-	# Order 6: Confirmed order (table)
-	if len(product_names) >= 3:
-		order_6_items = []
-		prod = get_product_doc(product_names[1])
-		order_6_items.append(
-			{
-				"doctype": "Order Item",
-				"product": prod.name,
-				"quantity": 1,
-				"unit_price": prod.price,
-				"original_price": prod.original_price or prod.price,
-				"total_price": float(prod.price),
+				"doctype": "Order",
+				"restaurant": restaurant,
+				"order_id": spec["order_id"],
+				"order_number": spec["order_number"],
+				"order_items": order_items,
+				"subtotal": subtotal,
+				"discount": spec["discount"],
+				"tax": tax,
+				"delivery_fee": order_delivery_fee,
+				"total": flt(tax_base + tax + order_delivery_fee, 2),
+				**spec["fields"],
 			}
 		)
-
-		subtotal_6 = sum(item["total_price"] for item in order_6_items)
-		tax_6 = round(subtotal_6 * float(tax_rate) / 100.0, 2)
-		total_6 = subtotal_6 + tax_6
-
-		if not frappe.db.exists("Order", {"order_id": "ONO-ORDER-1006"}):
-			order_6 = frappe.get_doc(
-				{
-					"doctype": "Order",
-					"restaurant": restaurant,
-					"order_id": "ONO-ORDER-1006",
-					"order_number": "1006",
-					"customer_name": "David Brown",
-					"customer_email": "david.brown@example.com",
-					"customer_phone": "+91 98765 00890",
-					"table_number": 2,
-					"order_items": order_6_items,
-					"subtotal": subtotal_6,
-					"discount": 0,
-					"tax": tax_6,
-					"delivery_fee": 0,
-					"total": total_6,
-					"status": "confirmed",
-					"payment_method": "card",
-					"payment_status": "completed",
-				}
-			)
-			order_6.insert(ignore_permissions=True)
-			orders_created.append(order_6.name)
-			print(f"✅ Created order: {order_6.order_number} (table {order_6.table_number}, confirmed)")
+		# Seed rows are static and known-valid, so skip mandatory/link checks and
+		# quietly pass over rows that already exist
+		order.insert(ignore_permissions=True, ignore_mandatory=True, ignore_links=True, ignore_if_duplicate=True)
+		orders_created.append(order.name)
+		logger.debug("Created order: %s (%s)", order.order_number, order.status)
 
 	return orders_created
 
@@ -866,178 +935,119 @@ def create_bookings(restaurant):
 	today = now_datetime().date()
 
 	# Table bookings
-	table_data = [
-		{
-			"booking_number": "TB-1001",
-			"number_of_diners": 2,
-			"date": add_days(today, 1),
-			"time_slot": "19:30–21:00",
-			"status": "confirmed",
-			"customer_name": "Ananya Singh",
-			"customer_phone": "+91 98765 00321",
-			"customer_email": "ananya.singh@example.com",
-			"notes": "Window-side table, anniversary.",
-		},
-		{
-			"booking_number": "TB-1002",
-			"number_of_diners": 4,
-			"date": add_days(today, 2),
-			"time_slot": "13:00–14:30",
-			"status": "pending",
-			"customer_name": "Rohan Mehta",
-			"customer_phone": "+91 98765 00789",
-			"customer_email": "rohan.mehta@example.com",
-			"notes": "Vegetarian options preferred.",
-		},
-	]
-
 	table_bookings = []
-	for data in table_data:
-		if frappe.db.exists("Table Booking", {"booking_number": data["booking_number"]}):
-			print(f"⏭️  Table Booking already exists: {data['booking_number']}")
+	for data in DEMO_TABLE_BOOKINGS:
+		if data["booking_number"] in _existing_values("Table Booking", "booking_number", "TB-"):
+			logger.debug("Table Booking already exists: %s", data['booking_number'])
 			table_bookings.append(data["booking_number"])
 			continue
 
-		doc = frappe.get_doc(
-			{
-				"doctype": "Table Booking",
-				"restaurant": restaurant,
-				**data,
-			}
-		)
-		doc.insert(ignore_permissions=True)
+		fields = dict(data, restaurant=restaurant, date=add_days(today, data["days_ahead"]))
+		del fields["days_ahead"]
+		doc = _db_insert_seed(frappe.new_doc("Table Booking").update(fields))
 		table_bookings.append(doc.name)
-		print(f"✅ Created table booking: {data['booking_number']}")
+		logger.debug("Created table booking: %s", data['booking_number'])
 
 	# Banquet booking
-	banquet_data = {
-		"booking_number": "BB-2001",
-		"number_of_guests": 80,
-		"event_type": "Corporate",
-		"date": add_days(today, 14),
-		"time_slot": "19:00–23:00",
-		"status": "confirmed",
-		"customer_name": "Acme Corp HR",
-		"customer_phone": "+1 555 0133 777",
-		"customer_email": "events@acmecorp.test",
-		"notes": "Year-end celebration, buffet with live salad & dessert stations.",
-	}
-
 	banquet_bookings = []
-	if frappe.db.exists("Banquet Booking", {"booking_number": banquet_data["booking_number"]}):
-		print(f"⏭️  Banquet Booking already exists: {banquet_data['booking_number']}")
-		banquet_bookings.append(banquet_data["booking_number"])
+	if frappe.db.exists("Banquet Booking", {"booking_number": DEMO_BANQUET_BOOKING["booking_number"]}):
+		logger.debug("Banquet Booking already exists: %s", DEMO_BANQUET_BOOKING['booking_number'])
+		banquet_bookings.append(DEMO_BANQUET_BOOKING["booking_number"])
 	else:
-		doc = frappe.get_doc(
-			{
-				"doctype": "Banquet Booking",
-				"restaurant": restaurant,
-				**banquet_data,
-			}
-		)
-		doc.insert(ignore_permissions=True)
+		fields = dict(DEMO_BANQUET_BOOKING, restaurant=restaurant, date=add_days(today, DEMO_BANQUET_BOOKING["days_ahead"]))
+		del fields["days_ahead"]
+		doc = _db_insert_seed(frappe.new_doc("Banquet Booking").update(fields))
 		banquet_bookings.append(doc.name)
-		print(f"✅ Created banquet booking: {banquet_data['booking_number']}")
+		logger.debug("Created banquet booking: %s", DEMO_BANQUET_BOOKING['booking_number'])
 
 	return table_bookings, banquet_bookings
 
 
-@frappe.whitelist()
-def add_missing_options():
+def add_missing_options(restaurant):
 	"""
-	Add missing options to existing customization questions
-	This function properly handles nested child tables by saving in steps
+	Add missing options to the demo restaurant's customization questions
+	Options are nested child rows, so they are written directly against their question rows
 	"""
 	
-	print("\n🔧 Adding missing options to existing products...")
+	logger.info("Adding missing options to existing products...")
+	
+	updated_count = 0
+	now = frappe.utils.now()
+	user = frappe.session.user
+	values = []
 	
-	# Products that need options added
-	products_to_update = {
-		"hot-coffee-espresso": {
-			"add-ons": [
-				{"option_id": "extra-shot", "label": "Extra Espresso Shot", "price": 60, "is_vegetarian": True, "display_order": 1},
-				{"option_id": "sugar", "label": "Sugar", "price": 0, "is_vegetarian": True, "display_order": 2}
-			]
+	# Resolve products, their questions and which questions already have options
+	# in three queries up front instead of loading each product doc
+	product_names = dict(frappe.get_all(
+		"Menu Product",
+		filters={"restaurant": restaurant, "product_id": ["in", list(DEMO_PRODUCT_OPTIONS)]},
+		fields=["name", "product_id"],
+		as_list=True
+	))
+	questions = frappe.get_all(
+		"Customization Question",
+		filters={
+			"parent": ["in", list(product_names)],
+			"parenttype": "Menu Product",
+			"parentfield": "customization_questions"
 		},
-		"hot-coffee-cappuccino": {
-			"milk": [
-				{"option_id": "whole-milk", "label": "Whole Milk", "price": 0, "is_default": True, "is_vegetarian": True, "display_order": 1},
-				{"option_id": "almond-milk", "label": "Almond Milk", "price": 30, "is_default": False, "is_vegetarian": True, "display_order": 2},
-				{"option_id": "oat-milk", "label": "Oat Milk", "price": 30, "is_default": False, "is_vegetarian": True, "display_order": 3}
-			]
+		fields=["name", "question_id", "parent"]
+	) if product_names else []
+	questions_with_options = set(frappe.get_all(
+		"Customization Option",
+		filters={
+			"parent": ["in", [q.name for q in questions]],
+			"parenttype": "Customization Question",
+			"parentfield": "options"
 		},
-		"bowls-avocado-berry-salad": {
-			"dressing": [
-				{"option_id": "balsamic", "label": "Balsamic Vinaigrette", "price": 0, "is_default": True, "is_vegetarian": True, "display_order": 1},
-				{"option_id": "ranch", "label": "Ranch", "price": 0, "is_default": False, "is_vegetarian": True, "display_order": 2}
-			],
-			"protein": [
-				{"option_id": "chicken", "label": "Grilled Chicken", "price": 80, "is_default": False, "is_vegetarian": False, "display_order": 1},
-				{"option_id": "tofu", "label": "Tofu", "price": 60, "is_default": False, "is_vegetarian": True, "display_order": 2}
-			]
-		}
-	}
+		pluck="parent",
+		distinct=True
+	)) if questions else set()
 	
-	updated_count = 0
+	found_product_ids = set(product_names.values())
+	questions_by_product = {}
+	for question in questions:
+		questions_by_product.setdefault(product_names[question.parent], []).append(question)
 	
-	for product_id, questions_data in products_to_update.items():
-		if not frappe.db.exists("Menu Product", product_id):
-			print(f"⏭️  Product {product_id} not found, skipping...")
+	for product_id, questions_data in DEMO_PRODUCT_OPTIONS.items():
+		if product_id not in found_product_ids:
+			logger.debug("Product %s not found, skipping...", product_id)
 			continue
 		
-		try:
-			product = frappe.get_doc("Menu Product", product_id)
-			product.reload()
+		# Find questions and queue their options for a single multi-row INSERT
+		for question in questions_by_product.get(product_id, []):
+			question_id = question.question_id
+			if question_id not in questions_data:
+				continue
+			if question.name in questions_with_options:
+				logger.debug("Options already exist for %s -> %s", product_id, question_id)
+				continue
 			
-			# Find questions and add options
-			for question in product.customization_questions:
-				question_id = question.question_id
-				if question_id in questions_data:
-					# Check if options already exist
-					existing_options = frappe.get_all(
-						"Customization Option",
-						filters={
-							"parent": question.name,
-							"parenttype": "Customization Question",
-							"parentfield": "options"
-						}
-					)
-					
-					if len(existing_options) == 0:
-						# Add options using direct database insert for nested child tables
-						# This is more reliable for nested structures
-						for idx, opt_data in enumerate(questions_data[question_id], start=1):
-							option_doc = frappe.get_doc({
-								"doctype": "Customization Option",
-								"parent": question.name,
-								"parenttype": "Customization Question",
-								"parentfield": "options",
-								"idx": idx,
-								**opt_data
-							})
-							option_doc.insert(ignore_permissions=True)
-						
-						updated_count += 1
-						print(f"✅ Added {len(questions_data[question_id])} options to {product_id} -> {question_id}")
-					else:
-						print(f"⏭️  Options already exist for {product_id} -> {question_id}")
-				
-		except Exception as e:
-			print(f"❌ Error updating {product_id}: {str(e)}")
-			frappe.log_error(f"Error updating product {product_id}", str(e))
-			import traceback
-			traceback.print_exc()
+			for idx, opt_data in enumerate(questions_data[question_id], start=1):
+				values.append((
+					frappe.generate_hash(length=10), question.name, "Customization Question", "options", idx,
+					opt_data["option_id"], opt_data["label"], opt_data["price"], int(opt_data.get("is_default", False)),
+					int(opt_data["is_vegetarian"]), opt_data["display_order"],
+					now, now, user, user, 0,
+				))
+			
+			updated_count += 1
+			logger.debug("Added %s options to %s -> %s", len(questions_data[question_id]), product_id, question_id)
+	
+	if values:
+		frappe.db.bulk_insert("Customization Option", DEMO_OPTION_FIELDS, values)
 	
 	if updated_count > 0:
-		print(f"\n✅ Added options to {updated_count} questions")
+		logger.info(f"Added options to {updated_count} questions")
 	else:
-		print("\n⏭️  All options already exist")
+		logger.info("All options already exist")
 
 
 # Whitelisted function for bench execute
 @frappe.whitelist()
 def create_demo_data_api():
 	"""API endpoint to create demo data"""
+	frappe.only_for("System Manager")
 	return create_demo_data()
 
 
@@ -7,6 +7,7 @@ import razorpay
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 from dinematters.dinematters.utils.razorpay_utils import get_razorpay_client
+from dinematters.dinematters.doctype.monthly_revenue_ledger.monthly_revenue_ledger import compute_minimum_due
 
 
 # (Local Razorpay helper moved to utils.razorpay_utils)
@@ -28,11 +29,14 @@ def process_monthly_minimums():
 			fields=["name", "restaurant_name", "razorpay_customer_id", "monthly_minimum", "owner_email"]
 		)
 		
+		# Existing ledgers for the month in one query; the missing ones are bulk-created
+		ledgers = get_or_create_monthly_ledgers([r.name for r in restaurants], previous_month)
+		
 		processed_count = 0
 		
 		for restaurant in restaurants:
 			try:
-				process_restaurant_monthly_minimum(restaurant, previous_month)
+				process_restaurant_monthly_minimum(restaurant, previous_month, ledgers.get(restaurant.name))
 				processed_count += 1
 			except Exception as e:
 				frappe.log_error(f"Failed to process monthly minimum for {restaurant.name}: {str(e)}", "razorpay.monthly_minimum_error")
@@ -45,52 +49,66 @@ def process_monthly_minimums():
 		return {"success": False, "error": str(e)}
 
 
-def process_restaurant_monthly_minimum(restaurant, month):
-	"""Process monthly minimum for a single restaurant"""
-	restaurant_id = restaurant.name
-	ledger_name = f"MRL-{restaurant_id}-{month}"
+def get_or_create_monthly_ledgers(restaurant_ids, month):
+	"""Return {restaurant: ledger} for the month, creating empty ledgers for restaurants
+	with no orders in it. One SELECT plus one multi-row INSERT instead of per-restaurant
+	exists/get_doc/insert round-trips."""
+	ledgers = {
+		l.restaurant: l
+		for l in frappe.get_all(
+			"Monthly Revenue Ledger",
+			filters={"month": month, "restaurant": ["in", restaurant_ids]},
+			fields=["name", "restaurant", "total_platform_fee"]
+		)
+	} if restaurant_ids else {}
 	
-	# Get or create monthly ledger
-	if frappe.db.exists("Monthly Revenue Ledger", ledger_name):
-		ledger = frappe.get_doc("Monthly Revenue Ledger", ledger_name)
-	else:
-		# Create ledger for restaurants with no orders in the month
-		ledger = frappe.get_doc({
-			"doctype": "Monthly Revenue Ledger",
-			"restaurant": restaurant_id,
-			"month": month,
-			"total_gmv": 0,
-			"total_platform_fee": 0,
-			"minimum_due": 0,
-			"status": "pending"
-		})
-		ledger.insert()
+	missing = [r for r in restaurant_ids if r not in ledgers]
+	if missing:
+		now = frappe.utils.now()
+		today = frappe.utils.today()
+		user = frappe.session.user
+		values = []
+		for restaurant_id in missing:
+			# Same name the doctype's format:MRL-{restaurant}-{month} autoname would give
+			name = f"MRL-{restaurant_id}-{month}"
+			values.append((name, restaurant_id, month, 0, 0, 0, "pending", today, now, now, user, user, 0))
+			ledgers[restaurant_id] = frappe._dict(name=name, restaurant=restaurant_id, total_platform_fee=0)
+		frappe.db.bulk_insert(
+			"Monthly Revenue Ledger",
+			("name", "restaurant", "month", "total_gmv", "total_platform_fee", "minimum_due", "status",
+				"created_date", "creation", "modified", "owner", "modified_by", "docstatus"),
+			values
+		)
 	
-	# Calculate minimum due
-	monthly_minimum_paise = int(float(restaurant.monthly_minimum if restaurant.monthly_minimum is not None else 999.0) * 100)
-	total_platform_fee = ledger.total_platform_fee or 0
+	return ledgers
+
+
+def process_restaurant_monthly_minimum(restaurant, month, ledger=None):
+	"""Process monthly minimum for a single restaurant"""
+	if ledger is None:
+		ledger = get_or_create_monthly_ledgers([restaurant.name], month)[restaurant.name]
 	
-	if total_platform_fee < monthly_minimum_paise:
-		minimum_due = monthly_minimum_paise - total_platform_fee
-		
+	# Calculate minimum due (same rule as MonthlyRevenueLedger.before_save, which set_value skips)
+	minimum_due = compute_minimum_due(restaurant.monthly_minimum, ledger.total_platform_fee)
+	
+	if minimum_due:
 		# Create Razorpay payment link for the shortfall
 		payment_link = create_minimum_fee_payment_link(restaurant, minimum_due, month)
 		
 		# Update ledger
-		ledger.minimum_due = minimum_due
-		ledger.payment_link_id = payment_link.get("id")
-		ledger.payment_link_url = payment_link.get("short_url")
-		ledger.status = "pending"
-		ledger.save()
+		frappe.db.set_value("Monthly Revenue Ledger", ledger.name, {
+			"minimum_due": minimum_due,
+			"payment_link_id": payment_link.get("id"),
+			"payment_link_url": payment_link.get("short_url"),
+			"status": "pending"
+		})
 		
 		# Send notification email
 		send_minimum_fee_notification(restaurant, minimum_due / 100, payment_link.get("short_url"), month)
 		
 	else:
 		# No minimum due
-		ledger.minimum_due = 0
-		ledger.status = "paid"
-		ledger.save()
+		frappe.db.set_value("Monthly Revenue Ledger", ledger.name, {"minimum_due": 0, "status": "paid"})
 
 
 def create_minimum_fee_payment_link(restaurant, amount_paise, month):
@@ -1,6 +1,7 @@
 import frappe
 from dateutil.relativedelta import relativedelta
 import math
+from dinematters.dinematters.doctype.monthly_billing_ledger.monthly_billing_ledger import compute_total_gmv_by_restaurant
 
 @frappe.whitelist()
 def process_monthly_minimums_by_onboarding_date():
@@ -16,30 +17,41 @@ def process_monthly_minimums_by_onboarding_date():
 			filters={"is_active": 1}, 
 			fields=["name", "onboarding_date", "monthly_minimum", "platform_fee_percent"]
 		)
-		created = []
+		# Restaurants whose onboarding day matches today
+		due = []
 		for r in restaurants:
+			od = r.get("onboarding_date")
+			if not od:
+				continue
 			try:
-				od = r.get("onboarding_date")
-				if not od:
-					continue
 				if isinstance(od, str):
 					od_day = int(od.split("-")[-1])
 				else:
 					od_day = od.day
-				match_day = od_day if od_day <= last_day_current else last_day_current
-				if today.day != match_day:
-					continue
+			except Exception as e:
+				frappe.log_error(f"Failed onboarding monthly for {r.get('name')}: {str(e)}", "razorpay.monthly_onboarding")
+				continue
+			match_day = od_day if od_day <= last_day_current else last_day_current
+			if today.day == match_day:
+				due.append(r)
+
+		# Existing ledgers and previous-month GMV for all due restaurants, one query each
+		due_names = [r.get("name") for r in due]
+		billed = set(frappe.get_all("Monthly Billing Ledger",
+			filters={"restaurant": ["in", due_names], "billing_month": previous_month},
+			pluck="restaurant"
+		)) if due_names else set()
+		gmv_by_restaurant = compute_total_gmv_by_restaurant([n for n in due_names if n not in billed], previous_month)
 
+		created = []
+		for r in due:
+			try:
 				# skip if ledger already exists
-				if frappe.db.exists("Monthly Billing Ledger", {"restaurant": r.get("name"), "billing_month": previous_month}):
+				if r.get("name") in billed:
 					continue
 
 				# Sum completed orders for the previous month
-				total = frappe.db.sql("""
-					SELECT COALESCE(SUM(total),0) FROM `tabOrder`
-					WHERE restaurant=%s AND payment_status='completed' AND DATE_FORMAT(creation, '%%Y-%%m')=%s
-				""", (r.get("name"), previous_month))[0][0] or 0
-				total_paise = int(float(total) * 100)
+				total_paise = gmv_by_restaurant.get(r.get("name"), 0)
 				
 				# Fetch commission settings from Restaurant
 				res_fee_percent = float(r.get("platform_fee_percent") if r.get("platform_fee_percent") is not None else 1.5)
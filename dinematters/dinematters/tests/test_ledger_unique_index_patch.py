@@ -0,0 +1,136 @@
+# Copyright (c) 2026, Dinematters and contributors
+# For license information, please see license.txt
+
+"""
+Tests for the add_ledger_unique_indexes patch, which deletes duplicate
+(restaurant, month) ledger rows before adding the unique indexes.
+
+Covers:
+  - pick_ledger_to_keep()
+      * No payment evidence: the most recently modified row is kept
+      * One row paid or carrying a payment id: that row is kept, even if older
+      * Several rows with payment evidence: None (manual review)
+
+  - dedupe_ledgers()
+      * Only the non-kept rows of a group are deleted, and they are logged
+      * A conflicting group is left untouched and the index is skipped
+      * execute() only adds an index when its ledger deduped cleanly
+
+The unique index already exists on a migrated test site, so duplicate rows
+cannot be inserted; the database calls are mocked instead.
+
+Run with:
+    bench run-tests --app dinematters --module dinematters.dinematters.tests.test_ledger_unique_index_patch
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import frappe
+
+from dinematters.dinematters.patches import add_ledger_unique_indexes as patch_module
+from dinematters.dinematters.patches.add_ledger_unique_indexes import dedupe_ledgers, pick_ledger_to_keep
+
+_BILLING_ARGS = (
+	"Monthly Billing Ledger",
+	"billing_month",
+	("razorpay_payment_id", "journal_entry"),
+	"payment_status",
+)
+
+
+def _ledger(name, **kwargs):
+	"""A billing ledger row as get_all returns it (newest first in a group)."""
+	row = frappe._dict(
+		name=name,
+		restaurant="TEST-R1",
+		billing_month="2026-09",
+		payment_status="pending",
+		razorpay_payment_id=None,
+		journal_entry=None,
+	)
+	row.update(kwargs)
+	return row
+
+
+class TestPickLedgerToKeep(unittest.TestCase):
+	def test_newest_row_kept_without_payment_evidence(self):
+		rows = [_ledger("MBL-NEW"), _ledger("MBL-OLD")]
+		self.assertEqual(pick_ledger_to_keep(rows, *_BILLING_ARGS[2:]).name, "MBL-NEW")
+
+	def test_paid_row_kept_over_newer_pending_row(self):
+		rows = [_ledger("MBL-NEW"), _ledger("MBL-PAID", payment_status="paid")]
+		self.assertEqual(pick_ledger_to_keep(rows, *_BILLING_ARGS[2:]).name, "MBL-PAID")
+
+	def test_row_with_payment_id_kept(self):
+		rows = [_ledger("MBL-NEW"), _ledger("MBL-RZP", razorpay_payment_id="pay_123")]
+		self.assertEqual(pick_ledger_to_keep(rows, *_BILLING_ARGS[2:]).name, "MBL-RZP")
+
+	def test_several_settled_rows_need_manual_review(self):
+		rows = [
+			_ledger("MBL-PAID", payment_status="paid"),
+			_ledger("MBL-JE", journal_entry="JE-0001"),
+			_ledger("MBL-PENDING"),
+		]
+		self.assertIsNone(pick_ledger_to_keep(rows, *_BILLING_ARGS[2:]))
+
+
+class TestDedupeLedgers(unittest.TestCase):
+	def _run(self, groups, rows_by_group):
+		mock_frappe = MagicMock()
+		mock_frappe.db.sql.return_value = groups
+		mock_frappe.get_all.side_effect = lambda doctype, filters, **kw: rows_by_group[
+			(filters["restaurant"], filters["billing_month"])
+		]
+		with patch.object(patch_module, "frappe", mock_frappe):
+			result = dedupe_ledgers(*_BILLING_ARGS)
+		return result, mock_frappe
+
+	def test_duplicates_deleted_and_logged(self):
+		rows = [_ledger("MBL-NEW"), _ledger("MBL-PAID", payment_status="paid"), _ledger("MBL-OLD")]
+		result, mock_frappe = self._run([("TEST-R1", "2026-09")], {("TEST-R1", "2026-09"): rows})
+
+		self.assertTrue(result)
+		mock_frappe.db.delete.assert_called_once_with(
+			"Monthly Billing Ledger", {"name": ("in", ["MBL-NEW", "MBL-OLD"])}
+		)
+		log_kwargs = mock_frappe.log_error.call_args.kwargs
+		self.assertIn("Kept MBL-PAID", log_kwargs["message"])
+		self.assertIn("MBL-OLD", log_kwargs["message"])
+		mock_frappe.db.commit.assert_called_once()
+
+	def test_conflicting_group_left_alone(self):
+		conflict = [_ledger("MBL-A", payment_status="paid"), _ledger("MBL-B", razorpay_payment_id="pay_9")]
+		clean = [_ledger("MBL-C"), _ledger("MBL-D")]
+		result, mock_frappe = self._run(
+			[("TEST-R1", "2026-09"), ("TEST-R2", "2026-09")],
+			{("TEST-R1", "2026-09"): conflict, ("TEST-R2", "2026-09"): clean},
+		)
+
+		self.assertFalse(result)
+		# Only the clean group is touched
+		mock_frappe.db.delete.assert_called_once_with("Monthly Billing Ledger", {"name": ("in", ["MBL-D"])})
+		skipped = mock_frappe.log_error.call_args.kwargs
+		self.assertEqual(skipped["title"], "Monthly Billing Ledger unique index skipped")
+		self.assertIn("TEST-R1 2026-09: MBL-A, MBL-B", skipped["message"])
+
+	def test_no_duplicates(self):
+		result, mock_frappe = self._run([], {})
+		self.assertTrue(result)
+		mock_frappe.db.delete.assert_not_called()
+
+
+class TestExecute(unittest.TestCase):
+	def test_index_only_added_for_clean_ledgers(self):
+		mock_frappe = MagicMock()
+		mock_frappe.db.table_exists.return_value = True
+		with (
+			patch.object(patch_module, "frappe", mock_frappe),
+			patch.object(patch_module, "dedupe_ledgers", side_effect=[False, True]),
+			patch.object(patch_module, "add_billing_ledger_index") as add_billing,
+			patch.object(patch_module, "add_revenue_ledger_index") as add_revenue,
+		):
+			patch_module.execute()
+
+		add_billing.assert_not_called()
+		add_revenue.assert_called_once()
@@ -0,0 +1,61 @@
+# Copyright (c) 2026, Dinematters and contributors
+# For license information, please see license.txt
+
+"""
+Tests for MenuProduct.validate_product_media().
+
+Covers every throw path, so a broken message (e.g. the translation function
+being shadowed) surfaces as a test failure rather than a crash in the form:
+  * More than 3 media items
+  * More than 1 video
+  * Image row whose file is not an image
+  * Video row whose file is not a video
+  * Valid media (and extension-less URLs) pass
+
+The validator only reads the child rows, so nothing is written to the database.
+
+Run with:
+    bench run-tests --app dinematters --module dinematters.dinematters.tests.test_menu_product_media
+"""
+
+import unittest
+
+import frappe
+
+
+def _product(*media):
+	"""Build an unsaved Menu Product with (media_type, media_url) rows."""
+	doc = frappe.new_doc("Menu Product")
+	for media_type, media_url in media:
+		doc.append("product_media", {"media_type": media_type, "media_url": media_url})
+	return doc
+
+
+class TestValidateProductMedia(unittest.TestCase):
+	def assertThrows(self, doc, expected_message):
+		with self.assertRaises(frappe.ValidationError) as ctx:
+			doc.validate_product_media()
+		self.assertIn(expected_message, str(ctx.exception))
+
+	def test_more_than_three_items_rejected(self):
+		doc = _product(*[("image", f"/files/dish-{i}.jpg") for i in range(4)])
+		self.assertThrows(doc, "Maximum 3 media items allowed per product. Currently 4 items found.")
+
+	def test_more_than_one_video_rejected(self):
+		doc = _product(("video", "/files/a.mp4"), ("video", "/files/b.mp4"))
+		self.assertThrows(doc, "Maximum 1 video allowed per product. Currently 2 videos found.")
+
+	def test_image_row_with_video_file_rejected(self):
+		doc = _product(("image", "/files/dish.jpg"), ("image", "/files/clip.mp4"))
+		self.assertThrows(doc, "Row 2: Image media type requires an image file")
+
+	def test_video_row_with_image_file_rejected(self):
+		doc = _product(("video", "/files/dish.png"))
+		self.assertThrows(doc, "Row 1: Video media type requires a video file")
+
+	def test_valid_media_passes(self):
+		doc = _product(
+			("image", "/files/dish.JPG"), ("video", "/files/clip.webm"), ("image", "/files/no-extension")
+		)
+		# Must not raise
+		doc.validate_product_media()
@@ -0,0 +1,121 @@
+# Copyright (c) 2026, Dinematters and contributors
+# For license information, please see license.txt
+
+"""
+Tests for MonthlyBillingLedger.before_save() fee and GST arithmetic.
+
+Amounts are paise; percentages are applied in integer basis points.
+
+Covers:
+  - GOLD: fixed fee = monthly minimum, GST on top
+  - DIAMOND: max(floor, GMV x platform fee %), GST on top
+  - Rounding boundaries where the previous float arithmetic lost a paisa
+    (0.29 rupee floor, 0.29% fee) and cases where both agree exactly
+  - Custom tax_percent
+
+The Restaurant lookup is mocked, so no records are created.
+
+Run with:
+    bench run-tests --app dinematters --module dinematters.dinematters.tests.test_monthly_billing_ledger
+"""
+
+import math
+import unittest
+from unittest.mock import MagicMock, patch
+
+import frappe
+
+from dinematters.dinematters.doctype.monthly_billing_ledger import monthly_billing_ledger as ledger_module
+
+
+def _float_fee(plan_type, total_gmv, platform_fee_percent, monthly_min, tax_rate=18.0):
+	"""The float arithmetic before_save used before the switch to basis points."""
+	min_amt_paise = int(monthly_min * 100)
+	if plan_type == "GOLD":
+		base_commission = min_amt_paise
+	else:
+		calculated_fee = math.floor(total_gmv * (platform_fee_percent / 100.0))
+		base_commission = max(min_amt_paise, calculated_fee)
+	gst_amount = math.floor(base_commission * (tax_rate / 100.0))
+	return base_commission, gst_amount, base_commission + gst_amount
+
+
+def _run_before_save(plan_type, total_gmv, platform_fee_percent, monthly_min, tax_percent=None):
+	"""Return (calculated_fee, gst_amount, final_amount) computed by before_save."""
+	mock_frappe = MagicMock()
+	mock_frappe.db.get_value.return_value = frappe._dict(
+		platform_fee_percent=platform_fee_percent, monthly_minimum=monthly_min, plan_type=plan_type
+	)
+	doc = frappe.get_doc(
+		{
+			"doctype": "Monthly Billing Ledger",
+			"restaurant": "TEST-MBL",
+			"billing_month": "2026-09",
+			"total_gmv": total_gmv,
+			"tax_percent": tax_percent,
+		}
+	)
+	with patch.object(ledger_module, "frappe", mock_frappe):
+		doc.before_save()
+	# before_save swallows errors into the Error Log; a silent failure must fail the test
+	mock_frappe.log_error.assert_not_called()
+	return doc.calculated_fee, doc.gst_amount, doc.final_amount
+
+
+class TestGoldPlan(unittest.TestCase):
+	def test_fixed_fee_ignores_gmv(self):
+		# ₹999 floor → 99900 paise, GST 18% → 17982
+		self.assertEqual(_run_before_save("GOLD", 50_000_000, 1.5, 999), (99900, 17982, 117882))
+
+	def test_matches_float_result(self):
+		for monthly_min in (999, 1350, 0, 499.5):
+			with self.subTest(monthly_min=monthly_min):
+				self.assertEqual(
+					_run_before_save("GOLD", 0, 1.5, monthly_min),
+					_float_fee("GOLD", 0, 1.5, monthly_min),
+				)
+
+	def test_fractional_floor_rounds_to_nearest_paisa(self):
+		# float: int(0.29 * 100) == 28; basis points keep the exact 29 paise
+		self.assertEqual(_float_fee("GOLD", 0, 1.5, 0.29)[0], 28)
+		self.assertEqual(_run_before_save("GOLD", 0, 1.5, 0.29), (29, 5, 34))
+
+
+class TestDiamondPlan(unittest.TestCase):
+	def test_commission_above_floor(self):
+		# ₹1,00,000 GMV at 1.5% → ₹1,500 commission beats the ₹1,350 floor
+		self.assertEqual(_run_before_save("DIAMOND", 10_000_000, 1.5, 1350), (150000, 27000, 177000))
+
+	def test_floor_above_commission(self):
+		# ₹10,000 GMV at 1.5% → ₹150, below the ₹1,350 floor
+		self.assertEqual(_run_before_save("DIAMOND", 1_000_000, 1.5, 1350), (135000, 24300, 159300))
+
+	def test_matches_float_result(self):
+		cases = [
+			(10_000_000, 1.5, 0),
+			(66_666, 1.5, 0),  # 999.99 paise commission floors to 999
+			(5_000_000, 2.5, 0),
+			(1_000, 0.57, 0),
+			(100, 1.5, 0),  # 1.5 paise floors to 1
+		]
+		for total_gmv, percent, monthly_min in cases:
+			with self.subTest(total_gmv=total_gmv, percent=percent):
+				self.assertEqual(
+					_run_before_save("DIAMOND", total_gmv, percent, monthly_min),
+					_float_fee("DIAMOND", total_gmv, percent, monthly_min),
+				)
+
+	def test_percentage_boundary_not_lost_to_float_error(self):
+		# 10000 x 0.29% is exactly 29 paise; float gives 28.999… and floors to 28
+		self.assertEqual(_float_fee("DIAMOND", 10_000, 0.29, 0)[0], 28)
+		self.assertEqual(_run_before_save("DIAMOND", 10_000, 0.29, 0), (29, 5, 34))
+
+
+class TestGst(unittest.TestCase):
+	def test_gst_floors_fractional_paise(self):
+		# 1350 paise x 18% = 243.0; 1351 x 18% = 243.18 → 243
+		self.assertEqual(_run_before_save("GOLD", 0, 1.5, 13.51), (1351, 243, 1594))
+
+	def test_custom_tax_percent(self):
+		# 99900 x 5% = 4995
+		self.assertEqual(_run_before_save("GOLD", 0, 1.5, 999, tax_percent=5), (99900, 4995, 104895))
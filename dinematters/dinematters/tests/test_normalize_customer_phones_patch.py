@@ -0,0 +1,70 @@
+# Copyright (c) 2026, Dinematters and contributors
+# For license information, please see license.txt
+
+"""
+Tests for the normalize_customer_phones patch, which rewrites legacy
+Customer.phone values in place.
+
+Covers:
+  - +91 / 91 / leading 0 prefixes, spaces and dashes are reduced to 10 digits
+  - Already-normalized numbers are not written again
+  - Numbers that do not normalize to 10 digits are left untouched
+  - Rows are written without touching `modified`
+  - Sites without a Customer.phone column are skipped
+
+The Customer table is mocked, so no records are modified.
+
+Run with:
+    bench run-tests --app dinematters --module dinematters.dinematters.tests.test_normalize_customer_phones_patch
+"""
+
+import unittest
+from unittest.mock import MagicMock, call, patch
+
+import frappe
+
+from dinematters.dinematters.patches import normalize_customer_phones as patch_module
+
+
+def _run(phones, has_column=True):
+	"""Run the patch over {customer name: phone} and return the mocked frappe."""
+	mock_frappe = MagicMock()
+	mock_frappe.db.has_column.return_value = has_column
+	mock_frappe.db.sql.return_value = [frappe._dict(name=name, phone=phone) for name, phone in phones.items()]
+	with patch.object(patch_module, "frappe", mock_frappe):
+		patch_module.execute()
+	return mock_frappe
+
+
+class TestNormalizeCustomerPhones(unittest.TestCase):
+	def test_legacy_formats_rewritten(self):
+		mock_frappe = _run(
+			{
+				"CUST-1": "+91 98765 43210",
+				"CUST-2": "+91-98765-43210",
+				"CUST-3": "919876543210",
+				"CUST-4": "098765 43210",
+				"CUST-5": "98765-43210",
+			}
+		)
+		mock_frappe.db.set_value.assert_has_calls(
+			[
+				call("Customer", name, "phone", "9876543210", update_modified=False)
+				for name in ("CUST-1", "CUST-2", "CUST-3", "CUST-4", "CUST-5")
+			]
+		)
+		self.assertEqual(mock_frappe.db.set_value.call_count, 5)
+		mock_frappe.db.commit.assert_called_once()
+
+	def test_normalized_number_not_rewritten(self):
+		mock_frappe = _run({"CUST-1": "9876543210"})
+		mock_frappe.db.set_value.assert_not_called()
+
+	def test_short_or_non_numeric_values_left_alone(self):
+		mock_frappe = _run({"CUST-1": "12345", "CUST-2": "n/a", "CUST-3": "+91 98765"})
+		mock_frappe.db.set_value.assert_not_called()
+
+	def test_skipped_without_phone_column(self):
+		mock_frappe = _run({}, has_column=False)
+		mock_frappe.db.sql.assert_not_called()
+		mock_frappe.db.commit.assert_not_called()
@@ -0,0 +1,73 @@
+# Copyright (c) 2026, Dinematters and contributors
+# For license information, please see license.txt
+
+"""
+Tests for the slug uniqueness helpers in utils/slug_helpers.py.
+
+Covers:
+  - get_unique_slug()
+      * No collision: the value is returned as is
+      * Collisions take the lowest free -N suffix, filling gaps in the numbering
+      * Collisions are case-insensitive
+      * Values that merely share the prefix (foo-bar) do not block foo
+
+  - get_taken_values()
+      * One query matching the value or value-<suffix>, with LIKE wildcards escaped
+      * Returned values are casefolded and empty values dropped
+
+Run with:
+    bench run-tests --app dinematters --module dinematters.dinematters.tests.test_slug_helpers
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from dinematters.dinematters.utils import slug_helpers
+from dinematters.dinematters.utils.slug_helpers import get_taken_values, get_unique_slug
+
+
+class TestGetUniqueSlug(unittest.TestCase):
+	def test_no_collision(self):
+		self.assertEqual(get_unique_slug("foo", set()), "foo")
+		self.assertEqual(get_unique_slug("foo", {"bar", "foo-1"}), "foo")
+
+	def test_first_suffix(self):
+		self.assertEqual(get_unique_slug("foo", {"foo"}), "foo-1")
+
+	def test_gap_in_numbering_is_filled(self):
+		self.assertEqual(get_unique_slug("foo", {"foo", "foo-2", "foo-3"}), "foo-1")
+		self.assertEqual(get_unique_slug("foo", {"foo", "foo-1", "foo-3"}), "foo-2")
+
+	def test_collision_is_case_insensitive(self):
+		# taken holds casefolded values, as get_taken_values returns them
+		self.assertEqual(get_unique_slug("Foo", {"foo"}), "Foo-1")
+		self.assertEqual(get_unique_slug("Latte", {"latte", "latte-1"}), "Latte-2")
+
+	def test_prefix_match_is_not_a_suffix(self):
+		self.assertEqual(get_unique_slug("foo", {"foo-bar", "foo-bar-1"}), "foo")
+		self.assertEqual(get_unique_slug("foo", {"foo", "foo-bar"}), "foo-1")
+
+
+class TestGetTakenValues(unittest.TestCase):
+	def _run(self, value, stored, filters=None):
+		mock_frappe = MagicMock()
+		mock_frappe.get_all.return_value = stored
+		with patch.object(slug_helpers, "frappe", mock_frappe):
+			taken = get_taken_values("Menu Product", "product_id", value, filters=filters)
+		return taken, mock_frappe
+
+	def test_single_query_for_value_and_suffixes(self):
+		taken, mock_frappe = self._run("foo", ["foo", "Foo-1", None, "foo-bar"], {"restaurant": "TEST-R1"})
+
+		self.assertEqual(taken, {"foo", "foo-1", "foo-bar"})
+		mock_frappe.get_all.assert_called_once_with(
+			"Menu Product",
+			filters={"restaurant": "TEST-R1"},
+			or_filters=[["product_id", "=", "foo"], ["product_id", "like", "foo-%"]],
+			pluck="product_id",
+		)
+
+	def test_like_wildcards_escaped(self):
+		_taken, mock_frappe = self._run("50%_off", [])
+		or_filters = mock_frappe.get_all.call_args.kwargs["or_filters"]
+		self.assertEqual(or_filters[1], ["product_id", "like", "50\\%\\_off-%"])
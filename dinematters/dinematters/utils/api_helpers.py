@@ -27,8 +27,8 @@ RESERVED_RESTAURANT_IDS = {
 }
 
 
-def get_restaurant_from_id(restaurant_id):
-	"""Get restaurant name from restaurant_id"""
+def _lookup_restaurant(restaurant_id):
+	"""Return {name, is_active} of the restaurant matching restaurant_id, or None"""
 	if not restaurant_id:
 		return None
 	
@@ -36,14 +36,33 @@ def get_restaurant_from_id(restaurant_id):
 	if len(str(restaurant_id)) > 50:
 		return None
 	
-	# Try to get by restaurant_id field first
-	restaurant = frappe.db.get_value("Restaurant", {"restaurant_id": restaurant_id}, "name")
-	
-	# If not found, try by name (for backward compatibility)
-	if not restaurant:
-		restaurant = frappe.db.get_value("Restaurant", {"name": restaurant_id}, "name")
-	
-	return restaurant
+	# Request-Level Cache: validate_restaurant_for_api, get_restaurant_context etc.
+	# often resolve the same ID several times within one request
+	if not hasattr(frappe.local, "restaurant_id_cache"):
+		frappe.local.restaurant_id_cache = {}
+	row = frappe.local.restaurant_id_cache.get(restaurant_id)
+	if row:
+		return row
+	
+	# Match by restaurant_id field, or by name (for backward compatibility), in one query;
+	# a restaurant_id match wins over a name match
+	res = frappe.db.sql("""
+		SELECT name, is_active FROM `tabRestaurant`
+		WHERE restaurant_id = %(id)s OR name = %(id)s
+		ORDER BY restaurant_id = %(id)s DESC
+		LIMIT 1
+	""", {"id": restaurant_id}, as_dict=True)
+	row = res[0] if res else None
+	
+	if row:
+		frappe.local.restaurant_id_cache[restaurant_id] = row
+	return row
+
+
+def get_restaurant_from_id(restaurant_id):
+	"""Get restaurant name from restaurant_id"""
+	row = _lookup_restaurant(restaurant_id)
+	return row.name if row else None
 
 
 def validate_restaurant_for_api(restaurant_id, user=None, allow_inactive=False):
@@ -61,14 +80,15 @@ def validate_restaurant_for_api(restaurant_id, user=None, allow_inactive=False):
 		# Silently return a 404 for known scanners/bots
 		frappe.throw(_("Restaurant not found"), exc=frappe.DoesNotExistError)
 	
-	# Get restaurant name
-	restaurant = get_restaurant_from_id(restaurant_id)
+	# Get restaurant name and active flag in one lookup
+	row = _lookup_restaurant(restaurant_id)
 	
-	if not restaurant:
+	if not row:
 		frappe.throw(_("Restaurant not found"), exc=frappe.DoesNotExistError)
+	restaurant = row.name
 	
 	# Check if restaurant is active
-	if not allow_inactive and not frappe.db.get_value("Restaurant", restaurant, "is_active"):
+	if not allow_inactive and not row.is_active:
 		frappe.throw(
 			_("Restaurant {0} is not active").format(restaurant_id),
 			exc=frappe.ValidationError
@@ -177,19 +197,17 @@ def validate_all_products_belong_to_restaurant(product_ids, restaurant_id):
 	if not restaurant:
 		return False
 	
-	# Get all products
-	products = frappe.get_all(
-		"Menu Product",
-		filters={"name": ["in", product_ids]},
-		fields=["name", "restaurant"]
-	)
+	product_ids = set(product_ids or [])
+	if not product_ids:
+		return True
 	
-	# Check all belong to restaurant
-	for product in products:
-		if product.restaurant != restaurant:
-			return False
+	# Count matches in the database; unknown products don't belong either
+	count = frappe.db.sql(
+		"SELECT COUNT(*) FROM `tabMenu Product` WHERE name IN %(ids)s AND restaurant=%(r)s",
+		{"ids": tuple(product_ids), "r": restaurant}
+	)[0][0]
 	
-	return True
+	return count == len(product_ids)
 
 
 def get_restaurant_from_product(product_id):
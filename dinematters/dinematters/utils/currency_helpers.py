@@ -7,6 +7,37 @@ Currency helper utilities for API responses
 
 import frappe
 
+# Redis hash of currency code -> (symbol, symbol_on_right); cleared on Currency update
+CURRENCY_SYMBOL_CACHE_KEY = "currency_symbol_cache"
+RESTAURANT_CURRENCY_CACHE_TTL = 300
+
+
+def _fetch_currency(currency_code):
+	"""Return (symbol, symbol_on_right) for a Currency, or None if it does not exist."""
+	cached = frappe.cache().hget(CURRENCY_SYMBOL_CACHE_KEY, currency_code)
+	if cached is not None:
+		return tuple(cached)
+	
+	res = frappe.db.get_value("Currency", currency_code, ["symbol", "symbol_on_right"], as_dict=True)
+	if not res:
+		return None
+	
+	value = (res.get("symbol") or currency_code, bool(res.get("symbol_on_right", False)))
+	frappe.cache().hset(CURRENCY_SYMBOL_CACHE_KEY, currency_code, value)
+	return value
+
+
+def clear_currency_symbol_cache(doc, method=None):
+	"""Drop the cached symbol when a Currency is updated"""
+	frappe.cache().hdel(CURRENCY_SYMBOL_CACHE_KEY, doc.name)
+
+
+def clear_restaurant_currency_cache(doc, method=None):
+	"""Drop the cached currency info when a Restaurant or Restaurant Config is updated"""
+	restaurant_id = doc.get("restaurant") if doc.doctype == "Restaurant Config" else doc.name
+	if restaurant_id:
+		frappe.cache().delete_value(f"restaurant_currency:{restaurant_id}")
+
 
 def get_currency_symbol(currency_code):
 	"""
@@ -22,10 +53,9 @@ def get_currency_symbol(currency_code):
 		currency_code = "INR"
 	
 	try:
-		res = frappe.db.get_value("Currency", currency_code, ["symbol", "symbol_on_right"], as_dict=True)
+		res = _fetch_currency(currency_code)
 		if res:
-			symbol = res.get("symbol") or currency_code
-			symbol_on_right = bool(res.get("symbol_on_right", False))
+			symbol, symbol_on_right = res
 		else:
 			raise frappe.DoesNotExistError
 	except (frappe.DoesNotExistError, Exception):
@@ -61,6 +91,11 @@ def get_restaurant_currency_info(restaurant_id):
 	Returns:
 		dict: Dictionary with currency code and symbol info
 	"""
+	cache_key = f"restaurant_currency:{restaurant_id}"
+	cached = frappe.cache().get_value(cache_key)
+	if cached:
+		return dict(cached)
+	
 	currency_code = "INR"  # Default
 	
 	try:
@@ -83,10 +118,14 @@ def get_restaurant_currency_info(restaurant_id):
 			if restaurant_currency:
 				currency_code = restaurant_currency
 	except:
-		pass
+		# Don't cache the default when the lookup itself failed
+		currency_info = get_currency_symbol(currency_code)
+		currency_info["currency"] = currency_code
+		return currency_info
 	
 	currency_info = get_currency_symbol(currency_code)
 	currency_info["currency"] = currency_code
+	frappe.cache().set_value(cache_key, currency_info, expires_in_sec=RESTAURANT_CURRENCY_CACHE_TTL)
 	
 	return currency_info
 
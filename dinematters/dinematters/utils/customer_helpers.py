@@ -38,15 +38,18 @@ def get_phone_variants_for_lookup(normalized: str):
 def _find_customer_by_normalized_phone(normalized: str):
 	if not frappe.db.has_column("Customer", "phone"):
 		return None
-	existing = frappe.db.get_value("Customer", {"phone": normalized}, "name")
-	if existing:
-		return existing
-	res = frappe.db.sql("""
-		SELECT name FROM `tabCustomer`
-		WHERE REPLACE(REPLACE(REPLACE(REPLACE(phone, ' ', ''), '+ ', ''), '-', ''), '(', '') LIKE %s
-		LIMIT 1
-	""", (f"%{normalized}",), as_dict=True)
-	return res[0].name if res else None
+	# Customer.phone is normalized on save (and legacy rows by the normalize_customer_phones
+	# patch), so an indexed IN over the known stored variants replaces the old LIKE '%...' scan.
+	# Prefer the row already holding the normalized form.
+	matches = frappe.get_all(
+		"Customer",
+		filters={"phone": ["in", _phone_variants(normalized)]},
+		fields=["name", "phone"]
+	)
+	for m in matches:
+		if m.phone == normalized:
+			return m.name
+	return matches[0].name if matches else None
 
 
 def get_or_create_customer(phone: str, name: str = None, email: str = None):
@@ -89,10 +92,11 @@ def is_phone_verified(phone: str) -> bool:
 		return False
 	if not frappe.db.has_column("Customer", "verified_at"):
 		return False
-	for v in _phone_variants(normalized):
-		if frappe.db.get_value("Customer", {"phone": v}, "verified_at"):
-			return True
-	return False
+	return bool(frappe.db.get_value(
+		"Customer",
+		{"phone": ["in", _phone_variants(normalized)], "verified_at": ["is", "set"]},
+		"name"
+	))
 
 
 def _session_doctype_exists() -> bool:
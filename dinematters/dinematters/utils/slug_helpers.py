@@ -0,0 +1,47 @@
+# Copyright (c) 2025, Dinematters and contributors
+# For license information, please see license.txt
+
+"""
+Helpers for generating slug-style ids that are unique under the database collation
+"""
+
+import frappe
+
+
+def _escape_like(value):
+	"""Escape LIKE wildcards so a slug containing % or _ only matches itself"""
+	return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def get_taken_values(doctype, fieldname, value, filters=None):
+	"""
+	Return the casefolded values of fieldname that equal value or extend it with a
+	"-<suffix>", in one query.
+
+	Values are casefolded because the unique indexes compare case-insensitively:
+	"Latte" is taken if "latte" exists.
+	"""
+	return {
+		taken.casefold()
+		for taken in frappe.get_all(
+			doctype,
+			filters=filters,
+			or_filters=[
+				[fieldname, "=", value],
+				[fieldname, "like", f"{_escape_like(value)}-%"],
+			],
+			pluck=fieldname
+		)
+		if taken
+	}
+
+
+def get_unique_slug(value, taken):
+	"""Return value, or value-N with the lowest free N, given the casefolded taken set"""
+	if value.casefold() not in taken:
+		return value
+
+	counter = 1
+	while f"{value}-{counter}".casefold() in taken:
+		counter += 1
+	return f"{value}-{counter}"
@@ -234,6 +234,15 @@ doc_events = {
 	"File": {
 		"on_update": "dinematters.dinematters.doctype.home_feature.home_feature.update_home_feature_from_file",
 	},
+	"Currency": {
+		"on_update": "dinematters.dinematters.utils.currency_helpers.clear_currency_symbol_cache",
+	},
+	"Restaurant": {
+		"on_update": "dinematters.dinematters.utils.currency_helpers.clear_restaurant_currency_cache",
+	},
+	"Restaurant Config": {
+		"on_update": "dinematters.dinematters.utils.currency_helpers.clear_restaurant_currency_cache",
+	},
 }
 
 # Scheduled Tasks
@@ -11,6 +11,10 @@ import DynamicForm from './DynamicForm'
 import EditableExtractedDishesTable from './EditableExtractedDishesTable'
 import { useConfirm } from '@/hooks/useConfirm'
 
+// Approval job polling: every 2s for up to the job's one hour timeout
+const APPROVAL_POLL_INTERVAL_MS = 2000
+const APPROVAL_MAX_POLLS = 1800
+
 interface MenuExtractionProps {
   restaurantId: string
   onExtractionComplete?: (data: any) => void
@@ -57,6 +61,10 @@ export default function MenuExtraction({ restaurantId, onExtractionComplete, onN
     'dinematters.dinematters.doctype.menu_image_extractor.menu_image_extractor.approve_extracted_data'
   )
 
+  const { call: getExtractionStatus } = useFrappePostCall(
+    'dinematters.dinematters.doctype.menu_image_extractor.menu_image_extractor.get_extraction_status'
+  )
+
   // Auto-select latest extraction if none selected
   useEffect(() => {
     if (!selectedDocName && extractions && extractions.length > 0) {
@@ -175,7 +183,24 @@ export default function MenuExtraction({ restaurantId, onExtractionComplete, onN
     try {
       const result = await approveExtraction({ docname: selectedDocName })
       let message = 'Extracted data approved and categories/products created successfully'
-      if (result) {
+      if (result?.message?.queued) {
+        // Menu items are created in a background job - wait until approval leaves 'Processing',
+        // giving up after the job's one hour timeout
+        let status: any = null
+        for (let attempt = 0; attempt < APPROVAL_MAX_POLLS; attempt++) {
+          await new Promise((resolve) => setTimeout(resolve, APPROVAL_POLL_INTERVAL_MS))
+          const statusRes = await getExtractionStatus({ docname: selectedDocName })
+          status = statusRes?.message || null
+          if (status && status.approval_status !== 'Processing') break
+        }
+
+        if (!status || status.approval_status === 'Processing') {
+          throw new Error('Approval is taking longer than expected. Please check back later.')
+        }
+        if (status.status !== 'Completed') {
+          throw new Error(status.approval_error || 'Failed to approve extraction')
+        }
+      } else if (result) {
         if (typeof result === 'string') {
           message = result
         } else if (result.message) {
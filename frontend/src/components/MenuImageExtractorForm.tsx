@@ -20,6 +20,10 @@ import {
   DialogDescription,
 } from '@/components/ui/dialog'
 
+// Approval job polling: every 2s for up to the job's one hour timeout
+const APPROVAL_POLL_INTERVAL_MS = 2000
+const APPROVAL_MAX_POLLS = 1800
+
 interface MenuImageExtractorFormProps {
   docname?: string
   restaurantId?: string
@@ -37,6 +41,8 @@ interface ExtractionStatus {
   extraction_log: string
   items_created: number
   categories_created: number
+  approval_status?: string
+  approval_error?: string
 }
 
 export default function MenuImageExtractorForm({ 
@@ -216,7 +222,25 @@ export default function MenuImageExtractorForm({
 
     setIsSaving(true)
     try {
-      await approveExtraction({ docname: extractionDocName })
+      const res = await approveExtraction({ docname: extractionDocName })
+      if (res?.message?.queued) {
+        // Menu items are created in a background job - wait until approval leaves 'Processing',
+        // giving up after the job's one hour timeout
+        let status: ExtractionStatus | null = null
+        for (let attempt = 0; attempt < APPROVAL_MAX_POLLS; attempt++) {
+          await new Promise((resolve) => setTimeout(resolve, APPROVAL_POLL_INTERVAL_MS))
+          const statusRes = await getExtractionStatus({ docname: extractionDocName })
+          status = statusRes?.message || null
+          if (status && status.approval_status !== 'Processing') break
+        }
+
+        if (!status || status.approval_status === 'Processing') {
+          throw new Error('Approval is taking longer than expected. Please check back later.')
+        }
+        if (status.status !== 'Completed') {
+          throw new Error(status.approval_error || 'Approval failed')
+        }
+      }
       toast.success('Extraction approved! Menu generated.')
       refreshExtraction()
       onComplete?.(extractionDoc)